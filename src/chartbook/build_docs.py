@@ -5,9 +5,17 @@ from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 
 from chartbook import markdown_generator
+from chartbook.data._index import get_index_path, write_index
+from chartbook.data._resample import build_pyramids
 from chartbook.diagnostics import generate_metadata_diagnostics
 from chartbook.errors import ValidationError, handle_validation_error
-from chartbook.manifest import get_favicon_path, get_logo_path, load_manifest
+from chartbook.manifest import (
+    get_favicon_path,
+    get_logo_path,
+    load_manifest,
+    write_manifest_snapshot,
+)
+from chartbook.model import load_catalog
 from chartbook.utils import shutil
 from chartbook.validation import validate_conf_py_values
 
@@ -79,6 +87,7 @@ def generate_docs(
     temp_docs_src_dir: Path = Path("_docs_src"),
     should_remove_existing: bool = False,
     size_threshold: float = 50,
+    pyramids: bool = False,
 ):
     """Generate documentation by running both pipeline publish and sphinx build.
 
@@ -90,6 +99,8 @@ def generate_docs(
         keep_build_dirs: If True, keeps temporary build directory after generation
         should_remove_existing: If True, removes existing output directory after successful generation
         size_threshold: File size threshold in MB above which to use memory-efficient loading
+        pyramids: If True, writes resampled versions of time-series dataframes for
+            ``chartbook.data.load(..., resample=...)``
     """
 
     output_dir = Path(output_dir).resolve()
@@ -99,6 +110,7 @@ def generate_docs(
 
     # Load configuration
     manifest = load_manifest(project_dir)
+    catalog = load_catalog(project_dir)
     pipeline_theme = manifest["config"]["type"]
 
     # FULLY clean temp_docs_src_dir first
@@ -116,7 +128,17 @@ def generate_docs(
             raise ValueError(f"Invalid pipeline theme: {pipeline_theme}")
 
         # Generate diagnostics CSV first so it's available during markdown build
-        generate_metadata_diagnostics(manifest=manifest, docs_build_dir=_docs_dir)
+        generate_metadata_diagnostics(
+            manifest=manifest, docs_build_dir=_docs_dir, catalog=catalog
+        )
+
+        # Index dataframe locations so chartbook.data can resolve them quickly
+        write_index(manifest, get_index_path(project_dir), catalog=catalog)
+        # Snapshot the resolved manifest so later loads skip the TOML files
+        write_manifest_snapshot(project_dir)
+
+        if pyramids:
+            build_pyramids(manifest, catalog=catalog)
 
         # Run pipeline publish
         run_build_markdown(
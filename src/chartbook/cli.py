@@ -67,6 +67,18 @@ def main():
     default=50,
     help="File size threshold in MB above which to use memory-efficient loading (default: 50)",
 )
+@click.option(
+    "--pyramids",
+    is_flag=True,
+    default=False,
+    help="Write weekly/monthly/quarterly/yearly versions of time-series dataframes",
+)
+@click.option(
+    "--rebuild-manifest",
+    is_flag=True,
+    default=False,
+    help="Ignore the saved manifest snapshot and parse every chartbook.toml again",
+)
 def build(
     output_dir,
     project_dir,
@@ -76,6 +88,8 @@ def build(
     keep_build_dirs,
     force_write,
     size_threshold,
+    pyramids,
+    rebuild_manifest,
 ):
     """Generate HTML documentation in the specified output directory."""
     # Check for Sphinx dependencies
@@ -110,6 +124,11 @@ def build(
     if not config_path.exists():
         raise ValueError(f"Could not find chartbook.toml at {config_path}")
 
+    if rebuild_manifest:
+        from chartbook.manifest import discard_manifest_snapshot
+
+        discard_manifest_snapshot(project_dir)
+
     # Store whether we need to remove existing directory after successful generation
     should_remove_existing = output_dir.exists() and force_write
 
@@ -122,6 +141,7 @@ def build(
         keep_build_dirs=keep_build_dirs,
         should_remove_existing=should_remove_existing,
         size_threshold=size_threshold,
+        pyramids=pyramids,
     )
     click.echo(f"Successfully generated documentation in {output_dir}")
 
@@ -141,7 +161,25 @@ def build(
     default=False,
     help="Enable verbose output",
 )
-def publish(publish_dir: Path | str | None, project_dir: Path | str, verbose: bool):
+@click.option(
+    "--pyramids",
+    is_flag=True,
+    default=False,
+    help="Write weekly/monthly/quarterly/yearly versions of time-series dataframes",
+)
+@click.option(
+    "--rebuild-manifest",
+    is_flag=True,
+    default=False,
+    help="Ignore the saved manifest snapshot and parse every chartbook.toml again",
+)
+def publish(
+    publish_dir: Path | str | None,
+    project_dir: Path | str,
+    verbose: bool,
+    pyramids: bool,
+    rebuild_manifest: bool,
+):
     """Publish the documentation to the specified output directory.
 
     If no publish directory is provided, a default local directory will be used.
@@ -150,10 +188,12 @@ def publish(publish_dir: Path | str | None, project_dir: Path | str, verbose: bo
     _check_sphinx_installed()
 
     # Import here to avoid loading Sphinx deps at module level
-    from chartbook.manifest import load_manifest
+    from chartbook.manifest import discard_manifest_snapshot, load_manifest
     from chartbook.publish import publish_pipeline
 
     project_dir = resolve_project_dir(project_dir)
+    if rebuild_manifest:
+        discard_manifest_snapshot(project_dir)
     manifest = load_manifest(base_dir=project_dir)
     pipeline_id = manifest["pipeline"]["id"]
 
@@ -166,7 +206,12 @@ def publish(publish_dir: Path | str | None, project_dir: Path | str, verbose: bo
     # if publish_dir is a relative path, convert it to an absolute path relative to the project directory
     if not publish_dir.is_absolute():
         publish_dir = project_dir / Path(publish_dir)
-    publish_pipeline(publish_dir=publish_dir, base_dir=project_dir, verbose=verbose)
+    publish_pipeline(
+        publish_dir=publish_dir,
+        base_dir=project_dir,
+        verbose=verbose,
+        pyramids=pyramids,
+    )
 
 
 def resolve_project_dir(project_dir: Path | None):
@@ -237,5 +282,109 @@ def create_data_glimpses(no_samples, no_stats, output_dir, size_threshold):
         sys.exit(1)
 
 
+@main.command("serve-data")
+@click.option("--project-dir", type=click.Path(), help="Path to project directory")
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Interface to listen on; use 0.0.0.0 to accept other machines (default: 127.0.0.1)",
+)
+@click.option(
+    "--port", type=int, default=8765, help="Port to listen on (default: 8765)"
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    default=False,
+    help="Log every request",
+)
+def serve_data(project_dir, host, port, verbose):
+    """Serve every dataframe of the pipeline or catalog over HTTP as Arrow IPC.
+
+    Clients load slices with chartbook.data.load(..., remote="http://HOST:PORT");
+    columns, filters and date windows are applied in the server's parquet scan.
+    The server has no authentication, so only expose it on trusted networks.
+
+    Example usage:
+        chartbook serve-data
+        chartbook serve-data --host 0.0.0.0 --port 9000
+    """
+    from chartbook.data._server import DataServer
+    from chartbook.model import load_catalog
+
+    project_dir = resolve_project_dir(project_dir)
+    catalog = load_catalog(base_dir=project_dir)
+    server = DataServer(
+        catalog.manifest, host=host, port=port, verbose=verbose, catalog=catalog
+    )
+    click.echo(
+        f"Serving {len(server.dataframes)} dataframe(s) at {server.url} "
+        "(press Ctrl+C to stop)"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@main.group()
+def shm():
+    """Manage dataframes shared in memory by chartbook.data.load(..., shared=True)."""
+
+
+@shm.command("list")
+def shm_list():
+    """List shared memory segments, their source files and the processes using them."""
+    from chartbook.data import shm_list as list_segments
+
+    segments = list_segments()
+    if not segments:
+        click.echo("No shared segments.")
+        return
+    for segment in segments:
+        status = "stale" if segment.stale else "current"
+        click.echo(
+            f"{segment.name}  {segment.nbytes / 1024**2:10.1f} MB  "
+            f"refs={segment.refcount}  {status}  "
+            f"{segment.created:%Y-%m-%d %H:%M:%S}  {segment.source}"
+        )
+
+
+@shm.command("evict")
+@click.argument("names", nargs=-1)
+@click.option(
+    "--stale",
+    is_flag=True,
+    default=False,
+    help="Only evict segments whose source file has changed or was removed",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Also evict segments that running processes are attached to",
+)
+def shm_evict(names, stale, force):
+    """Remove shared memory segments.
+
+    Without NAMES, every segment that no running process uses is evicted.
+    Attached processes keep their data until they exit.
+
+    Example usage:
+        chartbook shm evict
+        chartbook shm evict --stale
+        chartbook shm evict cb_0123456789abcdef01234567 --force
+    """
+    from chartbook.data import shm_evict as evict_segments
+
+    evicted = evict_segments(names=list(names) or None, stale=stale, force=force)
+    for name in evicted:
+        click.echo(f"Evicted {name}")
+    click.echo(f"Evicted {len(evicted)} segment(s).")
+
+
 if __name__ == "__main__":
     main()
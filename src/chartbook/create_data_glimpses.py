@@ -16,6 +16,7 @@ from xml.sax import saxutils
 
 import polars as pl
 
+from chartbook.data._sample import sample_path
 from chartbook.settings import config
 
 DATA_DIR = Path(config("DATA_DIR"))
@@ -190,8 +191,18 @@ def get_dataset_report(
             )
         report["columns"] = columns
 
+        # For large parquet files, read random rows from a few row groups
+        # instead of only the first rows
+        if is_large_file and not filepath.endswith(".csv"):
+            random_rows_df = pl.from_arrow(sample_path(filepath, n=100, seed=0))
+        else:
+            random_rows_df = None
+
         # Sample values - only collect first 5 rows
-        sample_df = lf.head(5).collect()
+        if random_rows_df is not None:
+            sample_df = random_rows_df.head(5)
+        else:
+            sample_df = lf.head(5).collect()
         sample = sample_df.to_dicts()
         report["sample_values"] = sample
 
@@ -248,7 +259,9 @@ def get_dataset_report(
         report["numeric_stats"] = numeric_stats
 
         # Glimpse - use memory-efficient loading for large files
-        if is_large_file:
+        if random_rows_df is not None:
+            glimpse_df = random_rows_df
+        elif is_large_file:
             # For large files, only collect a sample and fix the row count
             glimpse_df = lf.head(100).collect()
         else:
@@ -0,0 +1,84 @@
+"""
+ChartBook Data Module - Load dataframes generated by pipelines.
+
+Usage:
+    import chartbook
+
+    df = chartbook.data.load(pipeline_id="fred_charts", dataframe_id="interest_rates")
+    frames = chartbook.data.load_many([("fred_charts", "interest_rates"), ("EX", "repo_public")])
+    for batch in chartbook.data.iter_batches("fred_charts", "interest_rates", batch_size=100_000):
+        ...
+
+    # In asyncio code (e.g. a web server), without blocking the event loop
+    df = await chartbook.data.aload(pipeline_id="fred_charts", dataframe_id="interest_rates")
+    frames = await chartbook.data.aload_many([("fred_charts", "interest_rates"), ("EX", "repo_public")])
+
+    path = chartbook.data.get_path(pipeline_id="fred_charts", dataframe_id="interest_rates")
+
+    # Row count, schema and column statistics from the parquet footer only
+    meta = chartbook.data.info("fred_charts", "interest_rates")
+    # Period-end monthly rows, from a precomputed pyramid when one is up to date
+    df_monthly = chartbook.data.load(
+        pipeline_id="fred_charts", dataframe_id="interest_rates", resample="M"
+    )
+    # Random rows read from a few row groups only
+    df_sample = chartbook.data.sample("fred_charts", "interest_rates", n=1_000, seed=0)
+
+    # SQL across pipelines, planned lazily with column and row-group pruning
+    df = chartbook.data.query(
+        "SELECT * FROM fred_charts.interest_rates r JOIN EX.repo_public p ON r.date = p.date"
+    )
+
+    # Write sorted, zstd-compressed parquet with statistics, atomically
+    chartbook.data.save(df, pipeline_id="fred_charts", dataframe_id="interest_rates")
+
+    # Decode once into shared memory; other processes on the host attach zero-copy
+    df = chartbook.data.load(
+        pipeline_id="fred_charts", dataframe_id="interest_rates", shared=True
+    )
+    chartbook.data.shm_list()
+    chartbook.data.shm_evict(stale=True)
+
+    # Repeated loads of an unchanged file are served from a process-local cache
+    chartbook.data.cache_info()
+    chartbook.data.cache_clear()
+    chartbook.data.configure_cache(max_bytes=4 * 1024**3)  # or enabled=False
+"""
+
+from chartbook.data._async import aload, aload_many
+from chartbook.data._batches import iter_batches
+from chartbook.data._cache import CacheInfo, cache_clear, cache_info, configure_cache
+from chartbook.data._info import ColumnStats, DataframeInfo, RowGroupInfo, info
+from chartbook.data._load import get_path, load, load_many
+from chartbook.data._query import query
+from chartbook.data._sample import sample
+from chartbook.data._save import save
+from chartbook.data._shm import SharedSegment, shm_evict, shm_list
+
+__all__ = [
+    # Loading
+    "get_path",
+    "load",
+    "load_many",
+    "aload",
+    "aload_many",
+    "iter_batches",
+    "sample",
+    "query",
+    # Saving
+    "save",
+    # Metadata
+    "info",
+    "DataframeInfo",
+    "RowGroupInfo",
+    "ColumnStats",
+    # Cache
+    "cache_info",
+    "cache_clear",
+    "configure_cache",
+    "CacheInfo",
+    # Shared memory
+    "shm_list",
+    "shm_evict",
+    "SharedSegment",
+]
@@ -0,0 +1,136 @@
+"""Awaitable versions of ``load`` and ``load_many`` for asyncio applications.
+
+``asyncio`` is imported when a coroutine first runs, so ``import chartbook``
+stays cheap for code that never awaits a load.
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from chartbook.data._load import load
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+async def aload(*args, executor: Optional[Executor] = None, **kwargs):
+    """Load a dataframe without blocking the event loop.
+
+    Takes the same arguments as ``load`` and runs it in ``executor``, so an
+    asyncio application (a web server, or a notebook with a running loop) keeps
+    serving other requests while parquet is read and decoded. Loads awaited
+    together with ``asyncio.gather`` run in parallel.
+
+    :param args: Positional arguments passed to ``load``.
+    :param executor: The executor to run the load in. If None, uses the event loop's default
+        thread pool executor.
+    :type executor: Optional[concurrent.futures.Executor]
+    :param kwargs: Keyword arguments passed to ``load``, such as ``pipeline_id``,
+        ``dataframe_id``, ``format``, ``columns`` or ``filters``.
+    :returns: The loaded dataframe, as returned by ``load``.
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+
+    @app.get("/rates")
+    async def rates():
+        df = await cb.data.aload(pipeline_id="fred_charts", dataframe_id="interest_rates", last="1y")
+        return df.to_dict(orient="records")
+    ```
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(load, *args, **kwargs)
+    )
+
+
+async def aload_many(
+    dataframes: Iterable[tuple[str, str]],
+    max_concurrency: Optional[int] = None,
+    base_dir: Union[str, Path, None] = None,
+    data_dir_name: str = "_data",
+    format: str = "pandas",
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> dict:
+    """Load several dataframes concurrently without blocking the event loop.
+
+    The asyncio counterpart of ``load_many``: each dataframe is loaded with
+    ``aload`` and the loads are awaited together.
+
+    :param dataframes: ``(pipeline_id, dataframe_id)`` pairs to load. Duplicates are loaded once.
+    :type dataframes: Iterable[tuple[str, str]]
+    :param max_concurrency: The maximum number of loads running at once. If None, the number is
+        only limited by the executor.
+    :type max_concurrency: Optional[int]
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the dataframe index or the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :param format: The desired format of the returned DataFrames. See ``load``.
+    :type format: str
+    :param executor: The executor to run the loads in. If None, uses the event loop's default
+        thread pool executor.
+    :type executor: Optional[concurrent.futures.Executor]
+    :param kwargs: Additional keyword arguments passed to ``load`` for every dataframe.
+    :returns: A dict mapping each ``(pipeline_id, dataframe_id)`` pair to its dataframe,
+        in the order the pairs were given.
+    :rtype: dict
+    :raises Exception: The first error raised by any load, after cancelling the loads
+        that have not started yet.
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    frames = await cb.data.aload_many(
+        [("fred_charts", "interest_rates"), ("yield_curve", "fed_yield_curve")],
+        max_concurrency=4,
+    )
+    ```
+    """
+    import asyncio
+
+    keys = list(
+        dict.fromkeys(
+            (pipeline_id, dataframe_id) for pipeline_id, dataframe_id in dataframes
+        )
+    )
+    if not keys:
+        return {}
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got: {max_concurrency}")
+
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def load_one(key: tuple[str, str]):
+        load_kwargs = dict(
+            base_dir=base_dir,
+            pipeline_id=key[0],
+            dataframe_id=key[1],
+            data_dir_name=data_dir_name,
+            format=format,
+            executor=executor,
+            **kwargs,
+        )
+        if semaphore is None:
+            return await aload(**load_kwargs)
+        async with semaphore:
+            return await aload(**load_kwargs)
+
+    tasks = [asyncio.ensure_future(load_one(key)) for key in keys]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return dict(zip(keys, results))
@@ -0,0 +1,27 @@
+"""Atomic file replacement shared by the writers in chartbook.data."""
+
+import os
+import secrets
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_path(path: Path):
+    """Yield a temporary path that replaces ``path`` when the block succeeds.
+
+    The temporary file is created in the same directory so the final rename is
+    atomic, and readers never see a partially written file. Unlike
+    ``tempfile.mkstemp``, the file is created with the permissions a regular
+    new file would get under the current umask. If the block raises, the
+    temporary file is removed and ``path`` is left untouched.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    os.close(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,114 @@
+"""Stream pipeline dataframes in record batches."""
+
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+from chartbook.data._dataset import open_dataset
+from chartbook.data._filters import to_arrow_expression
+from chartbook.data._load import get_path, resolve_request
+
+_BATCH_FORMATS = ("arrow", "pandas", "pandas_arrow", "polars")
+
+# Default number of rows per batch
+DEFAULT_BATCH_SIZE = 65_536
+
+
+def iter_batches(
+    pipeline_id: str,
+    dataframe_id: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[list] = None,
+    date_range: Optional[tuple] = None,
+    date_col: Optional[str] = None,
+    format: str = "arrow",
+    base_dir: Union[str, Path, None] = None,
+    data_dir_name: str = "_data",
+) -> Iterator:
+    """Iterate over a dataframe in batches without loading it all into memory.
+
+    The parquet data is scanned row group by row group, and only a few batches
+    are held in memory at a time, so frames larger than RAM can be processed.
+    Column selection and filters are pushed down into the scan exactly as in ``load``.
+
+    :param pipeline_id: The identifier of the pipeline that generated the dataframe.
+    :type pipeline_id: str
+    :param dataframe_id: The identifier of the specific dataframe within the pipeline.
+    :type dataframe_id: str
+    :param batch_size: The maximum number of rows per batch. Batches may be smaller,
+        for example at the end of a row group or after filtering.
+    :type batch_size: int
+    :param columns: The columns to read. If None, all columns are read.
+    :type columns: Optional[Sequence[str]]
+    :param filters: Row predicates as ``(column, op, value)`` tuples. See ``load``.
+    :type filters: Optional[list]
+    :param date_range: A ``(start, end)`` pair of inclusive bounds on ``date_col``.
+    :type date_range: Optional[tuple]
+    :param date_col: The column that ``date_range`` applies to. If None, the ``date_col``
+        declared for the dataframe in ``chartbook.toml`` is used, as in ``load``, falling
+        back to "date".
+    :type date_col: Optional[str]
+    :param format: The type of each batch: "arrow" (a ``pyarrow.RecordBatch``), "pandas",
+        "pandas_arrow" (pandas with ``pandas.ArrowDtype`` columns) or "polars". Default is "arrow".
+    :type format: str
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :returns: An iterator of non-empty batches in the requested format.
+    :rtype: Iterator
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    total = 0.0
+    for batch in cb.data.iter_batches("fred_charts", "interest_rates", columns=["DGS10"], format="polars"):
+        total += batch["DGS10"].sum()
+    ```
+    """
+    if format not in _BATCH_FORMATS:
+        raise ValueError(f"Invalid format: {format}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got: {batch_size}")
+
+    file_path = get_path(base_dir, pipeline_id, dataframe_id, data_dir_name)
+    _, _, _, dnf = resolve_request(
+        file_path,
+        pipeline_id,
+        dataframe_id,
+        filters=filters,
+        date_range=date_range,
+        date_col=date_col,
+    )
+    dataset = open_dataset(file_path)
+    batches = dataset.to_batches(
+        columns=list(columns) if columns is not None else None,
+        filter=to_arrow_expression(dnf) if dnf else None,
+        batch_size=batch_size,
+        batch_readahead=1,
+        fragment_readahead=1,
+    )
+
+    return _convert_batches(batches, format)
+
+
+def _convert_batches(batches, format: str) -> Iterator:
+    """Yield the non-empty batches of ``batches`` converted to ``format``."""
+    if format == "polars":
+        import polars as pl
+    elif format == "pandas_arrow":
+        import pandas as pd
+
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        if format == "arrow":
+            yield batch
+        elif format == "pandas":
+            yield batch.to_pandas()
+        elif format == "pandas_arrow":
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            yield pl.from_arrow(batch)
@@ -0,0 +1,244 @@
+"""Process-local LRU cache for chartbook.data.load."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Default memory budget for cached dataframes (1 GiB)
+DEFAULT_CACHE_MAX_BYTES = 1024**3
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about the load cache, as returned by ``cache_info()``."""
+
+    hits: int
+    misses: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+@dataclass
+class CacheConfig:
+    """Configuration for the load cache."""
+
+    enabled: bool = True
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+
+
+class LoadCache:
+    """A thread-safe LRU cache of loaded dataframes bounded by a byte budget.
+
+    Entries are evicted least-recently-used first until the total estimated size
+    of cached dataframes fits within ``max_bytes``. Dataframes larger than the
+    whole budget are never cached.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, value: Any, nbytes: int) -> None:
+        """Store ``value`` under ``key``, evicting older entries to stay in budget."""
+        with self._lock:
+            if key in self._entries:
+                self._current_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self._current_bytes += nbytes
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting entries if it shrank."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _evict(self) -> None:
+        while self._entries and self._current_bytes > self.max_bytes:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._current_bytes -= nbytes
+
+
+# Global cache instance
+_config = CacheConfig()
+_cache = LoadCache(_config.max_bytes)
+
+
+def configure_cache(
+    *,
+    enabled: bool | None = None,
+    max_bytes: int | None = None,
+) -> None:
+    """Configure the process-local cache used by ``chartbook.data.load``.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether ``load`` should cache eagerly loaded dataframes. Disabling the
+        cache also clears it.
+    max_bytes : int, optional
+        Memory budget for cached dataframes, in bytes. Least-recently-used
+        dataframes are evicted once the budget is exceeded.
+
+    Examples
+    --------
+    >>> import chartbook
+    >>> chartbook.data.configure_cache(max_bytes=4 * 1024**3)
+    >>> chartbook.data.configure_cache(enabled=False)
+    """
+    if enabled is not None:
+        _config.enabled = enabled
+        if not enabled:
+            _cache.clear()
+    if max_bytes is not None:
+        _config.max_bytes = max_bytes
+        _cache.resize(max_bytes)
+
+
+def cache_info() -> CacheInfo:
+    """Return hit, miss and size statistics for the load cache.
+
+    Examples
+    --------
+    >>> import chartbook
+    >>> chartbook.data.cache_info()
+    CacheInfo(hits=0, misses=0, entries=0, current_bytes=0, max_bytes=1073741824)
+    """
+    return _cache.info()
+
+
+def cache_clear() -> None:
+    """Remove every dataframe from the load cache."""
+    _cache.clear()
+
+
+def file_signature(path: Path) -> tuple[int, int]:
+    """Return ``(mtime_ns, size)`` for ``path``, used to detect rewritten files.
+
+    For a partitioned directory, this is the latest mtime of the directory, its
+    subdirectories and its files, and the total size of its files, so adding,
+    removing or rewriting a partition changes the signature.
+    """
+    stat = os.stat(path)
+    if not os.path.isdir(path):
+        return stat.st_mtime_ns, stat.st_size
+
+    latest_mtime_ns = stat.st_mtime_ns
+    total_size = 0
+    for root, dirs, files in os.walk(path):
+        for name in dirs:
+            latest_mtime_ns = max(
+                latest_mtime_ns, os.stat(os.path.join(root, name)).st_mtime_ns
+            )
+        for name in files:
+            file_stat = os.stat(os.path.join(root, name))
+            latest_mtime_ns = max(latest_mtime_ns, file_stat.st_mtime_ns)
+            total_size += file_stat.st_size
+    return latest_mtime_ns, total_size
+
+
+def make_cache_key(
+    path: Path,
+    format: str,
+    columns: list[str] | None,
+    dnf: list,
+    resample: str | None = None,
+) -> tuple:
+    """Build the cache key for one ``load`` call.
+
+    The key includes the file's mtime and size so that a rewritten file is
+    never served from the cache.
+    """
+    resolved = Path(path).resolve()
+    mtime_ns, size = file_signature(resolved)
+    return (
+        str(resolved),
+        mtime_ns,
+        size,
+        format,
+        tuple(columns) if columns is not None else None,
+        repr(dnf),
+        resample,
+    )
+
+
+def estimate_nbytes(df: Any) -> int:
+    """Estimate the in-memory size of a pandas or polars DataFrame or pyarrow Table."""
+    if hasattr(df, "estimated_size"):
+        return int(df.estimated_size())
+    if hasattr(df, "memory_usage"):
+        return int(df.memory_usage(index=True, deep=True).sum())
+    return int(df.nbytes)
+
+
+def copy_frame(df: Any) -> Any:
+    """Return a copy of ``df`` so callers cannot mutate the cached frame.
+
+    pyarrow Tables are immutable and are returned as-is.
+    """
+    if hasattr(df, "clone"):
+        return df.clone()
+    if hasattr(df, "copy"):
+        return df.copy()
+    return df
+
+
+def get_cached(key: tuple) -> Any | None:
+    """Return a copy of the cached frame for ``key``, or None."""
+    df = _cache.get(key)
+    if df is None:
+        return None
+    return copy_frame(df)
+
+
+def put_cached(key: tuple, df: Any) -> None:
+    """Store a copy of ``df`` in the load cache if it fits in the budget."""
+    nbytes = estimate_nbytes(df)
+    if nbytes <= _cache.max_bytes:
+        _cache.put(key, copy_frame(df), nbytes)
+
+
+def is_cache_enabled() -> bool:
+    """Return whether the load cache is globally enabled."""
+    return _config.enabled
@@ -0,0 +1,100 @@
+"""Open single parquet files and hive-partitioned parquet directories alike.
+
+A dataframe is usually a single ``{dataframe_id}.parquet`` file, but it may
+also be a directory of parquet files laid out with hive-style partitions, for
+example ``{dataframe_id}/year=2024/month=5/part-0.parquet``. Partition keys
+are exposed as columns and filters on them prune whole directories.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+# Files that are not part of the dataset, following pyarrow's defaults
+_IGNORE_PREFIXES = (".", "_")
+
+
+def is_partitioned(path: Path) -> bool:
+    """Return whether ``path`` is a directory of partitioned parquet files."""
+    return Path(path).is_dir()
+
+
+def iter_parquet_files(path: Path):
+    """Yield the parquet files under a partitioned directory in sorted order."""
+    for file_path in sorted(Path(path).rglob("*.parquet")):
+        relative_parts = file_path.relative_to(path).parts
+        if not any(part.startswith(_IGNORE_PREFIXES) for part in relative_parts):
+            yield file_path
+
+
+def data_size(path: Path) -> int:
+    """Return the size in bytes of a parquet file or all files of a partitioned directory."""
+    path = Path(path)
+    if not is_partitioned(path):
+        return path.stat().st_size
+    return sum(file_path.stat().st_size for file_path in iter_parquet_files(path))
+
+
+def _partition_keys(path: Path) -> list[str]:
+    """Return the hive partition keys encoded in the directory names under ``path``."""
+    first_file = next(iter_parquet_files(path), None)
+    if first_file is None:
+        return []
+    return [
+        part.split("=", 1)[0]
+        for part in first_file.relative_to(path).parent.parts
+        if "=" in part
+    ]
+
+
+def open_dataset(path: Path):
+    """Open ``path`` as a ``pyarrow.dataset.Dataset``.
+
+    For partitioned directories, hive partition keys that are not already
+    stored inside the files are added as columns. Some writers (polars, for
+    example) keep the partition columns in every file as well; in that case the
+    files' own columns are used as-is.
+    """
+    import pyarrow.dataset as ds
+
+    path = Path(path)
+    if not is_partitioned(path):
+        return ds.dataset(path, format="parquet")
+
+    dataset = ds.dataset(path, format="parquet")
+    keys = _partition_keys(path)
+    if keys and not all(key in dataset.schema.names for key in keys):
+        dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    return dataset
+
+
+def read_schema(path: Path):
+    """Return the Arrow schema of a parquet file or partitioned directory."""
+    if is_partitioned(path):
+        return open_dataset(path).schema
+
+    import pyarrow.parquet as pq
+
+    return pq.read_schema(path)
+
+
+def read_table(path: Path, columns: list[str] | None = None, filter=None):
+    """Read a parquet file or partitioned directory into a ``pyarrow.Table``."""
+    if not is_partitioned(path) and filter is None:
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns)
+    return open_dataset(path).to_table(columns=columns, filter=filter)
+
+
+def scan_polars(path: Path):
+    """Scan a parquet file or partitioned directory as a ``polars.LazyFrame``."""
+    import polars as pl
+
+    path = Path(path)
+    if not is_partitioned(path):
+        return pl.scan_parquet(path)
+    files = list(iter_parquet_files(path))
+    if not files:
+        raise FileNotFoundError(f"No parquet files found in directory: {path}")
+    return pl.scan_parquet(files, hive_partitioning=True)
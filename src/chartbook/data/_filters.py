@@ -0,0 +1,181 @@
+"""Row filters shared by the pyarrow and polars readers."""
+
+from datetime import date, datetime
+
+_FILTER_OPS = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def normalize_filters(filters, date_range=None, date_col="date") -> list:
+    """Normalize row filters to disjunctive normal form.
+
+    Filters follow the convention used by ``pandas.read_parquet`` and
+    ``pyarrow.parquet.read_table``: a list of ``(column, op, value)`` tuples is
+    combined with AND, and a list of such lists is combined with OR.
+    ``date_range`` is AND-ed onto every conjunction.
+
+    :param filters: Row predicates as a list of tuples or a list of lists of tuples.
+    :param date_range: A ``(start, end)`` pair of inclusive bounds. Either may be None.
+    :param date_col: The column that ``date_range`` applies to.
+    :returns: A list of conjunctions, each a list of ``(column, op, value)`` tuples.
+    :rtype: list
+
+    >>> normalize_filters([("a", ">", 1)], date_range=("2024-01-01", None))
+    [[('a', '>', 1), ('date', '>=', '2024-01-01')]]
+    """
+    if filters is None or len(filters) == 0:
+        dnf = [[]]
+    elif all(isinstance(term, tuple) for term in filters):
+        dnf = [list(filters)]
+    else:
+        dnf = [list(conjunction) for conjunction in filters]
+
+    for conjunction in dnf:
+        for term in conjunction:
+            if not (isinstance(term, tuple) and len(term) == 3):
+                raise ValueError(
+                    f"Invalid filter: {term!r}. Filters must be (column, op, value) tuples."
+                )
+            if term[1] not in _FILTER_OPS:
+                raise ValueError(
+                    f"Invalid filter operator: {term[1]!r}. Must be one of {_FILTER_OPS}."
+                )
+
+    if date_range is not None:
+        start, end = date_range
+        bounds = []
+        if start is not None:
+            bounds.append((date_col, ">=", start))
+        if end is not None:
+            bounds.append((date_col, "<=", end))
+        dnf = [conjunction + bounds for conjunction in dnf]
+
+    if dnf == [[]]:
+        return []
+    return dnf
+
+
+def and_filters(filters, terms: list) -> list:
+    """AND ``terms`` onto every conjunction of ``filters``, returning normal form."""
+    return [
+        conjunction + list(terms) for conjunction in normalize_filters(filters) or [[]]
+    ]
+
+
+def prepare_filters(path, filters, date_range=None, date_col="date") -> list:
+    """Normalize filters and cast their values using the schema of ``path``.
+
+    The parquet schema is only read when there are filters to coerce.
+
+    :param path: Path to the parquet file or partitioned directory the filters will be applied to.
+    :returns: Filters in disjunctive normal form, or an empty list for no filters.
+    :rtype: list
+    """
+    dnf = normalize_filters(filters, date_range=date_range, date_col=date_col)
+    if dnf:
+        from chartbook.data._dataset import read_schema
+
+        dnf = coerce_filters(dnf, read_schema(path))
+    return dnf
+
+
+def _coerce_value(value, arrow_type):
+    """Cast a filter value to the type of the column it is compared against.
+
+    This lets callers write ``("date", ">=", "2024-01-01")`` against a date
+    column, which neither pyarrow nor polars accept without a cast.
+    """
+    import pyarrow as pa
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_coerce_value(item, arrow_type) for item in value]
+    if isinstance(value, str) and pa.types.is_timestamp(arrow_type):
+        value = datetime.fromisoformat(value)
+    elif isinstance(value, str) and pa.types.is_date(arrow_type):
+        value = date.fromisoformat(value)
+    elif isinstance(value, datetime) and pa.types.is_date(arrow_type):
+        value = value.date()
+    try:
+        return pa.scalar(value).cast(arrow_type).as_py()
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return value
+
+
+def coerce_filters(dnf: list, schema) -> list:
+    """Coerce every filter value in ``dnf`` to its column's type in ``schema``."""
+    coerced = []
+    for conjunction in dnf:
+        terms = []
+        for column, op, value in conjunction:
+            if column not in schema.names:
+                raise KeyError(f"Filter column not found in dataframe: {column!r}")
+            arrow_type = schema.field(column).type
+            terms.append((column, op, _coerce_value(value, arrow_type)))
+        coerced.append(terms)
+    return coerced
+
+
+def to_arrow_expression(dnf: list):
+    """Build a ``pyarrow.compute.Expression`` from filters in normal form."""
+    import pyarrow.compute as pc
+
+    def term_to_expression(column, op, value):
+        field = pc.field(column)
+        if op in ("==", "="):
+            return field == value
+        if op == "!=":
+            return field != value
+        if op == "<":
+            return field < value
+        if op == "<=":
+            return field <= value
+        if op == ">":
+            return field > value
+        if op == ">=":
+            return field >= value
+        if op == "in":
+            return field.isin(value)
+        return ~field.isin(value)
+
+    expression = None
+    for conjunction in dnf:
+        conjunction_expression = None
+        for term in conjunction:
+            term_expression = term_to_expression(*term)
+            if conjunction_expression is None:
+                conjunction_expression = term_expression
+            else:
+                conjunction_expression = conjunction_expression & term_expression
+        if expression is None:
+            expression = conjunction_expression
+        else:
+            expression = expression | conjunction_expression
+    return expression
+
+
+def to_polars_expression(dnf: list):
+    """Build a ``polars.Expr`` from filters in normal form."""
+    import polars as pl
+
+    def term_to_expression(column, op, value):
+        col = pl.col(column)
+        if op in ("==", "="):
+            return col == pl.lit(value)
+        if op == "!=":
+            return col != pl.lit(value)
+        if op == "<":
+            return col < pl.lit(value)
+        if op == "<=":
+            return col <= pl.lit(value)
+        if op == ">":
+            return col > pl.lit(value)
+        if op == ">=":
+            return col >= pl.lit(value)
+        if op == "in":
+            return col.is_in(list(value))
+        return ~col.is_in(list(value))
+
+    disjunction = [
+        pl.all_horizontal([term_to_expression(*term) for term in conjunction])
+        for conjunction in dnf
+    ]
+    return pl.any_horizontal(disjunction)
@@ -0,0 +1,199 @@
+"""Persistent index from ``(pipeline_id, dataframe_id)`` to dataframe locations.
+
+Resolving where a dataframe lives in a catalog otherwise means loading the
+``chartbook.toml`` of every pipeline. ``chartbook build`` and ``chartbook
+publish`` write a small JSON index instead, mapping each dataframe to the
+absolute path of its parquet data together with a hash of its schema, its
+modification time and its declared ``date_col`` and ``resample_keys``.
+``get_path`` reads the index, so a lookup costs a single small file read no
+matter how many pipelines the catalog has.
+
+The index is written to ``{project_dir}/_output/chartbook_index.json`` and read
+from ``{OUTPUT_DIR}/chartbook_index.json``. Set the ``CHARTBOOK_INDEX`` setting
+(environment variable, ``.env`` entry or ``--CHARTBOOK_INDEX`` argument) to use
+a different location for both.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from chartbook.data._atomic import atomic_path
+from chartbook.data._cache import file_signature
+from chartbook.data._dataset import read_schema
+from chartbook.settings import config
+
+if TYPE_CHECKING:
+    from chartbook.model import Catalog
+
+INDEX_FILENAME = "chartbook_index.json"
+INDEX_VERSION = 1
+
+# Parsed indexes keyed by path, with the (mtime_ns, size) they were read at
+_memo: dict[str, tuple[tuple[int, int], dict]] = {}
+_memo_lock = threading.Lock()
+
+
+def get_index_path(project_dir: Path | None = None) -> Path:
+    """Return the location of the dataframe index.
+
+    :param project_dir: The project the index belongs to. If None, the index is
+        looked up under the configured OUTPUT_DIR.
+    :type project_dir: Optional[Path]
+    :returns: The path of the index file.
+    :rtype: Path
+    """
+    index_path = config("CHARTBOOK_INDEX", default=None)
+    if index_path is not None:
+        return Path(index_path)
+    if project_dir is not None:
+        return Path(project_dir) / "_output" / INDEX_FILENAME
+    return Path(config("OUTPUT_DIR")) / INDEX_FILENAME
+
+
+def index_key(pipeline_id: str, dataframe_id: str) -> str:
+    """Return the key of a dataframe in the index."""
+    return f"{pipeline_id}:{dataframe_id}"
+
+
+def schema_hash(path: Path) -> str:
+    """Return a short hash of the Arrow schema of a parquet file or directory.
+
+    Schema metadata (such as the pandas metadata written by ``to_parquet``) is
+    ignored so that only column names and types affect the hash.
+    """
+    schema = read_schema(path).remove_metadata()
+    return hashlib.sha256(schema.to_string().encode()).hexdigest()[:16]
+
+
+def build_index(
+    manifest: dict, previous: dict | None = None, catalog: Catalog | None = None
+) -> dict:
+    """Build the dataframe index for a pipeline or catalog manifest.
+
+    Dataframes whose parquet data does not exist yet are indexed with their path
+    only. Schema hashes of files that have not changed since ``previous`` was
+    built are reused instead of reading the parquet footer again.
+
+    :param manifest: A manifest as returned by ``load_manifest``.
+    :type manifest: dict
+    :param previous: The dataframe entries of a previously written index.
+    :type previous: Optional[dict]
+    :param catalog: The object model of ``manifest``, such as from ``load_catalog``.
+        Built from ``manifest`` if not given.
+    :type catalog: Optional[Catalog]
+    :returns: A mapping from ``"pipeline_id:dataframe_id"`` to index entries.
+    :rtype: dict
+    """
+    if catalog is None:
+        from chartbook.model import Catalog
+
+        catalog = Catalog.from_manifest(manifest)
+
+    previous = previous or {}
+    entries = {}
+    for dataframe in catalog.iter_dataframes():
+        key = index_key(dataframe.pipeline_id, dataframe.id)
+        path = dataframe.path.resolve()
+        entry = {
+            "path": path.as_posix(),
+            "date_col": dataframe.date_col,
+            "resample_keys": dataframe.manifest.get("resample_keys"),
+            "schema_hash": None,
+            "mtime_ns": None,
+            "size": None,
+        }
+        if path.exists():
+            mtime_ns, size = file_signature(path)
+            entry["mtime_ns"] = mtime_ns
+            entry["size"] = size
+            old = previous.get(key, {})
+            if (
+                old.get("path") == entry["path"]
+                and old.get("mtime_ns") == mtime_ns
+                and old.get("size") == size
+            ):
+                entry["schema_hash"] = old.get("schema_hash")
+            else:
+                entry["schema_hash"] = schema_hash(path)
+        entries[key] = entry
+    return entries
+
+
+def write_index(
+    manifest: dict, index_path: Path, catalog: Catalog | None = None
+) -> Path:
+    """Build the dataframe index for ``manifest`` and write it to ``index_path``.
+
+    The file is replaced with ``atomic_path``.
+
+    :param manifest: A manifest as returned by ``load_manifest``.
+    :type manifest: dict
+    :param index_path: Where to write the index.
+    :type index_path: Path
+    :param catalog: The object model of ``manifest``, as in ``build_index``.
+    :type catalog: Optional[Catalog]
+    :returns: The path of the written index.
+    :rtype: Path
+    """
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index = {
+        "version": INDEX_VERSION,
+        "dataframes": build_index(
+            manifest, previous=read_index(index_path), catalog=catalog
+        ),
+    }
+
+    with atomic_path(index_path) as temp_path:
+        with open(temp_path, "w") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+    return index_path
+
+
+def read_index(index_path: Path) -> dict:
+    """Return the dataframe entries of the index at ``index_path``.
+
+    The parsed index is kept in memory until the file changes. A missing,
+    unreadable or outdated index is treated as empty.
+    """
+    key = str(index_path)
+    try:
+        signature = file_signature(index_path)
+    except OSError:
+        return {}
+
+    with _memo_lock:
+        memo = _memo.get(key)
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    entries = {}
+    if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+        entries = index.get("dataframes", {})
+
+    with _memo_lock:
+        _memo[key] = (signature, entries)
+    return entries
+
+
+def lookup_entry(pipeline_id: str, dataframe_id: str) -> dict | None:
+    """Return the index entry of a dataframe, or None if it is not indexed."""
+    return read_index(get_index_path()).get(index_key(pipeline_id, dataframe_id))
+
+
+def lookup(pipeline_id: str, dataframe_id: str) -> Path | None:
+    """Return the indexed path of a dataframe, or None if it is not indexed."""
+    entry = lookup_entry(pipeline_id, dataframe_id)
+    if entry is None:
+        return None
+    return Path(entry["path"])
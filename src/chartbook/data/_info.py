@@ -0,0 +1,187 @@
+"""Inspect pipeline dataframes from parquet footers without reading any data."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from chartbook.data._dataset import is_partitioned, iter_parquet_files, read_schema
+from chartbook.data._load import get_path
+
+
+@dataclass
+class ColumnStats:
+    """Statistics of one column, read from parquet column chunk metadata.
+
+    ``min`` and ``max`` ignore nulls. Any field is None if the writer did not
+    record it for every row group, since it then cannot be known without
+    reading the data.
+    """
+
+    min: Any = None
+    max: Any = None
+    null_count: Optional[int] = None
+
+
+@dataclass
+class RowGroupInfo:
+    """Layout and column statistics of one row group."""
+
+    file: Path
+    num_rows: int
+    total_byte_size: int
+    columns: Dict[str, ColumnStats] = field(default_factory=dict)
+
+
+@dataclass
+class DataframeInfo:
+    """Metadata of a dataframe, as returned by ``chartbook.data.info``.
+
+    For a hive-partitioned dataframe, row groups of all files are listed in
+    file order. Partition keys appear in ``schema`` but have no statistics.
+    """
+
+    path: Path
+    num_rows: int
+    file_size: int
+    schema: Any
+    row_groups: List[RowGroupInfo]
+    columns: Dict[str, ColumnStats]
+
+    @property
+    def num_row_groups(self) -> int:
+        """The number of row groups across all files."""
+        return len(self.row_groups)
+
+
+def _column_chunk_stats(column_chunk) -> ColumnStats:
+    statistics = column_chunk.statistics
+    if statistics is None:
+        return ColumnStats()
+    stats = ColumnStats()
+    if statistics.has_min_max:
+        stats.min = statistics.min
+        stats.max = statistics.max
+    if statistics.has_null_count:
+        stats.null_count = statistics.null_count
+    return stats
+
+
+def _combine_stats(row_groups: List[RowGroupInfo], name: str) -> ColumnStats:
+    """Combine the row group statistics of column ``name`` into column statistics."""
+    combined = ColumnStats()
+    row_group_stats = [row_group.columns[name] for row_group in row_groups]
+    if not row_group_stats:
+        return combined
+
+    null_counts = [stats.null_count for stats in row_group_stats]
+    if None not in null_counts:
+        combined.null_count = sum(null_counts)
+
+    # Row groups that are entirely null have no min/max but do not affect them
+    with_values = []
+    for row_group, stats in zip(row_groups, row_group_stats):
+        if stats.min is not None:
+            with_values.append(stats)
+        elif stats.null_count != row_group.num_rows:
+            return combined
+    if with_values:
+        combined.min = min(stats.min for stats in with_values)
+        combined.max = max(stats.max for stats in with_values)
+    return combined
+
+
+def read_info(path: Union[str, Path]) -> DataframeInfo:
+    """Read the metadata of a parquet file or partitioned directory.
+
+    Only parquet footers are read, so this is cheap regardless of the size of
+    the data.
+
+    :param path: Path to a parquet file or a partitioned parquet directory.
+    :type path: Union[str, Path]
+    :returns: The dataframe's metadata.
+    :rtype: DataframeInfo
+    """
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    files = list(iter_parquet_files(path)) if is_partitioned(path) else [path]
+
+    row_groups = []
+    num_rows = 0
+    file_size = 0
+    for file_path in files:
+        metadata = pq.ParquetFile(file_path).metadata
+        num_rows += metadata.num_rows
+        file_size += file_path.stat().st_size
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            columns = {}
+            for j in range(row_group.num_columns):
+                column_chunk = row_group.column(j)
+                columns[column_chunk.path_in_schema] = _column_chunk_stats(column_chunk)
+            row_groups.append(
+                RowGroupInfo(
+                    file=file_path,
+                    num_rows=row_group.num_rows,
+                    total_byte_size=row_group.total_byte_size,
+                    columns=columns,
+                )
+            )
+
+    schema = read_schema(path)
+    columns = {}
+    for name in schema.names:
+        if row_groups and all(name in row_group.columns for row_group in row_groups):
+            columns[name] = _combine_stats(row_groups, name)
+        else:
+            columns[name] = ColumnStats()
+
+    return DataframeInfo(
+        path=path,
+        num_rows=num_rows,
+        file_size=file_size,
+        schema=schema,
+        row_groups=row_groups,
+        columns=columns,
+    )
+
+
+def info(
+    pipeline_id: str,
+    dataframe_id: str,
+    base_dir: Union[str, Path, None] = None,
+    data_dir_name: str = "_data",
+) -> DataframeInfo:
+    """Describe a dataframe using only its parquet metadata.
+
+    The row count, schema, file size, row-group layout and per-column min, max
+    and null counts are all read from the parquet footer, so no data is loaded
+    and the cost does not grow with the size of the dataframe.
+
+    :param pipeline_id: The identifier of the pipeline that generated the dataframe.
+    :type pipeline_id: str
+    :param dataframe_id: The identifier of the specific dataframe within the pipeline.
+    :type dataframe_id: str
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the dataframe index or the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :returns: The dataframe's metadata.
+    :rtype: DataframeInfo
+
+    **Examples**
+
+    ```python
+    import chartbook
+
+    meta = chartbook.data.info("fred_charts", "interest_rates")
+    meta.num_rows
+    meta.columns["date"].min, meta.columns["date"].max
+    [row_group.num_rows for row_group in meta.row_groups]
+    ```
+    """
+    file_path = get_path(base_dir, pipeline_id, dataframe_id, data_dir_name)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Parquet file not found: {file_path}")
+    return read_info(file_path)
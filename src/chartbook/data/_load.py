@@ -0,0 +1,588 @@
+"""Load pipeline dataframes from parquet."""
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+from chartbook.data._cache import (
+    get_cached,
+    is_cache_enabled,
+    make_cache_key,
+    put_cached,
+)
+from chartbook.data._dataset import (
+    is_partitioned,
+    open_dataset,
+    read_table,
+    scan_polars,
+)
+from chartbook.data._filters import (
+    and_filters,
+    prepare_filters,
+    to_arrow_expression,
+    to_polars_expression,
+)
+from chartbook.data._index import lookup
+from chartbook.data._remote import fetch_table
+from chartbook.data._resample import (
+    get_pyramid_path,
+    is_pyramid_fresh,
+    normalize_level,
+    resample_table,
+    resolve_resample_keys,
+)
+from chartbook.data._shm import shared_table
+from chartbook.data._sidecar import ensure_sidecar
+from chartbook.data._window import date_window_filters, resolve_date_col
+from chartbook.settings import config
+
+_FORMATS = ("pandas", "pandas_arrow", "polars", "arrow", "polars_lazy", "arrow_dataset")
+
+# Formats that are read eagerly and can be served from the load cache
+_EAGER_FORMATS = ("pandas", "pandas_arrow", "polars", "arrow")
+
+
+def get_path(
+    base_dir: Union[str, Path, None] = None,
+    pipeline_id: str = "EX",
+    dataframe_id: str = "repo_public",
+    data_dir_name: str = "_data",
+) -> Path:
+    """Get the path to a dataframe file.
+
+    A dataframe is normally stored as ``{dataframe_id}.parquet``. If that file
+    does not exist but a directory named ``{dataframe_id}`` does, the dataframe
+    is a hive-partitioned dataset (for example
+    ``{dataframe_id}/year=2024/month=05/part-0.parquet``) and the directory is
+    returned instead. A directory named ``{dataframe_id}.parquet`` is also
+    treated as a partitioned dataset.
+
+    If ``base_dir`` is None and the dataframe is listed in the dataframe index
+    written by ``chartbook build`` or ``chartbook publish``, the indexed path is
+    returned, so dataframes anywhere in a catalog resolve with a single small
+    file read. The index is only used with the default ``data_dir_name`` and
+    only if the indexed path still exists; otherwise the path is resolved
+    under DATA_DIR.
+
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, the dataframe index is consulted first and then the DATA_DIR
+        from settings is used.
+    :type base_dir: Union[str, Path, None]
+    :param pipeline_id: The identifier of the pipeline.
+    :type pipeline_id: str
+    :param dataframe_id: The identifier of the dataframe.
+    :type dataframe_id: str
+    :param data_dir_name: The name of the data directory within the pipeline.
+    :type data_dir_name: str
+    :returns: The path to the parquet file or partitioned directory.
+    :rtype: Path
+    """
+    if base_dir is None:
+        indexed_path = (
+            lookup(pipeline_id, dataframe_id) if data_dir_name == "_data" else None
+        )
+        if indexed_path is not None and indexed_path.exists():
+            return indexed_path
+        base_dir = config("DATA_DIR")
+    base_dir = Path(base_dir)
+
+    filename = f"{dataframe_id}.parquet"
+    file_path = base_dir / pipeline_id / data_dir_name / filename
+    if not file_path.exists():
+        partitioned_dir = base_dir / pipeline_id / data_dir_name / dataframe_id
+        if partitioned_dir.is_dir():
+            return partitioned_dir
+    return file_path
+
+
+def load(
+    base_dir: Union[str, Path, None] = None,
+    pipeline_id: str = "EX",
+    dataframe_id: str = "repo_public",
+    data_dir_name: str = "_data",
+    format: str = "pandas",
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[list] = None,
+    date_range: Optional[tuple] = None,
+    date_col: Optional[str] = None,
+    since=None,
+    until=None,
+    last: Union[str, int, timedelta, None] = None,
+    cache: bool = True,
+    sidecar: bool = False,
+    shared: bool = False,
+    resample: Optional[str] = None,
+    remote: Optional[str] = None,
+):
+    """Load a specific dataframe generated by a pipeline.
+
+    This function reads a Parquet file corresponding to the given pipeline and dataframe IDs
+    from the specified base directory (or the default DATA_DIR configured in settings).
+    It can return the data as either a pandas or a polars DataFrame, as a
+    ``pyarrow.Table``, or as a lazy ``polars.LazyFrame`` or ``pyarrow.dataset.Dataset``
+    that defers reading until the caller collects it.
+
+    Column selection and row filters are pushed down into the parquet scan, so
+    columns that are not requested are never decoded and row groups whose
+    statistics rule out every row are skipped entirely. For hive-partitioned
+    dataframes (see ``get_path``), partition keys are loaded as columns and
+    filters on them skip whole partitions.
+
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param pipeline_id: The identifier of the pipeline that generated the dataframe.
+    :type pipeline_id: str
+    :param dataframe_id: The identifier of the specific dataframe within the pipeline.
+    :type dataframe_id: str
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :param format: The desired format of the returned DataFrame. Options are "pandas", "polars",
+        "arrow" (a ``pyarrow.Table``), "pandas_arrow" (a pandas DataFrame whose columns are
+        backed by Arrow memory through ``pandas.ArrowDtype``), "polars_lazy" (a ``polars.LazyFrame``)
+        or "arrow_dataset" (a ``pyarrow.dataset.Dataset``). "arrow" and "pandas_arrow" skip the
+        conversion of string and other columns to NumPy or Python objects, which makes them much
+        faster and lighter than "pandas" for string-heavy frames.
+        The lazy formats apply ``columns`` and ``filters`` to the query plan and read nothing until
+        collected. "arrow_dataset" does not support ``columns``; pass them to ``Dataset.to_table()``
+        instead. Default is "pandas".
+    :type format: str
+    :param columns: The columns to read. If None, all columns are read.
+    :type columns: Optional[Sequence[str]]
+    :param filters: Row predicates as ``(column, op, value)`` tuples, where op is one of
+        ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` or ``not in``. A list of tuples
+        is combined with AND; a list of lists of tuples is combined with OR.
+        Values are cast to the column type, so ISO date strings can be compared to date columns.
+    :type filters: Optional[list]
+    :param date_range: A ``(start, end)`` pair of inclusive bounds on ``date_col``.
+        Either bound may be None to leave that side open.
+    :type date_range: Optional[tuple]
+    :param date_col: The column that ``date_range``, ``since``, ``until`` and ``last`` apply to.
+        If None, the ``date_col`` declared for the dataframe in ``chartbook.toml`` is used (found
+        through the dataframe index or the current project's manifest), falling back to "date".
+    :type date_col: Optional[str]
+    :param since: Inclusive lower bound on ``date_col``, as a date, datetime or ISO string.
+    :param until: Inclusive upper bound on ``date_col``, as a date, datetime or ISO string.
+    :param last: Only load the trailing window of this length: a ``timedelta``, a number of days,
+        or a string such as "36h", "90d", "12w", "6mo" or "5y". The window ends at ``until`` or,
+        by default, at the latest date in the dataframe, read from the parquet statistics, and
+        excludes its start. If the dataframe has no dates, no rows are loaded. Cannot be combined
+        with ``since``.
+    :type last: Union[str, int, timedelta, None]
+    :param cache: Whether to serve and store eagerly loaded dataframes in the process-local
+        cache. Entries are keyed by the file's resolved path, mtime and size and the requested
+        format, columns and filters, so a rewritten file is always re-read. See
+        ``configure_cache``, ``cache_info`` and ``cache_clear``. Default is True.
+    :type cache: bool
+    :param sidecar: Whether to read through an uncompressed Arrow IPC sidecar written next to the
+        parquet file (``rates.parquet`` -> ``rates.arrow``). The sidecar is built on first use and
+        rebuilt whenever the parquet file's mtime or size changes. Later loads memory-map it instead
+        of decompressing parquet, and processes on the same host share it through the OS page cache.
+        Useful for large frames that are loaded over and over. Default is False.
+    :type sidecar: bool
+    :param shared: Whether to decode the dataframe once into a shared memory segment that every
+        process on the host attaches to without copying. The segment holds all columns and is
+        keyed by the file's resolved path, mtime and size; ``columns`` and ``filters`` are applied
+        to the shared table. Segments outlive the process that created them; see ``shm_list``
+        and ``shm_evict`` or ``chartbook shm``. Cannot be combined with ``sidecar``.
+        Default is False.
+    :type shared: bool
+    :param resample: Load a coarser, period-end version of a time-series dataframe: "W" (weekly),
+        "M" (monthly), "Q" (quarterly) or "Y" (yearly). Each row holds the last date of a period
+        and the last non-null value of every other column in it; text and categorical columns
+        are kept as keys, so panels get one row per series per period. The precomputed file
+        written by ``chartbook build --pyramids`` (``rates.parquet`` -> ``rates.M.parquet``) is
+        read when it is up to date; otherwise the dataframe is resampled in memory.
+        ``columns``, ``filters`` and date windows apply to the resampled rows.
+    :type resample: Optional[str]
+    :param remote: The URL of a ``chartbook serve-data`` server, such as "http://buildhost:8765",
+        to load the dataframe from instead of the local filesystem. ``columns``, ``filters``,
+        date windows and ``resample`` are sent to the server and applied in its parquet scan, so
+        only the requested slice crosses the network. ``base_dir`` and ``data_dir_name`` are
+        ignored, and remote loads are not cached.
+    :type remote: Optional[str]
+
+    :returns: The loaded dataframe in the specified format.
+    :rtype: pandas.DataFrame, polars.DataFrame, pyarrow.Table, polars.LazyFrame or
+        pyarrow.dataset.Dataset
+
+    **Examples**
+
+    Load the 'repo_public' dataframe from the 'EX' pipeline as a pandas DataFrame:
+
+    ```python
+    import chartbook as cb
+    df_pandas = cb.data.load(pipeline_id="fred_charts", dataframe_id="interest_rates")
+    print(df_pandas.head())
+    ```
+
+    Load the same dataframe as a polars DataFrame:
+
+    ```python
+    import chartbook as cb
+    df_polars = cb.data.load(pipeline_id="fred_charts", dataframe_id="interest_rates", format="polars")
+    print(df_polars.head())
+    ```
+
+    Load a pandas DataFrame backed by Arrow memory, without converting strings to Python objects:
+
+    ```python
+    import chartbook as cb
+    df = cb.data.load(pipeline_id="fred_charts", dataframe_id="interest_rates", format="pandas_arrow")
+    ```
+
+    Build a lazy polars query that only runs when collected:
+
+    ```python
+    import chartbook as cb
+    import polars as pl
+    lf = cb.data.load(pipeline_id="fred_charts", dataframe_id="interest_rates", format="polars_lazy")
+    monthly = lf.group_by_dynamic("date", every="1mo").agg(pl.col("DGS10").mean()).collect()
+    ```
+
+    Load three columns for the last five years only:
+
+    ```python
+    import chartbook as cb
+    df = cb.data.load(
+        pipeline_id="fred_charts",
+        dataframe_id="interest_rates",
+        columns=["date", "DGS10", "DGS2"],
+        date_range=("2020-01-01", None),
+    )
+    ```
+
+    Load the last 90 days of a long daily panel. Row groups that end before the window are
+    skipped using their statistics, so only the tail of the file is read:
+
+    ```python
+    import chartbook as cb
+    df = cb.data.load(pipeline_id="fred_charts", dataframe_id="interest_rates", last="90d")
+    ```
+
+    Load the rows matching a set of row predicates:
+
+    ```python
+    import chartbook as cb
+    df = cb.data.load(
+        pipeline_id="fred_charts",
+        dataframe_id="interest_rates",
+        filters=[("series", "in", ["DGS10", "DGS2"]), ("value", ">", 0)],
+    )
+    ```
+
+    Load a slice of a dataframe served by ``chartbook serve-data`` on another machine:
+
+    ```python
+    import chartbook as cb
+    df = cb.data.load(
+        pipeline_id="fred_charts",
+        dataframe_id="interest_rates",
+        columns=["date", "DGS10"],
+        last="5y",
+        remote="http://buildhost:8765",
+    )
+    ```
+
+    Load from a specific directory:
+
+    ```python
+    import chartbook as cb
+    df = cb.data.load(base_dir="/path/to/data", pipeline_id="fred_charts", dataframe_id="interest_rates")
+    print(df.head())
+    ```
+    """
+    if format not in _FORMATS:
+        raise ValueError(f"Invalid format: {format}")
+    if format == "arrow_dataset" and columns is not None:
+        raise ValueError(
+            "columns is not supported with format='arrow_dataset'. "
+            "Pass columns to Dataset.to_table() or Dataset.scanner() instead."
+        )
+
+    if sidecar and shared:
+        raise ValueError("sidecar and shared cannot be combined")
+
+    if remote is not None:
+        if sidecar or shared:
+            raise ValueError("remote cannot be combined with sidecar or shared")
+        table = fetch_table(
+            remote,
+            pipeline_id,
+            dataframe_id,
+            columns=columns,
+            filters=filters,
+            date_range=date_range,
+            date_col=date_col,
+            since=since,
+            until=until,
+            last=last,
+            resample=resample,
+        )
+        return _load_from_table(table, format, None, [])
+
+    file_path = get_path(base_dir, pipeline_id, dataframe_id, data_dir_name)
+    columns = list(columns) if columns is not None else None
+    file_path, resample_level, date_col, dnf = resolve_request(
+        file_path,
+        pipeline_id,
+        dataframe_id,
+        filters=filters,
+        date_range=date_range,
+        date_col=date_col,
+        since=since,
+        until=until,
+        last=last,
+        resample=resample,
+    )
+
+    use_cache = cache and is_cache_enabled() and format in _EAGER_FORMATS
+    if use_cache:
+        cache_key = make_cache_key(
+            file_path, format, columns, dnf, resample=resample_level
+        )
+        df = get_cached(cache_key)
+        if df is not None:
+            return df
+
+    sidecar_path = (
+        ensure_sidecar(file_path) if sidecar and resample_level is None else None
+    )
+
+    if resample_level is not None:
+        # No up-to-date pyramid, so resample the full dataframe here
+        table = resample_table(
+            read_table(file_path),
+            date_col,
+            resample_level,
+            resolve_resample_keys(pipeline_id, dataframe_id),
+        )
+        df = _load_from_table(table, format, columns, dnf)
+    elif shared:
+        df = _load_from_table(shared_table(file_path), format, columns, dnf)
+    elif sidecar_path is not None:
+        df = _load_from_sidecar(sidecar_path, format, columns, dnf)
+    elif format in ("arrow", "pandas_arrow") or (
+        format == "pandas" and is_partitioned(file_path)
+    ):
+        table = read_table(
+            file_path,
+            columns=columns,
+            filter=to_arrow_expression(dnf) if dnf else None,
+        )
+        df = _convert_table(table, format)
+    elif format == "pandas":
+        import pandas as pd
+
+        df = pd.read_parquet(
+            file_path,
+            columns=columns,
+            filters=to_arrow_expression(dnf) if dnf else None,
+        )
+    elif format == "arrow_dataset":
+        df = open_dataset(file_path)
+        if dnf:
+            df = df.filter(to_arrow_expression(dnf))
+    else:
+        lf = scan_polars(file_path)
+        if dnf:
+            lf = lf.filter(to_polars_expression(dnf))
+        if columns is not None:
+            lf = lf.select(columns)
+        df = lf if format == "polars_lazy" else lf.collect()
+
+    if use_cache:
+        put_cached(cache_key, df)
+    return df
+
+
+def resolve_request(
+    file_path: Path,
+    pipeline_id: str,
+    dataframe_id: str,
+    filters: Optional[list] = None,
+    date_range: Optional[tuple] = None,
+    date_col: Optional[str] = None,
+    since=None,
+    until=None,
+    last: Union[str, int, timedelta, None] = None,
+    resample: Optional[str] = None,
+) -> tuple:
+    """Resolve the date column, resampling and row filters of a ``load`` request.
+
+    :returns: ``(file_path, resample_level, date_col, dnf)``: the file to read, which is the
+        pyramid when an up-to-date one exists; the level to resample to in memory, or None;
+        the date column; and the row filters in normal form, coerced to the file's schema.
+    """
+    resample_level = normalize_level(resample) if resample is not None else None
+    if resample_level is not None:
+        date_col = resolve_date_col(pipeline_id, dataframe_id, date_col)
+        if is_pyramid_fresh(file_path, resample_level):
+            file_path = get_pyramid_path(file_path, resample_level)
+            resample_level = None
+    if since is not None or until is not None or last is not None:
+        if date_range is not None:
+            raise ValueError("date_range cannot be combined with since, until or last")
+        date_col = resolve_date_col(pipeline_id, dataframe_id, date_col)
+        filters = and_filters(
+            filters, date_window_filters(file_path, date_col, since, until, last)
+        )
+    elif date_range is not None:
+        date_col = resolve_date_col(pipeline_id, dataframe_id, date_col)
+    dnf = prepare_filters(file_path, filters, date_range=date_range, date_col=date_col)
+    return file_path, resample_level, date_col, dnf
+
+
+def load_many(
+    dataframes: Iterable[tuple[str, str]],
+    max_workers: Optional[int] = None,
+    base_dir: Union[str, Path, None] = None,
+    data_dir_name: str = "_data",
+    format: str = "pandas",
+    **kwargs,
+) -> dict:
+    """Load several dataframes concurrently.
+
+    Parquet decoding releases the GIL, so reading files in a thread pool
+    overlaps both I/O and decompression. Each dataframe is loaded with ``load``,
+    so the load cache and sidecars apply as usual.
+
+    :param dataframes: ``(pipeline_id, dataframe_id)`` pairs to load. Duplicates are loaded once.
+    :type dataframes: Iterable[tuple[str, str]]
+    :param max_workers: The maximum number of threads. If None, uses the
+        ``ThreadPoolExecutor`` default, capped at the number of dataframes.
+    :type max_workers: Optional[int]
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :param format: The desired format of the returned DataFrames. See ``load``.
+    :type format: str
+    :param kwargs: Additional keyword arguments passed to ``load`` for every dataframe,
+        such as ``columns``, ``filters``, ``cache`` or ``sidecar``.
+    :returns: A dict mapping each ``(pipeline_id, dataframe_id)`` pair to its dataframe,
+        in the order the pairs were given.
+    :rtype: dict
+    :raises Exception: The first error raised by any load, after cancelling the loads
+        that have not started yet.
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    frames = cb.data.load_many(
+        [("fred_charts", "interest_rates"), ("yield_curve", "fed_yield_curve")],
+        max_workers=8,
+    )
+    rates = frames["fred_charts", "interest_rates"]
+    ```
+    """
+    keys = list(
+        dict.fromkeys(
+            (pipeline_id, dataframe_id) for pipeline_id, dataframe_id in dataframes
+        )
+    )
+    if not keys:
+        return {}
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got: {max_workers}")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(keys)) if max_workers else None,
+        thread_name_prefix="chartbook-load",
+    )
+    try:
+        futures = {
+            key: executor.submit(
+                load,
+                base_dir=base_dir,
+                pipeline_id=key[0],
+                dataframe_id=key[1],
+                data_dir_name=data_dir_name,
+                format=format,
+                **kwargs,
+            )
+            for key in keys
+        }
+        result = {key: future.result() for key, future in futures.items()}
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+    return result
+
+
+def _load_from_sidecar(sidecar_path: Path, format: str, columns, dnf: list):
+    """Load a dataframe from a memory-mapped Arrow IPC sidecar."""
+    if format == "polars_lazy":
+        import polars as pl
+
+        # polars memory-maps local IPC files when scanning
+        lf = pl.scan_ipc(sidecar_path)
+        if dnf:
+            lf = lf.filter(to_polars_expression(dnf))
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf
+
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    dataset = ds.dataset(
+        str(sidecar_path), format="ipc", filesystem=fs.LocalFileSystem(use_mmap=True)
+    )
+    if format == "arrow_dataset":
+        return dataset.filter(to_arrow_expression(dnf)) if dnf else dataset
+
+    table = dataset.to_table(
+        columns=columns, filter=to_arrow_expression(dnf) if dnf else None
+    )
+    return _convert_table(table, format)
+
+
+def _load_from_table(table, format: str, columns, dnf: list):
+    """Load a dataframe from an in-memory ``pyarrow.Table``, such as a shared memory copy."""
+    if format == "polars_lazy":
+        import polars as pl
+
+        lf = pl.from_arrow(table, rechunk=False).lazy()
+        if dnf:
+            lf = lf.filter(to_polars_expression(dnf))
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf
+
+    import pyarrow.dataset as ds
+
+    if format == "arrow_dataset":
+        dataset = ds.dataset(table)
+        return dataset.filter(to_arrow_expression(dnf)) if dnf else dataset
+
+    if dnf:
+        table = ds.dataset(table).to_table(
+            columns=columns, filter=to_arrow_expression(dnf)
+        )
+    elif columns is not None:
+        # Selecting columns keeps pointing into the table's buffers
+        table = table.select(columns)
+    return _convert_table(table, format)
+
+
+def _convert_table(table, format: str):
+    """Convert a ``pyarrow.Table`` to one of the eager formats of ``load``."""
+    if format == "arrow":
+        return table
+    if format == "pandas":
+        return table.to_pandas()
+    if format == "pandas_arrow":
+        import pandas as pd
+
+        # ArrowDtype columns wrap the Arrow buffers instead of converting them
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    import polars as pl
+
+    return pl.from_arrow(table)
@@ -0,0 +1,158 @@
+"""SQL queries across the dataframes of a catalog, planned lazily by polars."""
+
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from chartbook.data._dataset import scan_polars
+from chartbook.data._index import get_index_path, read_index
+
+_QUERY_FORMATS = ("pandas", "pandas_arrow", "polars", "arrow", "polars_lazy")
+
+# Single-quoted SQL string literals, which are never rewritten
+_STRING_LITERAL = re.compile(r"('(?:[^']|'')*')")
+# Double-quoted identifiers and bare (possibly dotted) words
+_IDENTIFIER = re.compile(r'"((?:[^"]|"")+)"|([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)?)')
+
+
+def _catalog_tables(catalog) -> dict[str, Path]:
+    """Map ``pipeline_id.dataframe_id`` to the parquet path of every dataframe in a ``Catalog``."""
+    return {
+        f"{dataframe.pipeline_id}.{dataframe.id}": dataframe.path
+        for dataframe in catalog.iter_dataframes()
+    }
+
+
+def catalog_tables(manifest: Optional[dict] = None) -> dict[str, Path]:
+    """Return the table names and parquet paths that ``query`` can reference.
+
+    Every dataframe is available as ``pipeline_id.dataframe_id``, and also as
+    plain ``dataframe_id`` when no other pipeline has a dataframe of that name.
+    Dataframes come from ``manifest`` if given, otherwise from the dataframe
+    index, otherwise from the current project's ``chartbook.toml``.
+    """
+    if manifest is not None:
+        from chartbook.model import Catalog
+
+        tables = _catalog_tables(Catalog.from_manifest(manifest))
+    else:
+        tables = {
+            key.replace(":", ".", 1): Path(entry["path"])
+            for key, entry in read_index(get_index_path()).items()
+        }
+        if not tables:
+            from chartbook.model import load_catalog
+            from chartbook.settings import get_project_root
+
+            project_root = get_project_root()
+            if (project_root / "chartbook.toml").exists():
+                tables = _catalog_tables(load_catalog(project_root))
+
+    short_names = Counter(name.split(".", 1)[1] for name in tables)
+    aliases = {
+        name.split(".", 1)[1]: path
+        for name, path in tables.items()
+        if short_names[name.split(".", 1)[1]] == 1
+    }
+    return {**aliases, **tables}
+
+
+def _code_segments(sql: str) -> list[str]:
+    """Split ``sql`` so that the even-numbered segments lie outside string literals."""
+    return _STRING_LITERAL.split(sql)
+
+
+def quote_table_names(sql: str, names) -> str:
+    """Quote bare ``pipeline_id.dataframe_id`` references to known tables.
+
+    Polars reads an unquoted ``a.b`` as table ``b`` in schema ``a``, so dotted
+    table names are quoted to be looked up as a single table name. String
+    literals and names that are already quoted are left as they are.
+    """
+    dotted = sorted((name for name in names if "." in name), key=len, reverse=True)
+    if not dotted:
+        return sql
+    pattern = re.compile(
+        r'(?<![\w."])(' + "|".join(re.escape(name) for name in dotted) + r')(?![\w"])'
+    )
+    segments = _code_segments(sql)
+    for i in range(0, len(segments), 2):
+        segments[i] = pattern.sub(r'"\1"', segments[i])
+    return "".join(segments)
+
+
+def referenced_names(sql: str) -> set[str]:
+    """Return every identifier in ``sql`` outside string literals."""
+    names = set()
+    for segment in _code_segments(sql)[::2]:
+        for quoted, bare in _IDENTIFIER.findall(segment):
+            if quoted:
+                names.add(quoted.replace('""', '"'))
+            else:
+                names.add(bare)
+                names.update(bare.split("."))
+    return names
+
+
+def query(
+    sql: str,
+    format: str = "pandas",
+    manifest: Optional[dict] = None,
+):
+    """Run a SQL query across the dataframes of the catalog.
+
+    Each dataframe can be referenced as ``pipeline_id.dataframe_id``, or as
+    ``dataframe_id`` alone when the name is unique in the catalog. Referenced
+    dataframes are registered as lazy parquet scans in a polars ``SQLContext``,
+    so the whole query, including joins across pipelines, is planned at once:
+    only the columns it uses are read, and filters are pushed down to skip row
+    groups. Nothing is loaded into memory before the query runs.
+
+    :param sql: The SQL query, in the dialect of ``polars.SQLContext``.
+    :type sql: str
+    :param format: The format of the result: "pandas", "pandas_arrow", "polars", "arrow" or
+        "polars_lazy" (an unevaluated LazyFrame). Default is "pandas".
+    :type format: str
+    :param manifest: The manifest whose dataframes can be queried, as returned by
+        ``load_manifest``. If None, the dataframe index is used, or the manifest of the
+        current project if there is no index.
+    :type manifest: Optional[dict]
+    :returns: The result of the query.
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    df = cb.data.query(
+        '''
+        SELECT r.date, r.fed_funds, s.spread
+        FROM fred_charts.interest_rates AS r
+        JOIN fred_charts.credit_spreads AS s ON r.date = s.date
+        WHERE r.date >= '2020-01-01'
+        '''
+    )
+    ```
+    """
+    import polars as pl
+
+    from chartbook.data._load import _convert_table
+
+    if format not in _QUERY_FORMATS:
+        raise ValueError(f"Invalid format: {format}")
+
+    tables = catalog_tables(manifest)
+    sql = quote_table_names(sql, tables)
+    used = referenced_names(sql)
+
+    ctx = pl.SQLContext()
+    for name, path in tables.items():
+        if name in used:
+            ctx.register(name, scan_polars(path))
+    result = ctx.execute(sql, eager=False)
+
+    if format == "polars_lazy":
+        return result
+    if format == "polars":
+        return result.collect()
+    return _convert_table(result.collect().to_arrow(), format)
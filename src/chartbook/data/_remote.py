@@ -0,0 +1,167 @@
+"""Client for dataframes served over HTTP by ``chartbook serve-data``.
+
+The server streams each request as an Arrow IPC stream. Request parameters
+are sent in the query string; ``columns``, ``filters`` and ``date_range`` are
+JSON encoded, with dates and timestamps as ISO strings that the server casts
+to the column types, exactly as ``load`` does for local files.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timedelta
+from typing import Sequence
+from urllib.parse import quote, urlencode
+
+from chartbook.data._filters import normalize_filters
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Seconds to wait for the server to accept the request or send more data
+DEFAULT_TIMEOUT = 60.0
+
+
+def _json_default(value):
+    """Encode dates, timestamps, sets and tuples in request parameters."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Cannot send {value!r} to a chartbook data server")
+
+
+def _encode_last(last) -> str:
+    """Encode ``last`` as a number of days or a string such as "36h"."""
+    if isinstance(last, timedelta):
+        if last % timedelta(days=1) == timedelta(0):
+            return f"{last.days}d"
+        if last % timedelta(hours=1) == timedelta(0):
+            return f"{int(last.total_seconds()) // 3600}h"
+        raise ValueError(f"last must be a whole number of hours, got: {last!r}")
+    return str(last)
+
+
+def encode_params(
+    columns: Sequence[str] | None = None,
+    filters: list | None = None,
+    date_range: tuple | None = None,
+    date_col: str | None = None,
+    since=None,
+    until=None,
+    last=None,
+    resample: str | None = None,
+) -> dict[str, str]:
+    """Encode the arguments of a ``load`` request as query parameters."""
+    params = {}
+    if columns is not None:
+        params["columns"] = json.dumps(list(columns))
+    dnf = normalize_filters(filters)
+    if dnf:
+        params["filters"] = json.dumps(dnf, default=_json_default)
+    if date_range is not None:
+        params["date_range"] = json.dumps(list(date_range), default=_json_default)
+    if date_col is not None:
+        params["date_col"] = date_col
+    for name, value in (("since", since), ("until", until)):
+        if value is not None:
+            params[name] = _json_default(value) if isinstance(value, date) else value
+    if last is not None:
+        params["last"] = _encode_last(last)
+    if resample is not None:
+        params["resample"] = resample
+    return params
+
+
+def decode_params(query: dict[str, list[str]]) -> dict:
+    """Decode query parameters written by ``encode_params`` into ``load`` arguments.
+
+    :raises ValueError: If a parameter is malformed.
+    """
+    params = {name: values[-1] for name, values in query.items()}
+    kwargs = {}
+    try:
+        if "columns" in params:
+            kwargs["columns"] = [str(name) for name in json.loads(params["columns"])]
+        if "filters" in params:
+            kwargs["filters"] = [
+                [tuple(term) for term in conjunction]
+                for conjunction in json.loads(params["filters"])
+            ]
+        if "date_range" in params:
+            kwargs["date_range"] = tuple(json.loads(params["date_range"]))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed request parameter: {e}") from e
+    for name in ("date_col", "since", "until", "resample"):
+        if name in params:
+            kwargs[name] = params[name]
+    if "last" in params:
+        last = params["last"]
+        kwargs["last"] = int(last) if last.isdigit() else last
+    return kwargs
+
+
+def dataframe_url(remote: str, pipeline_id: str, dataframe_id: str) -> str:
+    """Return the URL of a dataframe on the server at ``remote``."""
+    return (
+        f"{remote.rstrip('/')}/dataframes/"
+        f"{quote(pipeline_id, safe='')}/{quote(dataframe_id, safe='')}"
+    )
+
+
+def fetch_table(
+    remote: str,
+    pipeline_id: str,
+    dataframe_id: str,
+    timeout: float | None = None,
+    **kwargs,
+):
+    """Load a dataframe from a ``chartbook serve-data`` server as a ``pyarrow.Table``.
+
+    :param remote: The base URL of the server, such as "http://buildhost:8765".
+    :param timeout: Seconds to wait for the server to accept the request or send more
+        data. If None, uses the ``CHARTBOOK_REMOTE_TIMEOUT`` setting, which defaults to
+        ``DEFAULT_TIMEOUT``.
+    :param kwargs: ``columns``, ``filters``, ``date_range``, ``date_col``, ``since``,
+        ``until``, ``last`` and ``resample``, as in ``load``.
+    :raises FileNotFoundError: If the server does not serve the dataframe.
+    :raises ValueError: If the server rejects the request parameters.
+    :raises KeyError: If a requested column does not exist.
+    :raises TimeoutError: If the server does not respond within ``timeout``.
+    """
+    import urllib.error
+    import urllib.request
+
+    import pyarrow as pa
+
+    from chartbook.settings import config
+
+    if timeout is None:
+        timeout = config(
+            "CHARTBOOK_REMOTE_TIMEOUT", default=DEFAULT_TIMEOUT, cast=float
+        )
+
+    url = dataframe_url(remote, pipeline_id, dataframe_id)
+    params = encode_params(**kwargs)
+    if params:
+        url = f"{url}?{urlencode(params)}"
+    request = urllib.request.Request(url, headers={"Accept": ARROW_STREAM_MEDIA_TYPE})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return pa.ipc.open_stream(response).read_all()
+    except urllib.error.HTTPError as e:
+        try:
+            detail = json.loads(e.read())
+        except ValueError:
+            detail = {}
+        message = detail.get("error", str(e))
+        if e.code == 404:
+            raise FileNotFoundError(message) from None
+        if detail.get("type") == "KeyError":
+            raise KeyError(message) from None
+        if e.code == 400:
+            raise ValueError(message) from None
+        raise
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, TimeoutError):
+            raise TimeoutError(f"{remote} did not respond within {timeout}s") from None
+        raise
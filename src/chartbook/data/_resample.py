@@ -0,0 +1,265 @@
+"""Precomputed coarser versions of time-series dataframes.
+
+A resampled version ("pyramid level") of ``rates.parquet`` holds one row per
+period, for example per month, and is written next to it as
+``rates.M.parquet`` (a partitioned directory ``rates/`` also gets
+``rates.M.parquet``). Each row is the period-end observation: the last date in
+the period and, for every other column, its last non-null value in the period.
+The columns listed in the dataframe's ``resample_keys`` are kept as keys, so
+long panels get one row per series per period; without ``resample_keys``, text
+and categorical columns are the keys. A dataframe with more than one row per
+key and date cannot be resampled. The parquet file's mtime and size are stored in the
+pyramid's schema metadata so that a stale pyramid is never served.
+
+``chartbook build --pyramids`` and ``chartbook publish --pyramids`` write the
+levels coarser than the finest ``data_frequency`` of each dataframe's charts,
+and ``load(..., resample="M")`` reads them.
+"""
+
+from __future__ import annotations
+
+import re
+import warnings
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from chartbook.data._atomic import atomic_path
+from chartbook.data._cache import file_signature
+from chartbook.data._dataset import read_schema, read_table
+from chartbook.data._index import lookup_entry
+from chartbook.data._sidecar import (
+    _SOURCE_MTIME_KEY,
+    _SOURCE_SIZE_KEY,
+    _matches_source,
+)
+from chartbook.data._window import _NO_DATE_COL, _manifest_dataframe
+
+if TYPE_CHECKING:
+    from chartbook.model import Catalog
+
+# Pyramid levels, from finest to coarsest, and their polars truncation intervals
+RESAMPLE_LEVELS = {"W": "1w", "M": "1mo", "Q": "1q", "Y": "1y"}
+
+_LEVEL_ALIASES = {
+    "weekly": "W",
+    "monthly": "M",
+    "quarterly": "Q",
+    "annual": "Y",
+    "yearly": "Y",
+    "a": "Y",
+}
+
+# data_frequency words and their rank against RESAMPLE_LEVELS (0 = finer than weekly)
+_FREQUENCY_RANKS = (
+    (re.compile(r"intraday|tick|second|minute|hour"), 0),
+    (re.compile(r"daily|day"), 0),
+    (re.compile(r"week"), 1),
+    (re.compile(r"month"), 2),
+    (re.compile(r"quarter"), 3),
+    (re.compile(r"annual|year"), 4),
+)
+
+_LEVEL_KEY = b"chartbook.resample"
+
+
+def normalize_level(resample: str) -> str:
+    """Return the pyramid level ("W", "M", "Q" or "Y") for ``resample``.
+
+    Level names are case-insensitive, and "weekly", "monthly", "quarterly",
+    "annual" and "yearly" are accepted as well.
+    """
+    level = _LEVEL_ALIASES.get(str(resample).lower(), str(resample).upper())
+    if level not in RESAMPLE_LEVELS:
+        raise ValueError(
+            f"Invalid resample: {resample!r}. Use one of {', '.join(RESAMPLE_LEVELS)}."
+        )
+    return level
+
+
+def get_pyramid_path(parquet_path: Path, level: str) -> Path:
+    """Return the path of the ``level`` pyramid of ``parquet_path``."""
+    parquet_path = Path(parquet_path)
+    return parquet_path.with_suffix(f".{normalize_level(level)}.parquet")
+
+
+def is_pyramid_fresh(parquet_path: Path, level: str) -> bool:
+    """Return whether the ``level`` pyramid exists and matches the current parquet data."""
+    pyramid_path = get_pyramid_path(parquet_path, level)
+    if not pyramid_path.is_file():
+        return False
+    try:
+        metadata = read_schema(pyramid_path).metadata
+    except (OSError, ValueError):
+        return False
+    return _matches_source(metadata, parquet_path)
+
+
+def resolve_resample_keys(pipeline_id: str, dataframe_id: str) -> list[str] | None:
+    """Return the ``resample_keys`` declared for a dataframe in ``chartbook.toml``.
+
+    The declaration is looked up in the dataframe index and then in the current
+    project's manifest.
+
+    :returns: The key columns, or None if the dataframe declares none.
+    """
+    entry = lookup_entry(pipeline_id, dataframe_id)
+    if entry is not None and entry.get("resample_keys") is not None:
+        return entry["resample_keys"]
+    return _manifest_dataframe(pipeline_id, dataframe_id).get("resample_keys")
+
+
+def resample_table(table, date_col: str, level: str, keys: Sequence[str] | None = None):
+    """Reduce a ``pyarrow.Table`` to one period-end row per ``level`` period and key.
+
+    :param keys: The columns identifying a series, such as ``["permno"]``. Defaults to
+        the text and categorical columns.
+    :raises KeyError: If the table has no column ``date_col`` or one of ``keys``.
+    :raises ValueError: If ``date_col`` is not a date or timestamp column, or if the
+        table has more than one row for a key and date.
+    """
+    import polars as pl
+
+    if date_col not in table.column_names:
+        raise KeyError(f"Date column not found in dataframe: {date_col!r}")
+    df = pl.from_arrow(table)
+    if not df.schema[date_col].is_temporal() or df.schema[date_col] == pl.Time:
+        raise ValueError(
+            f"resample requires a date or timestamp column, but {date_col!r} has "
+            f"type {df.schema[date_col]}"
+        )
+
+    if keys is None:
+        keys = [
+            name
+            for name, dtype in df.schema.items()
+            if name != date_col and dtype in (pl.String, pl.Categorical, pl.Enum)
+        ]
+    else:
+        keys = [name for name in keys if name != date_col]
+        missing = [name for name in keys if name not in df.columns]
+        if missing:
+            raise KeyError(f"Resample keys not found in dataframe: {missing}")
+    # Rows sharing a key and date would be collapsed into one series
+    if df.select(*keys, date_col).is_duplicated().any():
+        raise ValueError(
+            f"Cannot resample: more than one row per {[*keys, date_col]}. Declare "
+            "the columns that identify a series as resample_keys in chartbook.toml."
+        )
+    values = [name for name in df.columns if name != date_col and name not in keys]
+    period = "__chartbook_period"
+    return (
+        df.sort(date_col, maintain_order=True)
+        .group_by(
+            [*keys, pl.col(date_col).dt.truncate(RESAMPLE_LEVELS[level]).alias(period)],
+            maintain_order=True,
+        )
+        .agg(
+            pl.col(date_col).max(),
+            *(pl.col(name).drop_nulls().last() for name in values),
+        )
+        .select(df.columns)
+        .sort([date_col, *keys], maintain_order=True)
+        .to_arrow()
+    )
+
+
+def write_pyramid(
+    parquet_path: Path, date_col: str, level: str, keys: Sequence[str] | None = None
+) -> Path:
+    """Write the ``level`` pyramid of ``parquet_path`` with ``atomic_path``.
+
+    :param keys: The columns identifying a series, passed to ``resample_table``.
+    :returns: The path of the pyramid.
+    """
+    import pyarrow.parquet as pq
+
+    parquet_path = Path(parquet_path)
+    level = normalize_level(level)
+    pyramid_path = get_pyramid_path(parquet_path, level)
+
+    mtime_ns, size = file_signature(parquet_path)
+    table = resample_table(read_table(parquet_path), date_col, level, keys)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_SOURCE_MTIME_KEY] = str(mtime_ns).encode()
+    metadata[_SOURCE_SIZE_KEY] = str(size).encode()
+    metadata[_LEVEL_KEY] = level.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    with atomic_path(pyramid_path) as temp_path:
+        pq.write_table(table, temp_path, compression="zstd", write_statistics=True)
+    return pyramid_path
+
+
+def pyramid_levels(data_frequencies) -> list[str]:
+    """Return the pyramid levels coarser than the finest of ``data_frequencies``.
+
+    :param data_frequencies: ``data_frequency`` values of a dataframe's charts, such as
+        "Daily" or "Quarterly/Monthly".
+    :returns: The levels to build, or an empty list if no frequency is recognized.
+    """
+    ranks = [
+        rank
+        for frequency in data_frequencies
+        for part in re.split(r"[/,;]|\band\b", str(frequency).lower())
+        for pattern, rank in _FREQUENCY_RANKS
+        if pattern.search(part)
+    ]
+    if not ranks:
+        return []
+    finest = min(ranks)
+    return [level for rank, level in enumerate(RESAMPLE_LEVELS, 1) if rank > finest]
+
+
+def build_pyramids(
+    manifest: dict, verbose: bool = False, catalog: Catalog | None = None
+) -> list[Path]:
+    """Write the pyramids of every time-series dataframe in a pipeline or catalog manifest.
+
+    A dataframe gets pyramids when it declares a ``date_col`` and its charts
+    declare a ``data_frequency``; the levels coarser than the finest frequency
+    are built. Pyramids that are already up to date are left as they are.
+    Dataframes that cannot be resampled are skipped with a warning.
+
+    :param manifest: A manifest as returned by ``load_manifest``.
+    :type manifest: dict
+    :param verbose: Whether to print each pyramid that is written.
+    :type verbose: bool
+    :param catalog: The object model of ``manifest``, such as from ``load_catalog``.
+        Built from ``manifest`` if not given.
+    :type catalog: Optional[Catalog]
+    :returns: The paths of the pyramids that were written.
+    :rtype: list[Path]
+    """
+    if catalog is None:
+        from chartbook.model import Catalog
+
+        catalog = Catalog.from_manifest(manifest)
+
+    written = []
+    for dataframe in catalog.iter_dataframes():
+        date_col = dataframe.date_col
+        if date_col is None or date_col in _NO_DATE_COL:
+            continue
+        levels = pyramid_levels(
+            chart.data_frequency or "" for chart in dataframe.charts
+        )
+        if not levels or not dataframe.path.exists():
+            continue
+        for level in levels:
+            if is_pyramid_fresh(dataframe.path, level):
+                continue
+            try:
+                pyramid_path = write_pyramid(
+                    dataframe.path, date_col, level, dataframe.resample_keys
+                )
+            except (KeyError, ValueError, OSError) as e:
+                warnings.warn(
+                    f"Could not resample {dataframe.pipeline_id}:{dataframe.id}: {e}",
+                    UserWarning,
+                )
+                break
+            written.append(pyramid_path)
+            if verbose:
+                print(f"Wrote {level} pyramid to {pyramid_path}")
+    return written
@@ -0,0 +1,120 @@
+"""Random samples of pipeline dataframes that read only a few row groups."""
+
+import random
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from chartbook.data._dataset import open_dataset
+from chartbook.data._load import _convert_table, get_path
+
+_SAMPLE_FORMATS = ("pandas", "pandas_arrow", "polars", "arrow")
+
+# Default number of rows in a sample
+DEFAULT_SAMPLE_SIZE = 10_000
+
+
+def sample_path(
+    path: Union[str, Path],
+    n: int = DEFAULT_SAMPLE_SIZE,
+    seed: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+):
+    """Sample ``n`` rows of a parquet file or partitioned directory as a ``pyarrow.Table``.
+
+    Row groups are drawn at random from the footer layout until they hold at
+    least ``n`` rows, only those row groups are read, and ``n`` rows are drawn
+    at random from them. Rows are returned in file order.
+    """
+    import pyarrow as pa
+
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got: {n}")
+
+    rng = random.Random(seed)
+    dataset = open_dataset(path)
+    columns = list(columns) if columns is not None else None
+
+    row_groups = [
+        (fragment_index, fragment, row_group.id, row_group.num_rows)
+        for fragment_index, fragment in enumerate(dataset.get_fragments())
+        for row_group in fragment.row_groups
+        if row_group.num_rows > 0
+    ]
+    rng.shuffle(row_groups)
+
+    chosen = []
+    num_rows = 0
+    for row_group in row_groups:
+        if num_rows >= n:
+            break
+        chosen.append(row_group)
+        num_rows += row_group[3]
+    chosen.sort(key=lambda row_group: (row_group[0], row_group[2]))
+
+    if not chosen:
+        return dataset.head(0, columns=columns)
+    table = pa.concat_tables(
+        fragment.subset(row_group_ids=[row_group_id]).to_table(
+            schema=dataset.schema, columns=columns
+        )
+        for _, fragment, row_group_id, _ in chosen
+    )
+    if table.num_rows > n:
+        table = table.take(sorted(rng.sample(range(table.num_rows), n)))
+    return table
+
+
+def sample(
+    pipeline_id: str,
+    dataframe_id: str,
+    n: int = DEFAULT_SAMPLE_SIZE,
+    seed: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    format: str = "pandas",
+    base_dir: Union[str, Path, None] = None,
+    data_dir_name: str = "_data",
+):
+    """Load a random sample of rows from a dataframe without reading the whole file.
+
+    Whole row groups are picked at random from the parquet footer layout until
+    they hold at least ``n`` rows, and ``n`` rows are then drawn at random from
+    the rows of those row groups. Only the picked row groups are read, so the
+    cost depends on ``n`` and the row group size, not on the size of the
+    dataframe. Because rows come from a few row groups, this is a cluster
+    sample: rows that are stored together (for example, consecutive dates) tend
+    to be sampled together.
+
+    :param pipeline_id: The identifier of the pipeline that generated the dataframe.
+    :type pipeline_id: str
+    :param dataframe_id: The identifier of the specific dataframe within the pipeline.
+    :type dataframe_id: str
+    :param n: The number of rows to sample. If the dataframe has fewer rows, all rows are
+        returned. Default is 10,000.
+    :type n: int
+    :param seed: Seed for the random number generator, for reproducible samples.
+    :type seed: Optional[int]
+    :param columns: The columns to read. If None, all columns are read.
+    :type columns: Optional[Sequence[str]]
+    :param format: The format of the returned sample: "pandas", "pandas_arrow", "polars" or
+        "arrow". Default is "pandas".
+    :type format: str
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the dataframe index or the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :returns: The sampled rows, in file order.
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    df = cb.data.sample("fred_charts", "interest_rates", n=1_000, seed=42)
+    ```
+    """
+    if format not in _SAMPLE_FORMATS:
+        raise ValueError(f"Invalid format: {format}")
+
+    file_path = get_path(base_dir, pipeline_id, dataframe_id, data_dir_name)
+    table = sample_path(file_path, n=n, seed=seed, columns=columns)
+    return _convert_table(table, format)
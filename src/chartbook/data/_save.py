@@ -0,0 +1,126 @@
+"""Write pipeline dataframes to parquet laid out for the pruning readers."""
+
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from chartbook.data._atomic import atomic_path
+from chartbook.data._load import get_path
+from chartbook.data._window import resolve_date_col
+
+# Default number of rows per row group. Small enough for row-group statistics to
+# prune date windows and filters, large enough to keep the footer small.
+DEFAULT_ROW_GROUP_SIZE = 131_072
+
+
+def _to_arrow(df):
+    """Convert a pandas or polars DataFrame, polars LazyFrame or pyarrow Table to a Table."""
+    import pyarrow as pa
+
+    if isinstance(df, pa.Table):
+        return df
+    if hasattr(df, "collect"):
+        df = df.collect()
+    if hasattr(df, "to_arrow"):
+        return df.to_arrow()
+    return pa.Table.from_pandas(df)
+
+
+def _resolve_sort_by(sort_by, table, pipeline_id: str, dataframe_id: str) -> list[str]:
+    """Return the columns to sort by; by default the declared date_col, if present."""
+    if sort_by is None:
+        try:
+            date_col = resolve_date_col(pipeline_id, dataframe_id)
+        except ValueError:
+            return []
+        return [date_col] if date_col in table.column_names else []
+    if isinstance(sort_by, str):
+        return [sort_by]
+    return list(sort_by)
+
+
+def save(
+    df,
+    pipeline_id: str,
+    dataframe_id: str,
+    base_dir: Union[str, Path, None] = None,
+    data_dir_name: str = "_data",
+    sort_by: Union[str, Sequence[str], None] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    compression_level: Optional[int] = None,
+    write_statistics: bool = True,
+) -> Path:
+    """Save a dataframe to parquet, laid out for fast filtered loads.
+
+    This is the write-side counterpart of ``load``. The file is sorted, split
+    into moderately sized row groups and written with column statistics, so
+    that ``load`` with ``filters``, ``date_range`` or ``last`` can skip every row
+    group outside the requested range. The file is replaced with
+    ``atomic_path``.
+
+    :param df: The data to save: a pandas or polars DataFrame, a polars LazyFrame (collected
+        before writing) or a pyarrow Table.
+    :param pipeline_id: The identifier of the pipeline that generated the dataframe.
+    :type pipeline_id: str
+    :param dataframe_id: The identifier of the dataframe within the pipeline.
+    :type dataframe_id: str
+    :param base_dir: The base directory where pipeline data is stored.
+        If None, uses the dataframe index or the DATA_DIR from settings.
+    :type base_dir: Union[str, Path, None]
+    :param data_dir_name: The name of the data directory.
+    :type data_dir_name: str
+    :param sort_by: The column or columns to sort by before writing. If None, the file is sorted
+        by the dataframe's ``date_col`` from ``chartbook.toml`` (or "date") when the data has
+        that column. Pass an empty list to keep the row order.
+    :type sort_by: Union[str, Sequence[str], None]
+    :param row_group_size: The maximum number of rows per row group. Default is 131,072.
+    :type row_group_size: int
+    :param compression: The parquet compression codec. Default is "zstd".
+    :type compression: str
+    :param compression_level: The compression level, or None for the codec's default.
+    :type compression_level: Optional[int]
+    :param write_statistics: Whether to write column min/max/null count statistics.
+        Default is True.
+    :type write_statistics: bool
+    :returns: The path of the written parquet file.
+    :rtype: Path
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    cb.data.save(df, pipeline_id="fred_charts", dataframe_id="interest_rates")
+    cb.data.save(df, "fred_charts", "panel", sort_by=["series", "date"], row_group_size=50_000)
+    ```
+    """
+    import pyarrow.parquet as pq
+
+    if row_group_size < 1:
+        raise ValueError(f"row_group_size must be at least 1, got: {row_group_size}")
+
+    file_path = get_path(base_dir, pipeline_id, dataframe_id, data_dir_name)
+    if file_path.is_dir():
+        raise ValueError(
+            f"{file_path} is a partitioned dataset directory; save writes single parquet files."
+        )
+
+    table = _to_arrow(df)
+    sort_columns = _resolve_sort_by(sort_by, table, pipeline_id, dataframe_id)
+    sorting_columns = None
+    if sort_columns:
+        sort_keys = [(column, "ascending") for column in sort_columns]
+        table = table.sort_by(sort_keys)
+        sorting_columns = pq.SortingColumn.from_ordering(table.schema, sort_keys)
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_path(file_path) as temp_path:
+        pq.write_table(
+            table,
+            temp_path,
+            row_group_size=row_group_size,
+            compression=compression,
+            compression_level=compression_level,
+            write_statistics=write_statistics,
+            sorting_columns=sorting_columns,
+        )
+    return file_path
@@ -0,0 +1,185 @@
+"""HTTP server that streams catalog dataframes as Arrow IPC for ``chartbook serve-data``.
+
+Endpoints:
+
+``GET /dataframes``
+    A JSON list of the served dataframes, each with ``pipeline_id``,
+    ``dataframe_id`` and ``date_col``.
+
+``GET /dataframes/{pipeline_id}/{dataframe_id}``
+    The dataframe as an Arrow IPC stream. The query parameters written by
+    ``chartbook.data._remote.encode_params`` (``columns``, ``filters``,
+    ``date_range``, ``date_col``, ``since``, ``until``, ``last`` and
+    ``resample``) are pushed into the parquet scan exactly as in ``load``, and
+    record batches are written to the response as they are read.
+
+Errors are returned as JSON ``{"error": ..., "type": ...}`` with status 404
+for unknown dataframes and 400 for invalid parameters.
+"""
+
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from chartbook.data._dataset import open_dataset, read_table
+from chartbook.data._filters import to_arrow_expression
+from chartbook.data._load import resolve_request
+from chartbook.data._remote import ARROW_STREAM_MEDIA_TYPE, decode_params
+from chartbook.data._resample import resample_table
+from chartbook.data._window import _NO_DATE_COL
+
+if TYPE_CHECKING:
+    from chartbook.model import Catalog
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Rows per record batch written to the response
+_BATCH_SIZE = 65_536
+
+
+def served_dataframes(
+    manifest: dict, catalog: Catalog | None = None
+) -> dict[tuple[str, str], dict]:
+    """Map each ``(pipeline_id, dataframe_id)`` in a manifest to its path, date column and keys.
+
+    ``catalog`` is the object model of ``manifest``; it is built if not given.
+    """
+    if catalog is None:
+        from chartbook.model import Catalog
+
+        catalog = Catalog.from_manifest(manifest)
+
+    dataframes = {}
+    for dataframe in catalog.iter_dataframes():
+        date_col = dataframe.date_col
+        dataframes[dataframe.pipeline_id, dataframe.id] = {
+            "path": dataframe.path.resolve(),
+            "date_col": None if date_col in _NO_DATE_COL else date_col,
+            "resample_keys": dataframe.manifest.get("resample_keys"),
+        }
+    return dataframes
+
+
+class DataRequestHandler(BaseHTTPRequestHandler):
+    """Serve the dataframes of ``self.server.dataframes``."""
+
+    server_version = "chartbook-serve-data"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        if parts == ["dataframes"]:
+            self._send_json(
+                200,
+                [
+                    {
+                        "pipeline_id": pipeline_id,
+                        "dataframe_id": dataframe_id,
+                        "date_col": entry["date_col"],
+                    }
+                    for (pipeline_id, dataframe_id), entry in sorted(
+                        self.server.dataframes.items()
+                    )
+                ],
+            )
+        elif len(parts) == 3 and parts[0] == "dataframes":
+            self._send_dataframe(parts[1], parts[2], parse_qs(url.query))
+        else:
+            self._send_error(404, FileNotFoundError(f"Not found: {url.path}"))
+
+    def _send_dataframe(self, pipeline_id: str, dataframe_id: str, query: dict):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        entry = self.server.dataframes.get((pipeline_id, dataframe_id))
+        if entry is None or not entry["path"].exists():
+            self._send_error(
+                404,
+                FileNotFoundError(f"Dataframe not found: {pipeline_id}:{dataframe_id}"),
+            )
+            return
+
+        # Validate the request and plan the scan before any data is sent
+        try:
+            kwargs = decode_params(query)
+            columns = kwargs.pop("columns", None)
+            if kwargs.get("date_col") is None:
+                kwargs["date_col"] = entry["date_col"]
+            file_path, resample_level, date_col, dnf = resolve_request(
+                entry["path"], pipeline_id, dataframe_id, **kwargs
+            )
+            if resample_level is not None:
+                dataset = ds.dataset(
+                    resample_table(
+                        read_table(file_path),
+                        date_col,
+                        resample_level,
+                        entry["resample_keys"],
+                    )
+                )
+            else:
+                dataset = open_dataset(file_path)
+            scanner = dataset.scanner(
+                columns=columns,
+                filter=to_arrow_expression(dnf) if dnf else None,
+                batch_size=_BATCH_SIZE,
+            )
+        except (ValueError, KeyError, TypeError, pa.ArrowException) as e:
+            self._send_error(400, e)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", ARROW_STREAM_MEDIA_TYPE)
+        self.end_headers()
+        try:
+            with pa.ipc.new_stream(self.wfile, scanner.projected_schema) as writer:
+                for batch in scanner.to_batches():
+                    if batch.num_rows:
+                        writer.write_batch(batch)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away mid-stream
+            pass
+
+    def _send_json(self, status: int, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: int, error: Exception):
+        message = error.args[0] if isinstance(error, KeyError) else str(error)
+        self._send_json(status, {"error": message, "type": type(error).__name__})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class DataServer(ThreadingHTTPServer):
+    """A threaded HTTP server for the dataframes of a manifest."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        manifest: dict,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        verbose: bool = False,
+        catalog: Catalog | None = None,
+    ):
+        self.dataframes = served_dataframes(manifest, catalog=catalog)
+        self.verbose = verbose
+        super().__init__((host, port), DataRequestHandler)
+
+    @property
+    def url(self) -> str:
+        """The base URL to pass to ``load(..., remote=...)``."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
@@ -0,0 +1,440 @@
+"""Decoded dataframes shared between processes through shared memory.
+
+With ``load(..., shared=True)`` the first process to load a parquet file
+decodes it once and writes it as an uncompressed Arrow IPC file into a named
+shared memory segment (``multiprocessing.shared_memory``). Every other process
+on the host, such as other notebook kernels or doit tasks, attaches to the
+segment and builds its table directly on the shared pages instead of holding a
+private copy.
+
+Segments are named after the parquet file's resolved path, mtime and size, so
+a rewritten file gets a new segment and stale ones are never served. Segments
+outlive the process that created them. A small registry directory records the
+source of each segment, and each attached process leaves a reference file
+there, which is removed when the process exits, so ``shm_list`` can report how
+many live processes use a segment and ``shm_evict`` can remove unused ones.
+Evicting a segment that is still attached is safe: the memory is released when
+the last process detaches.
+
+The registry lives in ``{tempdir}/chartbook_shm_{user}``. Set the
+``CHARTBOOK_SHM_DIR`` setting to use another directory.
+
+``multiprocessing.shared_memory`` is imported, and the exit hook that removes
+this process's reference files is registered, on the first shared load only.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from chartbook.data._atomic import atomic_path
+from chartbook.data._cache import file_signature
+from chartbook.data._dataset import read_table
+from chartbook.settings import config, get_user_temp_dir
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+SEGMENT_PREFIX = "cb_"
+_MAGIC = b"CBSHM001"
+# magic, ready flag, IPC length; padded so the IPC data is 64-byte aligned
+_HEADER = struct.Struct("<8sQQ")
+_HEADER_SIZE = 64
+_READY = 1
+# Seconds a registry entry may wait for its creator to create the segment
+_PENDING_TIMEOUT = 600
+
+# Segments attached by this process: name -> (segment, table)
+_attached: dict[str, tuple[SharedMemory, object]] = {}
+_attached_lock = threading.RLock()
+_exit_hook_registered = False
+
+
+@dataclass
+class SharedSegment:
+    """A shared memory segment holding a decoded dataframe, as listed by ``shm_list``."""
+
+    name: str
+    source: Path
+    nbytes: int
+    created: datetime
+    refcount: int
+    stale: bool
+
+
+@functools.cache
+def _segment_type() -> type:
+    """Return the ``SharedMemory`` subclass used for segments, defining it on first use."""
+    from multiprocessing import shared_memory
+
+    class _Segment(shared_memory.SharedMemory):
+        """A shared memory segment that is not unlinked when this process exits.
+
+        The standard resource tracker unlinks every segment a process created or
+        attached to when it exits, which would defeat sharing across processes.
+        """
+
+        def __init__(self, name: str, create: bool = False, size: int = 0):
+            if sys.version_info >= (3, 13):
+                super().__init__(name, create=create, size=size, track=False)
+                return
+            super().__init__(name, create=create, size=size)
+            if os.name == "posix":
+                from multiprocessing import resource_tracker
+
+                resource_tracker.unregister(self._name, "shared_memory")
+
+        def __del__(self):
+            try:
+                self.close()
+            except BufferError:
+                # Arrow buffers still point into the mapping; it is unmapped when they are freed
+                pass
+
+    return _Segment
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> SharedMemory:
+    """Open segment ``name``, or create it with ``size`` bytes if ``create``."""
+    return _segment_type()(name, create=create, size=size)
+
+
+def get_registry_dir() -> Path:
+    """Return the directory that records shared segments and their users."""
+    registry_dir = config("CHARTBOOK_SHM_DIR", default=None)
+    if registry_dir is not None:
+        return Path(registry_dir)
+    return get_user_temp_dir("chartbook_shm")
+
+
+def segment_name(path: Path) -> str:
+    """Return the segment name for the current version of the parquet data at ``path``."""
+    path = Path(path).resolve()
+    mtime_ns, size = file_signature(path)
+    digest = hashlib.sha256(f"{path}\0{mtime_ns}\0{size}".encode()).hexdigest()
+    # POSIX shared memory names are limited to 31 characters on macOS
+    return SEGMENT_PREFIX + digest[:24]
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return whether a process with id ``pid`` is running."""
+    if os.name != "posix":
+        # os.kill would terminate the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _reference_path(registry_dir: Path, name: str, pid: int) -> Path:
+    return registry_dir / f"{name}.{pid}.ref"
+
+
+def _add_reference(name: str) -> None:
+    """Record that this process uses segment ``name``."""
+    global _exit_hook_registered
+    if not _exit_hook_registered:
+        import atexit
+
+        atexit.register(_release_references)
+        _exit_hook_registered = True
+    registry_dir = get_registry_dir()
+    registry_dir.mkdir(parents=True, exist_ok=True)
+    _reference_path(registry_dir, name, os.getpid()).touch()
+
+
+def _release_references() -> None:
+    """Remove the reference files of this process."""
+    with _attached_lock:
+        names = list(_attached)
+    if not names:
+        return
+    registry_dir = get_registry_dir()
+    for name in names:
+        _reference_path(registry_dir, name, os.getpid()).unlink(missing_ok=True)
+
+
+def _read_segment(segment: SharedMemory):
+    """Return the table stored in ``segment``, or None if it is not completely written."""
+    import pyarrow as pa
+
+    magic, ready, length = _HEADER.unpack_from(segment.buf)
+    if magic != _MAGIC or ready != _READY:
+        return None
+    buffer = pa.py_buffer(segment.buf).slice(_HEADER_SIZE, length)
+    return pa.ipc.open_file(buffer).read_all()
+
+
+def _write_segment(name: str, table, source: Path) -> SharedMemory:
+    """Create segment ``name`` and write ``table``, read from ``source``, into it as Arrow IPC.
+
+    The registry entry is written before the segment is created, so a process
+    that dies in between leaves an entry that ``shm_list`` cleans up rather
+    than a segment nothing refers to.
+
+    :raises FileExistsError: If another process created the segment first.
+    """
+    import pyarrow as pa
+
+    options = pa.ipc.IpcWriteOptions(compression=None)
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_file(mock, table.schema, options=options) as writer:
+        writer.write_table(table)
+    length = mock.size()
+
+    _write_entry(name, source, _HEADER_SIZE + length)
+    try:
+        segment = _open_segment(name, create=True, size=_HEADER_SIZE + length)
+    except FileExistsError:
+        # The segment is in use, so the entry describes it correctly
+        raise
+    except BaseException:
+        (get_registry_dir() / f"{name}.json").unlink(missing_ok=True)
+        raise
+    try:
+        sink = pa.FixedSizeBufferWriter(
+            pa.py_buffer(segment.buf[_HEADER_SIZE : _HEADER_SIZE + length])
+        )
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        # Readers ignore the segment until the ready flag is set
+        _HEADER.pack_into(segment.buf, 0, _MAGIC, _READY, length)
+    except BaseException:
+        _remove_entry(get_registry_dir(), name)
+        raise
+    return segment
+
+
+def _write_entry(name: str, source: Path, nbytes: int) -> None:
+    """Record segment ``name`` in the registry."""
+    registry_dir = get_registry_dir()
+    registry_dir.mkdir(parents=True, exist_ok=True)
+    mtime_ns, size = file_signature(source)
+    entry = {
+        "name": name,
+        "source": source.as_posix(),
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "nbytes": nbytes,
+        "created": time.time(),
+        "pid": os.getpid(),
+    }
+    with atomic_path(registry_dir / f"{name}.json") as temp_path:
+        temp_path.write_text(json.dumps(entry, indent=1))
+
+
+def shared_table(path: Path):
+    """Return the parquet data at ``path`` as a ``pyarrow.Table`` in shared memory.
+
+    The table is taken from this process's attached segments, then from an
+    existing segment created by another process, and otherwise read from
+    parquet and written to a new segment. If another process is still writing
+    the segment, the parquet data is read privately instead of waiting.
+    """
+    path = Path(path).resolve()
+    name = segment_name(path)
+    with _attached_lock:
+        attached = _attached.get(name)
+        if attached is not None:
+            return attached[1]
+
+        try:
+            segment = _open_segment(name)
+        except FileNotFoundError:
+            segment = None
+
+        if segment is None:
+            table = read_table(path).combine_chunks()
+            try:
+                segment = _write_segment(name, table, path)
+            except FileExistsError:
+                # Another process created it first
+                segment = _open_segment(name)
+            else:
+                _evict_unused_versions(path, keep=name)
+
+        table = _read_segment(segment)
+        if table is None:
+            segment.close()
+            return read_table(path)
+        _attached[name] = (segment, table)
+        _add_reference(name)
+        return table
+
+
+def _unlink_segment(name: str) -> bool:
+    """Unlink segment ``name``; return whether it existed."""
+    try:
+        # A tracked handle, so unlink() also clears it from the resource tracker
+        from multiprocessing import shared_memory
+
+        segment = shared_memory.SharedMemory(name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    segment.unlink()
+    return True
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        segment = _open_segment(name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+def _live_references(registry_dir: Path, name: str) -> int:
+    """Count the live processes using segment ``name``, pruning dead ones."""
+    count = 0
+    for reference in registry_dir.glob(f"{name}.*.ref"):
+        pid = int(reference.name.split(".")[1])
+        if _pid_alive(pid):
+            count += 1
+        else:
+            reference.unlink(missing_ok=True)
+    return count
+
+
+def _is_pending(entry: dict) -> bool:
+    """Return whether the segment of a registry entry may still be about to be created."""
+    return (
+        _pid_alive(entry["pid"]) and time.time() - entry["created"] < _PENDING_TIMEOUT
+    )
+
+
+def _is_stale(entry: dict) -> bool:
+    """Return whether the source of a registry entry changed or disappeared."""
+    try:
+        signature = file_signature(Path(entry["source"]))
+    except OSError:
+        return True
+    return signature != (entry["mtime_ns"], entry["size"])
+
+
+def _remove_entry(registry_dir: Path, name: str) -> None:
+    """Unlink segment ``name`` and forget it in the registry."""
+    _unlink_segment(name)
+    (registry_dir / f"{name}.json").unlink(missing_ok=True)
+    for reference in registry_dir.glob(f"{name}.*.ref"):
+        reference.unlink(missing_ok=True)
+    with _attached_lock:
+        # Tables already returned stay valid until they are freed
+        _attached.pop(name, None)
+
+
+def _read_entries(registry_dir: Path) -> list[dict]:
+    entries = []
+    for entry_path in sorted(registry_dir.glob(f"{SEGMENT_PREFIX}*.json")):
+        try:
+            entries.append(json.loads(entry_path.read_text()))
+        except (OSError, ValueError):
+            continue
+    return entries
+
+
+def _evict_unused_versions(source: Path, keep: str) -> None:
+    """Evict segments of older versions of ``source`` that no process uses."""
+    registry_dir = get_registry_dir()
+    for entry in _read_entries(registry_dir):
+        if (
+            entry["name"] != keep
+            and entry["source"] == source.as_posix()
+            and _live_references(registry_dir, entry["name"]) == 0
+        ):
+            _remove_entry(registry_dir, entry["name"])
+
+
+def shm_list() -> list[SharedSegment]:
+    """List the shared memory segments created by ``load(..., shared=True)``.
+
+    Registry entries whose segment no longer exists (for example, after a
+    reboot, or when the process creating it died) are removed. Segments that
+    another process is about to create are not listed yet.
+
+    :returns: The segments, with the number of live processes attached to each and
+        whether their source file has changed since they were created.
+    :rtype: list[SharedSegment]
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    for segment in cb.data.shm_list():
+        print(segment.name, segment.source, segment.nbytes, segment.refcount)
+    ```
+    """
+    registry_dir = get_registry_dir()
+    segments = []
+    for entry in _read_entries(registry_dir):
+        if not _segment_exists(entry["name"]):
+            if not _is_pending(entry):
+                _remove_entry(registry_dir, entry["name"])
+            continue
+        segments.append(
+            SharedSegment(
+                name=entry["name"],
+                source=Path(entry["source"]),
+                nbytes=entry["nbytes"],
+                created=datetime.fromtimestamp(entry["created"]),
+                refcount=_live_references(registry_dir, entry["name"]),
+                stale=_is_stale(entry),
+            )
+        )
+    return segments
+
+
+def shm_evict(
+    names: list[str] | None = None, stale: bool = False, force: bool = False
+) -> list[str]:
+    """Remove shared memory segments created by ``load(..., shared=True)``.
+
+    Processes that are attached to an evicted segment keep their data; the
+    memory is released when the last of them exits. Later loads create a new
+    segment.
+
+    :param names: The segments to evict. If None, all segments are considered.
+    :type names: Optional[list[str]]
+    :param stale: Only evict segments whose source file changed or was removed.
+    :type stale: bool
+    :param force: Also evict segments that live processes are attached to.
+    :type force: bool
+    :returns: The names of the evicted segments.
+    :rtype: list[str]
+
+    **Examples**
+
+    ```python
+    import chartbook as cb
+    cb.data.shm_evict(stale=True)  # drop segments of rewritten files
+    cb.data.shm_evict(force=True)  # drop everything
+    ```
+    """
+    registry_dir = get_registry_dir()
+    evicted = []
+    for segment in shm_list():
+        if names is not None and segment.name not in names:
+            continue
+        if stale and not segment.stale:
+            continue
+        if segment.refcount and not force:
+            continue
+        _remove_entry(registry_dir, segment.name)
+        evicted.append(segment.name)
+    return evicted
@@ -0,0 +1,99 @@
+"""Memory-mapped Arrow IPC sidecars for frequently loaded parquet files.
+
+A sidecar is an uncompressed Arrow IPC file written next to the parquet file
+(``rates.parquet`` -> ``rates.arrow``; a partitioned directory ``rates/`` also
+gets ``rates.arrow``). Opening it with a memory map avoids
+decompressing and decoding parquet on every load, and lets several processes
+share the same pages of the OS page cache. The parquet file's mtime and size
+are stored in the sidecar's schema metadata so that a stale sidecar is rebuilt.
+"""
+
+from __future__ import annotations
+
+import warnings
+from pathlib import Path
+
+from chartbook.data._atomic import atomic_path
+from chartbook.data._cache import file_signature
+from chartbook.data._dataset import read_table
+
+SIDECAR_SUFFIX = ".arrow"
+_SOURCE_MTIME_KEY = b"chartbook.source_mtime_ns"
+_SOURCE_SIZE_KEY = b"chartbook.source_size"
+
+
+def get_sidecar_path(parquet_path: Path) -> Path:
+    """Return the sidecar path for ``parquet_path``."""
+    return Path(parquet_path).with_suffix(SIDECAR_SUFFIX)
+
+
+def _matches_source(metadata: dict | None, parquet_path: Path) -> bool:
+    """Return whether sidecar schema metadata records the current parquet file."""
+    metadata = metadata or {}
+    mtime_ns, size = file_signature(parquet_path)
+    return metadata.get(_SOURCE_MTIME_KEY) == str(mtime_ns).encode() and (
+        metadata.get(_SOURCE_SIZE_KEY) == str(size).encode()
+    )
+
+
+def write_sidecar(parquet_path: Path) -> Path:
+    """Write an uncompressed Arrow IPC sidecar for ``parquet_path``.
+
+    The file is replaced with ``atomic_path``.
+
+    :param parquet_path: Path to the source parquet file.
+    :returns: The path of the sidecar.
+    """
+    import pyarrow as pa
+
+    parquet_path = Path(parquet_path)
+    sidecar_path = get_sidecar_path(parquet_path)
+
+    mtime_ns, size = file_signature(parquet_path)
+    table = read_table(parquet_path)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_SOURCE_MTIME_KEY] = str(mtime_ns).encode()
+    metadata[_SOURCE_SIZE_KEY] = str(size).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    with atomic_path(sidecar_path) as temp_path:
+        with pa.OSFile(str(temp_path), "wb") as sink:
+            with pa.ipc.new_file(
+                sink, table.schema, options=pa.ipc.IpcWriteOptions(compression=None)
+            ) as writer:
+                writer.write_table(table)
+    return sidecar_path
+
+
+def is_sidecar_fresh(parquet_path: Path) -> bool:
+    """Return whether the sidecar exists and matches the current parquet file."""
+    import pyarrow as pa
+
+    sidecar_path = get_sidecar_path(parquet_path)
+    if not sidecar_path.is_file():
+        return False
+    try:
+        schema = pa.ipc.open_file(pa.memory_map(str(sidecar_path), "r")).schema
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return _matches_source(schema.metadata, parquet_path)
+
+
+def ensure_sidecar(parquet_path: Path) -> Path | None:
+    """Return the sidecar for ``parquet_path``, building it if missing or stale.
+
+    If the sidecar cannot be written (for example, the data directory is
+    read-only), a warning is issued and None is returned so the caller can fall
+    back to reading parquet directly.
+    """
+    if is_sidecar_fresh(parquet_path):
+        return get_sidecar_path(parquet_path)
+    try:
+        return write_sidecar(parquet_path)
+    except OSError as e:
+        warnings.warn(
+            f"Could not write Arrow sidecar for {parquet_path}: {e}. "
+            "Reading parquet directly.",
+            UserWarning,
+        )
+        return None
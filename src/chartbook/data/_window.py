@@ -0,0 +1,161 @@
+"""Date windows for ``chartbook.data.load`` on a dataframe's declared date column."""
+
+import calendar
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+from chartbook.data._dataset import read_schema, read_table
+from chartbook.data._filters import _coerce_value
+from chartbook.data._index import lookup_entry
+
+# date_col values that mean a dataframe has no date column
+_NO_DATE_COL = ("", "NA", "N/A")
+
+_LAST_PATTERN = re.compile(r"^\s*(\d+)\s*(h|d|w|mo|y)\s*$")
+
+
+def _manifest_dataframe(pipeline_id: str, dataframe_id: str) -> dict:
+    """Return a dataframe's section of the current project's ``chartbook.toml``, or {}."""
+    import tomli
+
+    from chartbook.settings import get_project_root
+
+    chartbook_toml_path = get_project_root() / "chartbook.toml"
+    try:
+        with open(chartbook_toml_path, "rb") as file:
+            raw_manifest = tomli.load(file)
+    except (OSError, tomli.TOMLDecodeError):
+        return {}
+    if raw_manifest.get("pipeline", {}).get("id") != pipeline_id:
+        return {}
+    return raw_manifest.get("dataframes", {}).get(dataframe_id, {})
+
+
+def resolve_date_col(
+    pipeline_id: str, dataframe_id: str, date_col: Optional[str] = None
+) -> str:
+    """Return the date column to use for date filters on a dataframe.
+
+    An explicit ``date_col`` wins. Otherwise the ``date_col`` declared for the
+    dataframe in ``chartbook.toml`` is used, looked up in the dataframe index
+    and then in the current project's manifest, and finally "date".
+
+    :raises ValueError: If the manifest declares that the dataframe has no date column.
+    """
+    if date_col is not None:
+        return date_col
+
+    entry = lookup_entry(pipeline_id, dataframe_id)
+    if entry is not None and entry.get("date_col") is not None:
+        date_col = entry["date_col"]
+    else:
+        date_col = _manifest_dataframe(pipeline_id, dataframe_id).get("date_col")
+
+    if date_col is None:
+        return "date"
+    if date_col in _NO_DATE_COL:
+        raise ValueError(
+            f"Dataframe {pipeline_id}:{dataframe_id} has no date column "
+            f"(date_col = {date_col!r} in chartbook.toml). Pass date_col explicitly."
+        )
+    return date_col
+
+
+def _subtract_months(value, months: int):
+    """Subtract calendar months, clamping the day to the end of the month."""
+    month_index = value.year * 12 + value.month - 1 - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def window_start(end, last: Union[str, int, timedelta]):
+    """Return the exclusive start of a window of length ``last`` ending at ``end``.
+
+    :param end: The last date or timestamp of the window.
+    :param last: A ``timedelta``, a number of days, or a string such as "36h",
+        "90d", "12w", "6mo" or "5y".
+    """
+    if isinstance(last, bool):
+        raise ValueError(f"Invalid last: {last!r}")
+    if isinstance(last, timedelta):
+        return end - last
+    if isinstance(last, int):
+        return end - timedelta(days=last)
+
+    match = _LAST_PATTERN.match(last) if isinstance(last, str) else None
+    if match is None:
+        raise ValueError(
+            f"Invalid last: {last!r}. Use a timedelta, a number of days or a string "
+            "such as '36h', '90d', '12w', '6mo' or '5y'."
+        )
+    amount, unit = int(match.group(1)), match.group(2)
+    if unit == "h":
+        return end - timedelta(hours=amount)
+    if unit == "d":
+        return end - timedelta(days=amount)
+    if unit == "w":
+        return end - timedelta(weeks=amount)
+    if unit == "mo":
+        return _subtract_months(end, amount)
+    return _subtract_months(end, 12 * amount)
+
+
+def latest_date(path: Path, date_col: str):
+    """Return the latest value of ``date_col``, from parquet statistics if possible."""
+    from chartbook.data._info import read_info
+
+    latest = read_info(path).columns[date_col].max
+    if latest is None:
+        # Statistics are missing, e.g. for a partition key; read just this column
+        import pyarrow.compute as pc
+
+        latest = pc.max(read_table(path, columns=[date_col])[date_col]).as_py()
+    return latest
+
+
+def date_window_filters(
+    path: Path,
+    date_col: str,
+    since=None,
+    until=None,
+    last: Union[str, int, timedelta, None] = None,
+) -> list:
+    """Translate ``since``, ``until`` and ``last`` into ``(column, op, value)`` filters.
+
+    ``since`` and ``until`` are inclusive bounds. ``last`` selects the rows after
+    ``end - last`` up to and including ``end``, where ``end`` is ``until`` or,
+    if ``until`` is not given, the latest date in the dataframe, read from the
+    parquet statistics. If the dataframe has no dates, the filters match no rows.
+
+    :raises ValueError: If ``since`` and ``last`` are both given.
+    :raises KeyError: If the dataframe has no column ``date_col``.
+    """
+    schema = read_schema(path)
+    if date_col not in schema.names:
+        raise KeyError(f"Date column not found in dataframe: {date_col!r}")
+    date_type = schema.field(date_col).type
+
+    terms = []
+    if last is None:
+        if since is not None:
+            terms.append((date_col, ">=", since))
+        if until is not None:
+            terms.append((date_col, "<=", until))
+        return terms
+
+    if since is not None:
+        raise ValueError("since and last cannot be combined")
+    end = until if until is not None else latest_date(path, date_col)
+    if end is None:
+        # No dates at all, so the window is empty
+        return [(date_col, "in", [])]
+    end = _coerce_value(end, date_type)
+    if not isinstance(end, date):
+        raise ValueError(
+            f"last requires a date or timestamp column, but {date_col!r} has type {date_type}"
+        )
+    return [(date_col, ">", window_start(end, last)), (date_col, "<=", end)]
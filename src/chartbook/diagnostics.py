@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from chartbook.manifest import get_pipeline_ids, get_pipeline_manifest
+from chartbook.model import Catalog
 
 PIPELINE_FIELDS: list[str] = [
     "id",
@@ -149,68 +149,71 @@ def _build_page_link(object_type: str, identifier: str, pipeline_id: str) -> str
         return ""
 
 
-def build_diagnostics(manifest: dict[str, Any]) -> list[DiagnosticRow]:
-    """Generate diagnostics rows for all pipelines, dataframes, and charts."""
+def build_diagnostics(
+    manifest: dict[str, Any], catalog: Catalog | None = None
+) -> list[DiagnosticRow]:
+    """Generate diagnostics rows for all pipelines, dataframes, and charts.
+
+    ``catalog`` is the object model of ``manifest``; it is built if not given.
+    """
 
     diagnostics: list[DiagnosticRow] = []
-    pipeline_ids = get_pipeline_ids(manifest)
+    if catalog is None:
+        catalog = Catalog.from_manifest(manifest)
 
-    for pipeline_id in pipeline_ids:
-        pipeline_manifest = get_pipeline_manifest(manifest, pipeline_id)
-        pipeline_meta = pipeline_manifest.get("pipeline", {})
+    for pipeline in catalog.pipelines.values():
+        pipeline_meta = pipeline.manifest.get("pipeline", {})
 
         pipeline_missing = _collect_missing_fields(pipeline_meta, PIPELINE_FIELDS)
         diagnostics.append(
             DiagnosticRow(
                 object_type="pipeline",
-                object_name=pipeline_meta.get("pipeline_name", pipeline_id),
+                object_name=pipeline.name,
                 metadata_complete=len(pipeline_missing) == 0,
-                identifier=pipeline_id,
-                pipeline_id=pipeline_id,
+                identifier=pipeline.id,
+                pipeline_id=pipeline.id,
                 missing_fields=", ".join(pipeline_missing),
-                page_link=_build_page_link("pipeline", pipeline_id, pipeline_id),
+                page_link=_build_page_link("pipeline", pipeline.id, pipeline.id),
             )
         )
 
-        dataframes = pipeline_manifest.get("dataframes", {})
-        for dataframe_id, dataframe_meta in dataframes.items():
+        for dataframe in pipeline.dataframes.values():
             dataframe_missing = _collect_missing_fields(
-                dataframe_meta, DATAFRAME_FIELDS
+                dataframe.manifest, DATAFRAME_FIELDS
             )
             # Check mutually exclusive doc fields
             dataframe_missing.extend(
                 _check_mutually_exclusive_doc_fields(
-                    dataframe_meta, DATAFRAME_DOCS_FIELDS
+                    dataframe.manifest, DATAFRAME_DOCS_FIELDS
                 )
             )
             diagnostics.append(
                 DiagnosticRow(
                     object_type="dataframe",
-                    object_name=dataframe_meta.get("dataframe_name", dataframe_id),
+                    object_name=dataframe.name,
                     metadata_complete=len(dataframe_missing) == 0,
-                    identifier=dataframe_id,
-                    pipeline_id=pipeline_id,
+                    identifier=dataframe.id,
+                    pipeline_id=pipeline.id,
                     missing_fields=", ".join(dataframe_missing),
-                    page_link=_build_page_link("dataframe", dataframe_id, pipeline_id),
+                    page_link=_build_page_link("dataframe", dataframe.id, pipeline.id),
                 )
             )
 
-        charts = pipeline_manifest.get("charts", {})
-        for chart_id, chart_meta in charts.items():
-            chart_missing = _collect_missing_fields(chart_meta, CHART_FIELDS)
+        for chart in pipeline.charts.values():
+            chart_missing = _collect_missing_fields(chart.manifest, CHART_FIELDS)
             # Check mutually exclusive doc fields
             chart_missing.extend(
-                _check_mutually_exclusive_doc_fields(chart_meta, CHART_DOCS_FIELDS)
+                _check_mutually_exclusive_doc_fields(chart.manifest, CHART_DOCS_FIELDS)
             )
             diagnostics.append(
                 DiagnosticRow(
                     object_type="chart",
-                    object_name=chart_meta.get("chart_name", chart_id),
+                    object_name=chart.name,
                     metadata_complete=len(chart_missing) == 0,
-                    identifier=chart_id,
-                    pipeline_id=pipeline_id,
+                    identifier=chart.id,
+                    pipeline_id=pipeline.id,
                     missing_fields=", ".join(chart_missing),
-                    page_link=_build_page_link("chart", chart_id, pipeline_id),
+                    page_link=_build_page_link("chart", chart.id, pipeline.id),
                 )
             )
 
@@ -248,11 +251,11 @@ def write_diagnostics_csv(diagnostics: list[DiagnosticRow], output_path: Path) -
 
 
 def generate_metadata_diagnostics(
-    manifest: dict[str, Any], docs_build_dir: Path
+    manifest: dict[str, Any], docs_build_dir: Path, catalog: Catalog | None = None
 ) -> Path:
     """Create the metadata diagnostics CSV file inside the docs build directory."""
 
-    diagnostics = build_diagnostics(manifest)
+    diagnostics = build_diagnostics(manifest, catalog=catalog)
     diagnostics_dir = docs_build_dir / "_static" / "diagnostics"
     diagnostics_path = diagnostics_dir / "chartbook_metadata_diagnostics.csv"
     write_diagnostics_csv(diagnostics, diagnostics_path)
@@ -105,6 +105,27 @@ class ValidationError(Exception):
         )
 
 
+class CatalogLoadError(ValueError):
+    """Raised when one or more pipelines of a catalog fail to load.
+
+    Attributes:
+        catalog_path: Path to the catalog's chartbook.toml.
+        errors: The error raised by each failing pipeline, by pipeline ID,
+            in catalog order.
+    """
+
+    def __init__(self, catalog_path: Path, errors: dict):
+        self.catalog_path = catalog_path
+        self.errors = errors
+        details = "\n".join(
+            f"  {pipeline_id}: {error}" for pipeline_id, error in errors.items()
+        )
+        super().__init__(
+            f"Failed to load {len(errors)} pipeline(s) of catalog "
+            f"{catalog_path}:\n{details}"
+        )
+
+
 def handle_validation_error(error: ValidationError, config_path: Path) -> None:
     """Handle validation error with user-friendly output.
 
@@ -1,8 +1,13 @@
+import copy
+import fnmatch
 import importlib.resources
+import json
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import tomli
 from packaging import version  # Add this import for proper version comparison
@@ -16,6 +21,23 @@ PUBLISH_DIR = Path("./_output/to_be_published")
 DOCS_BUILD_DIR = BASE_DIR / Path("_docs")
 DOCS_SRC_DIR = BASE_DIR / Path("_docs_src")
 
+# File and directory names never considered source files
+DEFAULT_SOURCE_IGNORE = (".git", "__pycache__", ".ipynb_checkpoints")
+_SOURCE_INDEX_VERSION = 2
+
+MANIFEST_SNAPSHOT_FILENAME = "chartbook_manifest.pickle"
+SOURCE_INDEX_FILENAME = "chartbook_source_index.json"
+_MANIFEST_SNAPSHOT_VERSION = 2
+
+# Maximum number of threads loading the sub-pipelines of a catalog
+CATALOG_LOAD_WORKERS = 16
+
+# Loaded manifests: (resolved chartbook.toml path, base_dir) -> (dependencies, signature, manifest)
+_manifest_cache: dict = {}
+# The Catalog of each memoized manifest, under the same keys
+_catalog_cache: dict = {}
+_manifest_cache_lock = threading.Lock()
+
 DEFAULT_CONFIG = {
     "config": {
         "type": "pipeline",
@@ -87,18 +109,24 @@ def validate_config_file(path: Path = BASE_DIR) -> bool:
     """
     Validates that a chartbook.toml file exists in the specified directory.
     """
+    _read_config_file(path)
+    return True
+
+
+def _read_config_file(path: Path) -> dict:
+    """Parse and validate the chartbook.toml in ``path``, reading it once."""
     chartbook_toml = path / "chartbook.toml"
     if not chartbook_toml.is_file():
         raise ValueError(f"No chartbook.toml found in directory: {path}")
     # Test ability to load chartbook.toml
     try:
         with open(chartbook_toml, "rb") as f:
-            chartbook_toml = tomli.load(f)
-        assert chartbook_toml["config"]["type"] in ["pipeline", "catalog"]
+            raw_manifest = tomli.load(f)
+        assert raw_manifest["config"]["type"] in ["pipeline", "catalog"]
 
         current_version = __version__  # Use imported version
         expected_minor_version = version.parse(current_version).minor
-        actual_version_str = chartbook_toml["config"].get(
+        actual_version_str = raw_manifest["config"].get(
             "chartbook_format_version", "0.0.0"
         )  # Handle missing key
         # Check if the actual version string is parseable
@@ -117,7 +145,7 @@ def validate_config_file(path: Path = BASE_DIR) -> bool:
         raise ValueError(f"Missing key in chartbook.toml: {e}")
     except Exception as e:
         raise ValueError(f"Error loading chartbook.toml: {e}")
-    return True
+    return raw_manifest
 
 
 def validate_os_compatibility(value: Union[str, list]) -> Union[str, list]:
@@ -236,7 +264,7 @@ def _load_pipeline_manifest(raw_manifest):
         )
 
     source_last_modified_date = find_latest_source_modification(
-        base_dir
+        base_dir, ignore=manifest.get("pipeline", {}).get("source_ignore")
     )  # Get the last modified date
     manifest["source_last_modified_date"] = source_last_modified_date.strftime(
         "%Y-%m-%d %H:%M:%S"
@@ -259,12 +287,7 @@ def _load_pipeline_manifest(raw_manifest):
                 Path(base_dir) / note_manifest["path_to_markdown_file"]
             )
 
-    # Create a mapping of dataframe_id to linked chart_ids
     if "dataframes" in manifest:
-        dataframe_to_charts = {
-            dataframe_id: [] for dataframe_id in manifest["dataframes"]
-        }  # Initialize mapping
-
         for dataframe_id in manifest["dataframes"]:
             dataframe_manifest = manifest["dataframes"][dataframe_id]
             dataframe_manifest["dataframe_path"] = (
@@ -306,67 +329,306 @@ def _load_pipeline_manifest(raw_manifest):
                 )
                 chart_manifest["_doc_mode"] = doc_mode
                 chart_manifest["_doc_value"] = doc_value
-
-                dataframe_id = chart_manifest[
-                    "dataframe_id"
-                ]  # Identify the linked dataframe
-                if dataframe_id in dataframe_to_charts:
-                    dataframe_to_charts[dataframe_id].append(
-                        chart_id
-                    )  # Link chart_id to dataframe_id
-                else:
-                    raise ValueError(
-                        f"Dataframe {dataframe_id} not found in dataframes section"
-                    )
-
-            # Update dataframe_manifest with the linked charts
-            for dataframe_id, chart_ids in dataframe_to_charts.items():
-                manifest["dataframes"][dataframe_id]["linked_charts"] = (
-                    chart_ids  # Add linked charts
-                )
     return manifest
 
 
 def _load_catalog_manifest(raw_manifest):
     """
     Load the catalog manifest from a TOML file and process it.
+
+    Sub-pipelines are loaded concurrently in a pool of at most
+    ``CATALOG_LOAD_WORKERS`` threads and kept in the order of the catalog.
+    Errors from all sub-pipelines are collected and raised together as a
+    ``CatalogLoadError``.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from chartbook.errors import CatalogLoadError
+
     manifest = raw_manifest.copy()
     base_dir = manifest["base_dir"]
-    all_pipelines = list(manifest["pipelines"].keys())
-    for pipeline_id in all_pipelines:
-        path_to_pipeline = manifest["pipelines"][pipeline_id]["path_to_pipeline"]
-        path_to_pipeline = resolve_platform_path(path_to_pipeline)
-        pipeline_base_dir = Path(base_dir) / path_to_pipeline
-        pipeline_base_dir = pipeline_base_dir.resolve()
-        assert validate_config_file(pipeline_base_dir)
-        sub_manifest = load_manifest(base_dir=pipeline_base_dir)
-        manifest["pipelines"][pipeline_id] = sub_manifest
-
+    errors = {}
+    pipeline_base_dirs = {}
+    for pipeline_id, pipeline_entry in manifest["pipelines"].items():
+        try:
+            path_to_pipeline = resolve_platform_path(pipeline_entry["path_to_pipeline"])
+        except (KeyError, ValueError) as e:
+            errors[pipeline_id] = e
+            continue
+        pipeline_base_dirs[pipeline_id] = (Path(base_dir) / path_to_pipeline).resolve()
+
+    if pipeline_base_dirs:
+        with ThreadPoolExecutor(
+            max_workers=min(CATALOG_LOAD_WORKERS, len(pipeline_base_dirs)),
+            thread_name_prefix="chartbook-manifest",
+        ) as executor:
+            futures = {
+                pipeline_id: executor.submit(_load_sub_pipeline, pipeline_base_dir)
+                for pipeline_id, pipeline_base_dir in pipeline_base_dirs.items()
+            }
+        for pipeline_id, future in futures.items():
+            try:
+                manifest["pipelines"][pipeline_id] = future.result()
+            except Exception as e:
+                errors[pipeline_id] = e
+
+    if errors:
+        # Report pipelines in catalog order
+        raise CatalogLoadError(
+            Path(base_dir) / "chartbook.toml",
+            {
+                pipeline_id: errors[pipeline_id]
+                for pipeline_id in manifest["pipelines"]
+                if pipeline_id in errors
+            },
+        )
     return manifest  # Return the complete manifest
 
 
-def load_manifest(base_dir=BASE_DIR):
+def _load_sub_pipeline(pipeline_base_dir: Path) -> dict:
+    """Load the manifest of a catalog's sub-pipeline."""
+    if not (pipeline_base_dir / "chartbook.toml").is_file():
+        raise ValueError(f"No chartbook.toml found in directory: {pipeline_base_dir}")
+    return load_manifest(base_dir=pipeline_base_dir)
+
+
+def _stat_signature(path: Path):
+    """Return the mtime and size of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _manifest_dependencies(manifest: dict, base_dir: Path) -> list:
+    """Return the paths whose mtimes a loaded manifest depends on.
+
+    These are the chartbook.toml files and the source tree of every
+    pipeline: ``src``, ``docs_src`` and the directories and files below them
+    recorded in the source modification index. Directory mtimes catch files
+    that are added, removed or renamed; file mtimes catch files rewritten in
+    place.
+    """
+    dependencies = [base_dir / "chartbook.toml"]
+    if manifest["config"]["type"] == "catalog":
+        for pipeline_manifest in manifest["pipelines"].values():
+            dependencies.extend(
+                _manifest_dependencies(
+                    pipeline_manifest, Path(pipeline_manifest["pipeline_base_dir"])
+                )
+            )
+    else:
+        ignore = _source_ignore(manifest.get("pipeline", {}).get("source_ignore"))
+        directories = _read_source_index(get_source_index_path(base_dir), ignore)
+        paths = [
+            os.path.abspath(base_dir / "src"),
+            os.path.abspath(base_dir / "docs_src"),
+        ]
+        for directory, (_, files, _) in directories.items():
+            paths.append(directory)
+            paths.extend(os.path.join(directory, name) for name in files)
+        dependencies.extend(Path(path) for path in dict.fromkeys(paths))
+    return dependencies
+
+
+def clear_manifest_cache() -> None:
+    """Forget all manifests memoized by ``load_manifest`` in this process."""
+    with _manifest_cache_lock:
+        _manifest_cache.clear()
+        _catalog_cache.clear()
+
+
+def discard_manifest_snapshot(base_dir: Union[str, Path] = BASE_DIR) -> bool:
+    """Remove the manifest snapshot of ``base_dir`` and forget memoized manifests.
+
+    The next ``load_manifest`` call parses the TOML files again, and the next
+    ``chartbook build`` or ``chartbook publish`` writes a new snapshot.
+
+    :returns: Whether a snapshot existed.
+    :rtype: bool
+    """
+    clear_manifest_cache()
+    snapshot_path = get_manifest_snapshot_path(base_dir)
+    existed = snapshot_path.is_file()
+    snapshot_path.unlink(missing_ok=True)
+    return existed
+
+
+def load_manifest(base_dir=BASE_DIR, cache=True):
     """Load the pipeline manifest from a TOML file and process it.
 
     This will also handle imported pipeline manifests. It
     will also create a mapping of dataframe_id to linked chart_ids
     and a mapping of data
 
+    Loaded manifests are memoized per chartbook.toml for the life of the
+    process, so a build parses and walks each pipeline once. A memoized
+    manifest is reloaded when the mtime or size of any chartbook.toml it was
+    built from, or of a pipeline's source files or directories, changes. When nothing
+    has changed since ``chartbook build`` or ``chartbook publish`` wrote a
+    manifest snapshot (see ``write_manifest_snapshot``), the snapshot is read
+    instead of the TOML files. Each call returns a separate copy that the
+    caller may modify.
+
     :param base_dir: The base directory where the chartbook.toml file is located.
     :type base_dir: Union[str, Path]
+    :param cache: Whether to use and update the memoized manifests and the snapshot.
+    :type cache: bool
     :returns: A dictionary containing the manifest for all pipelines, including linked charts for each dataframe and linked dataframes for each pipeline.
     :rtype: dict
     """
     base_dir = Path(base_dir)  # Convert base_dir to a Path object
     chartbook_toml_path = base_dir / "chartbook.toml"
     assert chartbook_toml_path.is_file()
-    assert validate_config_file(base_dir)
 
-    # Load the TOML manifest using tomli instead of json
-    with open(chartbook_toml_path, "rb") as file:  # Note: tomli requires binary mode
-        raw_manifest = tomli.load(file)  # Load the TOML manifest
+    if not cache:
+        return _load_manifest_uncached(base_dir)[0]
+    return copy.deepcopy(_cached_manifest_entry(base_dir)[2])
+
+
+def _manifest_cache_key(base_dir: Path) -> tuple:
+    """Return the key of the manifest of ``base_dir`` in the memo."""
+    return ((base_dir / "chartbook.toml").resolve(), base_dir)
+
+
+def _cached_manifest_entry(base_dir: Path) -> tuple:
+    """Return the memoized ``(dependencies, signature, manifest)`` of ``base_dir``.
+
+    The manifest is shared with the memo and must not be modified.
+    """
+    key = _manifest_cache_key(base_dir)
+    with _manifest_cache_lock:
+        cached = _manifest_cache.get(key)
+    if cached is not None:
+        dependencies, signature, _ = cached
+        if [_stat_signature(path) for path in dependencies] == signature:
+            return cached
+
+    entry = _read_manifest_snapshot(base_dir)
+    catalog = None
+    if entry is None:
+        manifest, catalog = _load_manifest_uncached(base_dir)
+        dependencies = _manifest_dependencies(manifest, base_dir)
+        signature = [_stat_signature(path) for path in dependencies]
+        entry = (dependencies, signature, manifest)
+    with _manifest_cache_lock:
+        _manifest_cache[key] = entry
+        if catalog is not None:
+            _catalog_cache[key] = catalog
+    return entry
+
+
+def _cached_catalog(base_dir: Path):
+    """Return the ``Catalog`` of the memoized manifest of ``base_dir``.
+
+    It is built once per memoized manifest, or reused from the load that
+    produced the manifest, and is shared like the manifest it references.
+    """
+    from chartbook.model import Catalog
+
+    key = _manifest_cache_key(base_dir)
+    manifest = _cached_manifest_entry(base_dir)[2]
+    with _manifest_cache_lock:
+        catalog = _catalog_cache.get(key)
+    if catalog is None or catalog.manifest is not manifest:
+        catalog = Catalog.from_manifest(manifest)
+        with _manifest_cache_lock:
+            _catalog_cache[key] = catalog
+    return catalog
+
+
+def get_manifest_snapshot_path(base_dir: Union[str, Path]) -> Path:
+    """Return the path of the manifest snapshot of the project in ``base_dir``."""
+    return Path(base_dir) / "_output" / MANIFEST_SNAPSHOT_FILENAME
 
+
+def _snapshot_origin(base_dir: Path) -> dict:
+    """Identify how ``base_dir`` was given, since manifest paths are built from it."""
+    return {
+        "base_dir": str(base_dir),
+        "cwd": None if base_dir.is_absolute() else os.getcwd(),
+    }
+
+
+def write_manifest_snapshot(base_dir: Union[str, Path] = BASE_DIR) -> Path:
+    """Write the fully resolved manifest of ``base_dir`` to its snapshot file.
+
+    The snapshot holds the processed manifest (linked charts, doc modes and
+    resolved paths included) together with the mtimes and sizes of the files
+    and directories it was built from, pickled with protocol 5. Later calls to
+    ``load_manifest`` with the same ``base_dir`` read it in a single file read
+    as long as none of those inputs changed.
+
+    :param base_dir: The base directory where the chartbook.toml file is located.
+    :type base_dir: Union[str, Path]
+    :returns: The path of the snapshot, ``{base_dir}/_output/chartbook_manifest.pickle``.
+    :rtype: Path
+    """
+    import pickle
+
+    from chartbook.data._atomic import atomic_path
+
+    base_dir = Path(base_dir)
+    dependencies, signature, manifest = _cached_manifest_entry(base_dir)
+    snapshot = {
+        "format": _MANIFEST_SNAPSHOT_VERSION,
+        "chartbook_version": __version__,
+        **_snapshot_origin(base_dir),
+        "dependencies": [str(path) for path in dependencies],
+        "signature": signature,
+        "manifest": manifest,
+    }
+    snapshot_path = get_manifest_snapshot_path(base_dir)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_path(snapshot_path) as temp_path:
+        with open(temp_path, "wb") as file:
+            pickle.dump(snapshot, file, protocol=5)
+    return snapshot_path
+
+
+def _read_manifest_snapshot(base_dir: Path) -> Optional[tuple]:
+    """Return ``(dependencies, signature, manifest)`` from an up-to-date snapshot, or None."""
+    import pickle
+
+    snapshot_path = get_manifest_snapshot_path(base_dir)
+    if not snapshot_path.is_file():
+        return None
+    try:
+        with open(snapshot_path, "rb") as file:
+            snapshot = pickle.load(file)
+    except Exception:
+        return None
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("format") != _MANIFEST_SNAPSHOT_VERSION
+        or snapshot.get("chartbook_version") != __version__
+        or any(
+            snapshot.get(name) != value
+            for name, value in _snapshot_origin(base_dir).items()
+        )
+    ):
+        return None
+    dependencies = [Path(path) for path in snapshot["dependencies"]]
+    signature = [
+        tuple(value) if value is not None else None for value in snapshot["signature"]
+    ]
+    if [_stat_signature(path) for path in dependencies] != signature:
+        return None
+    return dependencies, signature, snapshot["manifest"]
+
+
+def _load_manifest_uncached(base_dir: Path) -> tuple:
+    """Parse and process the chartbook.toml in ``base_dir``.
+
+    Charts are linked to their dataframes by building the object model, which
+    raises ValueError for a chart whose dataframe is not declared.
+
+    :returns: The manifest and its ``Catalog``.
+    """
+    from chartbook.model import Catalog
+
+    raw_manifest = _read_config_file(base_dir)
     raw_manifest["base_dir"] = base_dir
 
     if raw_manifest["config"]["type"] == "pipeline":
@@ -378,47 +640,183 @@ def load_manifest(base_dir=BASE_DIR):
             f"Invalid config type: {raw_manifest['config']['type']}. Must be 'pipeline' or 'catalog'."
         )
 
-    return manifest
+    catalog = Catalog.from_manifest(manifest)
+    for dataframe in catalog.iter_dataframes():
+        dataframe.manifest["linked_charts"] = [chart.id for chart in dataframe.charts]
+    return manifest, catalog
+
+
+def get_source_index_path(base_dir: Union[str, Path]) -> Path:
+    """Return the path of the source modification index of the pipeline in ``base_dir``.
+
+    The index is kept in the pipeline's ``_output/``, next to the manifest
+    snapshot. Set the ``CHARTBOOK_SOURCE_INDEX_DIR`` setting to keep the
+    indexes of all pipelines in another directory instead, for example when
+    pipeline directories are read-only.
+    """
+    import hashlib
+
+    from chartbook.settings import config
+
+    index_dir = config("CHARTBOOK_SOURCE_INDEX_DIR", default=None)
+    if index_dir is None:
+        return Path(base_dir) / "_output" / SOURCE_INDEX_FILENAME
+    digest = hashlib.sha256(str(Path(base_dir).resolve()).encode()).hexdigest()
+    return Path(index_dir) / f"{digest[:24]}.json"
+
+
+def _read_source_index(index_path: Path, ignore: tuple) -> dict:
+    """Return the directories recorded in a source index built with ``ignore``."""
+    try:
+        index = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != _SOURCE_INDEX_VERSION
+        or index.get("ignore") != list(ignore)
+    ):
+        return {}
+    return index.get("directories", {})
+
+
+def _write_source_index(index_path: Path, ignore: tuple, directories: dict) -> None:
+    """Persist a source index; failures only cost a rescan next time."""
+    from chartbook.data._atomic import atomic_path
+
+    index = {
+        "version": _SOURCE_INDEX_VERSION,
+        "ignore": list(ignore),
+        "directories": directories,
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(index_path) as temp_path:
+            temp_path.write_text(json.dumps(index))
+    except OSError:
+        pass
+
+
+def _scan_source_directory(
+    path: str, index: dict, scanned: dict, ignore: tuple, now_ns: int
+) -> int:
+    """Return the latest file mtime in nanoseconds under ``path``, or 0 if there are no files.
+
+    A directory whose own mtime matches ``index`` reuses its recorded file
+    names and subdirectories, and each file is stat'ed by name. Only a
+    directory whose mtime changed is listed again with ``os.scandir``.
+    Every directory visited is recorded in ``scanned``.
+    """
+    try:
+        dir_mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+    entry = index.get(path)
+    files_latest = 0
+    if entry is not None and entry[0] == dir_mtime_ns:
+        _, files, subdirs = entry
+        for name in files:
+            try:
+                files_latest = max(
+                    files_latest, os.stat(os.path.join(path, name)).st_mtime_ns
+                )
+            except OSError:
+                continue
+    else:
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for dir_entry in entries:
+                    if any(fnmatch.fnmatch(dir_entry.name, pat) for pat in ignore):
+                        continue
+                    try:
+                        if dir_entry.is_dir():
+                            # Like os.walk, symlinked directories are not followed
+                            if not dir_entry.is_symlink():
+                                subdirs.append(dir_entry.name)
+                            continue
+                        files_latest = max(files_latest, dir_entry.stat().st_mtime_ns)
+                    except OSError:
+                        continue
+                    files.append(dir_entry.name)
+        except OSError:
+            return 0
+        files.sort()
+        subdirs.sort()
+
+    # A directory changed within the last two seconds could change again
+    # without its mtime moving, so it is listed again next time
+    recorded_mtime_ns = dir_mtime_ns if now_ns - dir_mtime_ns > 2 * 10**9 else -1
+    scanned[path] = [recorded_mtime_ns, files, subdirs]
+
+    latest = files_latest
+    for name in subdirs:
+        latest = max(
+            latest,
+            _scan_source_directory(
+                os.path.join(path, name), index, scanned, ignore, now_ns
+            ),
+        )
+    return latest
+
+
+def _source_ignore(ignore: Optional[list]) -> tuple:
+    """Return ``DEFAULT_SOURCE_IGNORE`` followed by the patterns in ``ignore``."""
+    return tuple(dict.fromkeys([*DEFAULT_SOURCE_IGNORE, *(ignore or [])]))
 
 
 def find_latest_source_modification(
     base_dir: Union[str, Path],
+    ignore: Optional[list] = None,
 ) -> datetime:
     """Find the most recent modification datetime across pipeline source files.
 
+    The files under ``src/`` and ``docs_src/`` and the chartbook.toml are
+    considered. The directory tree is recorded in a persisted index (see
+    ``get_source_index_path``): every known file is stat'ed by name, but only
+    directories whose own mtime changed, because files were added, removed
+    or renamed in them, are listed again.
+
     :param base_dir: The base directory of the pipeline.
     :type base_dir: Union[str, Path]
+    :param ignore: File and directory name patterns to skip, in addition to
+        ``DEFAULT_SOURCE_IGNORE``, such as a data directory under ``src/``.
+    :type ignore: Optional[list]
     :returns: The most recent modification datetime.
     :rtype: datetime
     """
     base_dir = Path(base_dir)
+    ignore = _source_ignore(ignore)
+
+    index_path = get_source_index_path(base_dir)
+    index = _read_source_index(index_path, ignore)
+    scanned = {}
+    now_ns = time.time_ns()
+    latest_ns = max(
+        _scan_source_directory(
+            os.path.abspath(base_dir / directory), index, scanned, ignore, now_ns
+        )
+        for directory in ("src", "docs_src")
+    )
+    if scanned != index:
+        _write_source_index(index_path, ignore, scanned)
 
-    def get_latest_mod_time(directory: Path) -> datetime:
-        latest_time = datetime.min
-        for root, _, files in os.walk(directory):
-            for file in files:
-                file_path = Path(root) / file
-                mod_time = get_file_modified_datetime(file_path)
-                if mod_time > latest_time:
-                    latest_time = mod_time
-        return latest_time
-
-    # Get the most recent modification time in src directory
-    src_latest = get_latest_mod_time(base_dir / "src")
-
-    # Get modification times for dodo.py and chartbook.toml
-    # dodo_time = get_file_modified_datetime(base_dir / "dodo.py")
+    # Get the most recent modification time in src and docs_src
+    source_time = datetime.fromtimestamp(latest_ns / 1e9) if latest_ns else datetime.min
     pipeline_time = get_file_modified_datetime(base_dir / "chartbook.toml")
-    docs_time = get_latest_mod_time(base_dir / "docs_src")
 
     # Return the most recent of all these times
-    latest = max(src_latest, pipeline_time, docs_time)
-    return latest
+    return max(source_time, pipeline_time)
 
 
 def get_file_modified_datetime(file_path: Union[Path, str]) -> datetime:
     """Returns the datetime that a file was last modified.
 
+    For a directory, such as a partitioned parquet dataset, this is the most
+    recent modification time of the directory or anything inside it.
+
     :param file_path: A pathlib.Path object or a string representing the file path.
     :type file_path: Union[Path, str]
     :returns: A datetime object representing the last modification time.
@@ -427,6 +825,10 @@ def get_file_modified_datetime(file_path: Union[Path, str]) -> datetime:
     file_path = Path(file_path)
     # Get the last modified time in seconds since the epoch
     mtime = os.path.getmtime(file_path)
+    if file_path.is_dir():
+        for root, dirs, files in os.walk(file_path):
+            for name in dirs + files:
+                mtime = max(mtime, os.path.getmtime(os.path.join(root, name)))
     # Convert the time to a datetime object
     return datetime.fromtimestamp(mtime)
 
@@ -485,13 +887,14 @@ def get_pipeline_manifest(manifest: dict, pipeline_id: str) -> dict:
     :type manifest: dict
     :param pipeline_id: The ID of the pipeline to retrieve.
     :type pipeline_id: str
-    :returns: The manifest dictionary for the specified pipeline.
+    :returns: The manifest dictionary for the specified pipeline. It is part of
+        ``manifest``, not a copy.
     :rtype: dict
     """
     if manifest["config"]["type"] == "catalog":
         pipeline_manifest = manifest["pipelines"][pipeline_id]
     elif manifest["config"]["type"] == "pipeline":
-        pipeline_manifest = manifest.copy()
+        pipeline_manifest = manifest
     else:
         raise ValueError(
             f"Invalid config type: {manifest['config']['type']}. Must be 'pipeline' or 'catalog'."
@@ -13,13 +13,19 @@ from pathlib import Path
 import jinja2
 import polars as pl
 
+from chartbook.data._dataset import data_size, scan_polars
+from chartbook.data._info import read_info
 from chartbook.manifest import (
     get_file_modified_datetime,
     get_pipeline_ids,
     get_pipeline_manifest,
-    load_manifest,
 )
-from chartbook.utils import copy_according_to_plan, get_dataframe_glimpse
+from chartbook.model import Catalog, load_catalog
+from chartbook.utils import (
+    copy_according_to_plan,
+    get_dataframe_glimpse,
+    write_consolidated_parquet,
+)
 
 BASE_DIR = Path(".").resolve()
 DOCS_BUILD_DIR = BASE_DIR / Path("_docs")
@@ -27,7 +33,8 @@ DOCS_SRC_DIR = BASE_DIR / Path("_docs_src")
 
 
 def get_sphinx_file_alignment_plan(base_dir=BASE_DIR, docs_build_dir=DOCS_BUILD_DIR):
-    manifest = load_manifest(base_dir=base_dir)
+    catalog = load_catalog(base_dir=base_dir)
+    manifest = catalog.manifest
     pipeline_ids = get_pipeline_ids(manifest)
 
     dataset_plan = {}
@@ -52,33 +59,26 @@ def get_sphinx_file_alignment_plan(base_dir=BASE_DIR, docs_build_dir=DOCS_BUILD_
 
         pipeline_manifest = get_pipeline_manifest(manifest, pipeline_id)
         pipeline_base_dir = Path(pipeline_manifest["pipeline_base_dir"])
-        for dataframe_id in pipeline_manifest["dataframes"]:
-            dataframe_manifest = pipeline_manifest["dataframes"][dataframe_id]
-
-            path_to_parquet_data = dataframe_manifest["path_to_parquet_data"]
+        for dataframe in catalog.dataframes_by_pipeline(pipeline_id):
+            path_to_parquet_data = dataframe.manifest["path_to_parquet_data"]
             if (path_to_parquet_data is None) or (path_to_parquet_data == ""):
                 pass
             else:
                 file_path = pipeline_base_dir / Path(path_to_parquet_data)
                 dataset_plan[file_path] = (
-                    download_dataframe_dir / f"{dataframe_id}.parquet"
+                    download_dataframe_dir / f"{dataframe.id}.parquet"
                 )
 
-        for chart_id in pipeline_manifest["charts"]:
-            # Plan for copying HTML chart to download folder
-            chart_manifest = pipeline_manifest["charts"][chart_id]
-            path_to_html_chart = Path(chart_manifest["path_to_html_chart"])
+        for chart in catalog.charts_by_pipeline(pipeline_id):
+            path_to_html_chart = Path(chart.manifest["path_to_html_chart"])
             file_path = pipeline_base_dir / path_to_html_chart
+            # Plan for copying HTML chart to download folder
             chart_plan_download[file_path] = (
-                download_chart_dir_download / f"{chart_id}.html"
+                download_chart_dir_download / f"{chart.id}.html"
             )
-
             # Plan for copying HTML chart to _static folder for display
-            chart_manifest = pipeline_manifest["charts"][chart_id]
-            path_to_html_chart = Path(chart_manifest["path_to_html_chart"])
-            file_path = pipeline_base_dir / path_to_html_chart
             chart_plan_static[file_path] = (
-                download_chart_dir_static / f"{chart_id}.html"
+                download_chart_dir_static / f"{chart.id}.html"
             )
 
         for notebook_id in pipeline_manifest["notebooks"]:
@@ -103,6 +103,7 @@ def generate_all_pipeline_docs(
     pipeline_theme="pipeline",
     docs_src_dir=DOCS_SRC_DIR,
     size_threshold=50,
+    catalog=None,
 ):
     """
     Params
@@ -121,10 +122,15 @@ def generate_all_pipeline_docs(
         The directory containing documentation source files and templates.
     size_threshold: float
         File size threshold in MB above which to use memory-efficient loading.
+    catalog: Catalog
+        The object model of ``manifest``, such as from ``load_catalog``. It is
+        built from ``manifest`` if not given.
     """
     base_dir = Path(base_dir).resolve()
     docs_src_dir = Path(docs_src_dir)
 
+    if catalog is None:
+        catalog = Catalog.from_manifest(manifest)
     pipeline_ids = get_pipeline_ids(manifest)
 
     for pipeline_id in pipeline_ids:
@@ -139,6 +145,7 @@ def generate_all_pipeline_docs(
             pipeline_theme=pipeline_theme,
             docs_src_dir=docs_src_dir,
             size_threshold=size_threshold,
+            catalog=catalog,
         )
         pipeline_theme = pipeline_manifest["config"]["type"]
         if pipeline_theme == "catalog":
@@ -168,8 +175,7 @@ def generate_all_pipeline_docs(
                 file.write(readme_text)
 
     ## Dataframe and Pipeline List in index.md
-    table_file_map = get_dataframes_and_dataframe_docs(base_dir=base_dir)
-    dataframe_file_list = list(table_file_map.values())
+    dataframe_file_list = list(_dataframe_doc_files(catalog).values())
 
     # Get package templates directory
     package_templates_dir = get_package_templates_path()
@@ -356,10 +362,19 @@ def generate_pipeline_docs(
     pipeline_theme="pipeline",
     docs_src_dir=DOCS_SRC_DIR,
     size_threshold=50,
+    catalog=None,
 ):
-    for dataframe_id in pipeline_manifest["dataframes"]:
+    """Generate the dataframe and chart pages of one pipeline.
+
+    ``catalog`` is the ``Catalog`` the pipeline belongs to; it is built from
+    ``pipeline_manifest`` if not given.
+    """
+    if catalog is None:
+        catalog = Catalog.from_manifest(pipeline_manifest)
+
+    for dataframe in catalog.dataframes_by_pipeline(pipeline_id):
         generate_dataframe_docs(
-            dataframe_id,
+            dataframe.id,
             pipeline_id,
             pipeline_manifest,
             docs_build_dir,
@@ -369,9 +384,9 @@ def generate_pipeline_docs(
             size_threshold=size_threshold,
         )
 
-    for chart_id in pipeline_manifest["charts"]:
+    for chart in catalog.charts_by_pipeline(pipeline_id):
         generate_chart_docs(
-            chart_id,
+            chart.id,
             pipeline_id,
             pipeline_manifest,
             docs_build_dir,
@@ -538,6 +553,48 @@ def generate_dataframe_docs(
         file.write(table_page)
 
 
+def _most_recent_dates_from_footer(parquet_path, date_col):
+    """Find the most recent non-null date of each column from row group statistics.
+
+    A row group without nulls in a column holds a value on its latest date, so
+    the latest such row group gives that column's most recent date exactly. If
+    the statistics are missing or not conclusive (the latest row group with
+    values in a column also has nulls), None is returned and the data has to be
+    scanned instead.
+    """
+    parquet_info = read_info(parquet_path)
+    if date_col not in parquet_info.columns:
+        return None
+
+    most_recent_dates = []
+    for col in parquet_info.columns:
+        if col == date_col:
+            continue
+        latest_date = None
+        latest_is_exact = True
+        for row_group in parquet_info.row_groups:
+            date_stats = row_group.columns.get(date_col)
+            col_stats = row_group.columns.get(col)
+            if date_stats is None or col_stats is None:
+                return None
+            if col_stats.null_count is None:
+                return None
+            if col_stats.null_count == row_group.num_rows:
+                continue
+            if not hasattr(date_stats.max, "strftime"):
+                return None
+            if latest_date is None or date_stats.max > latest_date:
+                latest_date = date_stats.max
+                latest_is_exact = col_stats.null_count == 0
+            elif date_stats.max == latest_date and col_stats.null_count == 0:
+                latest_is_exact = True
+        if not latest_is_exact:
+            return None
+        if latest_date is not None:
+            most_recent_dates.append(latest_date)
+    return most_recent_dates
+
+
 def find_most_recent_valid_datapoints(
     parquet_path, date_col="date", size_threshold_mb=50
 ):
@@ -546,17 +603,23 @@ def find_most_recent_valid_datapoints(
         The name of the date column in the parquet file (default: "date").
     size_threshold_mb:
         File size threshold in MB above which to skip this computation (default: 50).
+        Files of any size are handled when the parquet statistics are conclusive.
     """
     if (date_col == "") or (date_col == "NA") or (date_col == "N/A"):
         return "N/A", "N/A"
 
+    # Answer from the parquet footer when its statistics are conclusive
+    dates_list = _most_recent_dates_from_footer(parquet_path, date_col)
+    if dates_list is not None:
+        return _format_date_bounds(dates_list)
+
     # Check file size - skip for large files to avoid OOM
-    file_size_mb = os.path.getsize(parquet_path) / (1024 * 1024)
+    file_size_mb = data_size(parquet_path) / (1024 * 1024)
     if file_size_mb > size_threshold_mb:
         return "N/A (large file)", "N/A (large file)"
 
-    # Read the parquet file using Polars
-    df = pl.read_parquet(parquet_path)
+    # Read the parquet file (or partitioned directory) using Polars
+    df = scan_polars(parquet_path).collect()
 
     # Ensure date_col is of datetime type for proper comparison
     if df[date_col].dtype != pl.Datetime:
@@ -573,8 +636,11 @@ def find_most_recent_valid_datapoints(
 
     # Extract the dates and filter out None values
     dates_list = [date for date in most_recent_dates.row(0) if date is not None]
+    return _format_date_bounds(dates_list)
+
 
-    # Compute min and max dates
+def _format_date_bounds(dates_list):
+    """Format the earliest and latest of ``dates_list``, or N/A if it is empty."""
     if dates_list:
         most_recent_data_min = min(dates_list).strftime("%Y-%m-%d %H:%M:%S")
         most_recent_data_max = max(dates_list).strftime("%Y-%m-%d %H:%M:%S")
@@ -701,16 +767,15 @@ def generate_chart_docs(
 
 
 def get_dataframes_and_dataframe_docs(base_dir=BASE_DIR):
-    manifest = load_manifest(base_dir=base_dir)
-    pipeline_ids = get_pipeline_ids(manifest)
+    return _dataframe_doc_files(load_catalog(base_dir=base_dir))
+
+
+def _dataframe_doc_files(catalog):
+    """Map ``pipeline_id:dataframe_id`` to the docs page of every dataframe in ``catalog``."""
     table_file_map = {}
-    for pipeline_id in pipeline_ids:
-        pipeline_manifest = get_pipeline_manifest(manifest, pipeline_id)
-        for dataframe_id in pipeline_manifest["dataframes"]:
-            filename = Path(f"{dataframe_id}.md")
-            file_path = Path("dataframes") / pipeline_id / filename
-            pipeline_dataframe_id = f"{pipeline_id}:{dataframe_id}"
-            table_file_map[pipeline_dataframe_id] = file_path.as_posix()
+    for dataframe in catalog.iter_dataframes():
+        file_path = Path("dataframes") / dataframe.pipeline_id / f"{dataframe.id}.md"
+        table_file_map[f"{dataframe.pipeline_id}:{dataframe.id}"] = file_path.as_posix()
     return table_file_map
 
 
@@ -803,7 +868,7 @@ def build_all(
     docs_build_dir.mkdir(parents=True, exist_ok=True)
 
     ## Align files for use by Sphinx
-    manifest = load_manifest(base_dir=base_dir)
+    catalog = load_catalog(base_dir=base_dir)
 
     (
         dataset_plan,
@@ -812,18 +877,33 @@ def build_all(
         notebook_plan,
     ) = get_sphinx_file_alignment_plan(base_dir=base_dir, docs_build_dir=docs_build_dir)
 
-    copy_according_to_plan(dataset_plan)
+    # Partitioned datasets are offered for download as a single parquet file
+    partitioned_plan = {
+        source: destination
+        for source, destination in dataset_plan.items()
+        if Path(source).is_dir()
+    }
+    copy_according_to_plan(
+        {
+            source: destination
+            for source, destination in dataset_plan.items()
+            if source not in partitioned_plan
+        }
+    )
+    for source, destination in partitioned_plan.items():
+        write_consolidated_parquet(source, destination)
     copy_according_to_plan(chart_plan_download)
     copy_according_to_plan(chart_plan_static)
     copy_according_to_plan(notebook_plan)
 
     generate_all_pipeline_docs(
-        manifest,
+        catalog.manifest,
         docs_build_dir=docs_build_dir,
         base_dir=base_dir,
         pipeline_theme=pipeline_theme,
         docs_src_dir=docs_src_dir,
         size_threshold=size_threshold,
+        catalog=catalog,
     )
 
     # Copy remaining docs_src files to build directory
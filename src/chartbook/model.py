@@ -0,0 +1,364 @@
+"""Typed object model of a loaded manifest.
+
+``load_manifest`` returns nested dicts, which templates and the docs build
+consume directly. ``Catalog.from_manifest`` wraps such a manifest, pipeline or
+catalog, in slotted dataclasses with the dataframe and chart links resolved
+to objects once. Every object keeps a reference to its dict in ``manifest``,
+so code that renders templates can still pass the dict view along without
+copying it.
+
+A ``Catalog`` also indexes its charts and dataframes by topic tag, data
+source and data provider. Each index is built on its first query, so
+queries such as ``charts_by_tag`` are dictionary lookups instead of scans
+over every chart, and catalogs that are never queried do not pay for them.
+
+**Examples**
+
+```python
+from chartbook.model import load_catalog
+
+catalog = load_catalog("path/to/catalog")
+for dataframe in catalog.iter_dataframes():
+    print(dataframe.pipeline_id, dataframe.id, [chart.id for chart in dataframe.charts])
+
+rate_charts = catalog.charts_by_tag("Interest Rates")
+fred_dataframes = catalog.dataframes_by_source("FRED")
+```
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from chartbook.manifest import (
+    BASE_DIR,
+    _cached_catalog,
+    _load_manifest_uncached,
+    get_pipeline_ids,
+)
+
+
+def _as_tuple(value) -> tuple:
+    """Return a manifest list field as a tuple, accepting a single string."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def _index_key(value: str) -> str:
+    """Return the key of a tag, source or provider in the reverse indexes."""
+    return str(value).strip().casefold()
+
+
+def _group(objects, attribute: str) -> tuple[dict, dict]:
+    """Group objects by each value of a tuple attribute, such as ``topic_tags``.
+
+    :returns: The objects by key, in the order given, and the first spelling of each key.
+    """
+    groups = {}
+    spellings = {}
+    for obj in objects:
+        for value in dict.fromkeys(getattr(obj, attribute)):
+            key = _index_key(value)
+            if not key:
+                continue
+            group = groups.setdefault(key, [])
+            if not group or group[-1] is not obj:
+                group.append(obj)
+            spellings.setdefault(key, str(value).strip())
+    return {key: tuple(group) for key, group in groups.items()}, spellings
+
+
+@dataclass(slots=True, eq=False)
+class Chart:
+    """A chart of a pipeline."""
+
+    id: str
+    pipeline_id: str
+    name: str
+    dataframe_id: str
+    topic_tags: tuple[str, ...]
+    data_frequency: Optional[str]
+    doc_mode: Optional[str]
+    manifest: dict = field(repr=False)
+    dataframe: Optional[Dataframe] = field(default=None, repr=False)
+
+    @classmethod
+    def from_manifest(
+        cls, chart_id: str, pipeline_id: str, chart_manifest: dict
+    ) -> Chart:
+        return cls(
+            id=chart_id,
+            pipeline_id=pipeline_id,
+            name=chart_manifest.get("chart_name", chart_id),
+            dataframe_id=chart_manifest.get("dataframe_id"),
+            topic_tags=_as_tuple(chart_manifest.get("topic_tags")),
+            data_frequency=chart_manifest.get("data_frequency"),
+            doc_mode=chart_manifest.get("_doc_mode"),
+            manifest=chart_manifest,
+        )
+
+
+@dataclass(slots=True, eq=False)
+class Dataframe:
+    """A dataframe of a pipeline, with the charts drawn from it."""
+
+    id: str
+    pipeline_id: str
+    name: str
+    path: Path
+    date_col: Optional[str]
+    resample_keys: Optional[tuple[str, ...]]
+    topic_tags: tuple[str, ...]
+    data_sources: tuple[str, ...]
+    data_providers: tuple[str, ...]
+    doc_mode: Optional[str]
+    manifest: dict = field(repr=False)
+    charts: list[Chart] = field(default_factory=list, repr=False)
+
+    @classmethod
+    def from_manifest(
+        cls, dataframe_id: str, pipeline_id: str, dataframe_manifest: dict
+    ) -> Dataframe:
+        return cls(
+            id=dataframe_id,
+            pipeline_id=pipeline_id,
+            name=dataframe_manifest.get("dataframe_name", dataframe_id),
+            path=Path(dataframe_manifest["dataframe_path"]),
+            date_col=dataframe_manifest.get("date_col"),
+            resample_keys=(
+                _as_tuple(dataframe_manifest["resample_keys"])
+                if "resample_keys" in dataframe_manifest
+                else None
+            ),
+            topic_tags=_as_tuple(dataframe_manifest.get("topic_tags")),
+            data_sources=_as_tuple(dataframe_manifest.get("data_sources")),
+            data_providers=_as_tuple(dataframe_manifest.get("data_providers")),
+            doc_mode=dataframe_manifest.get("_doc_mode"),
+            manifest=dataframe_manifest,
+        )
+
+
+@dataclass(slots=True, eq=False)
+class Note:
+    """A markdown note of a pipeline."""
+
+    id: str
+    pipeline_id: str
+    path: Path
+    manifest: dict = field(repr=False)
+
+
+@dataclass(slots=True, eq=False)
+class Pipeline:
+    """A pipeline with its dataframes, charts and notes."""
+
+    id: str
+    name: str
+    base_dir: Path
+    source_last_modified_date: Optional[str]
+    dataframes: dict[str, Dataframe] = field(repr=False)
+    charts: dict[str, Chart] = field(repr=False)
+    notes: dict[str, Note] = field(repr=False)
+    manifest: dict = field(repr=False)
+
+    @classmethod
+    def from_manifest(cls, pipeline_manifest: dict) -> Pipeline:
+        """Build a pipeline from a pipeline manifest, linking charts to dataframes.
+
+        :raises ValueError: If a chart refers to a dataframe the pipeline does not declare.
+        """
+        meta = pipeline_manifest.get("pipeline", {})
+        pipeline_id = meta["id"]
+        dataframes = {
+            dataframe_id: Dataframe.from_manifest(
+                dataframe_id, pipeline_id, dataframe_manifest
+            )
+            for dataframe_id, dataframe_manifest in pipeline_manifest.get(
+                "dataframes", {}
+            ).items()
+        }
+        charts = {}
+        for chart_id, chart_manifest in pipeline_manifest.get("charts", {}).items():
+            chart = Chart.from_manifest(chart_id, pipeline_id, chart_manifest)
+            chart.dataframe = dataframes.get(chart.dataframe_id)
+            if chart.dataframe is None:
+                raise ValueError(
+                    f"Dataframe {chart.dataframe_id} not found in dataframes section"
+                )
+            chart.dataframe.charts.append(chart)
+            charts[chart_id] = chart
+        notes = {
+            note_id: Note(
+                id=note_id,
+                pipeline_id=pipeline_id,
+                path=Path(note_manifest["full_path"]),
+                manifest=note_manifest,
+            )
+            for note_id, note_manifest in pipeline_manifest.get("notes", {}).items()
+        }
+        return cls(
+            id=pipeline_id,
+            name=meta.get("pipeline_name", pipeline_id),
+            base_dir=Path(pipeline_manifest["pipeline_base_dir"]),
+            source_last_modified_date=pipeline_manifest.get(
+                "source_last_modified_date"
+            ),
+            dataframes=dataframes,
+            charts=charts,
+            notes=notes,
+            manifest=pipeline_manifest,
+        )
+
+
+@dataclass(slots=True, eq=False)
+class Catalog:
+    """The pipelines of a catalog, or the single pipeline of a pipeline project.
+
+    ``type`` is "catalog" or "pipeline", as in the ``[config]`` section.
+    """
+
+    type: str
+    title: str
+    pipelines: dict[str, Pipeline] = field(repr=False)
+    manifest: dict = field(repr=False)
+    # Reverse indexes by (objects, attribute), built by ``_index`` on first use
+    _indexes: dict[tuple[str, str], tuple[dict, dict]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @classmethod
+    def from_manifest(cls, manifest: dict) -> Catalog:
+        """Build the object model of a manifest returned by ``load_manifest``.
+
+        The manifest dicts are referenced, not copied.
+        """
+        config_type = manifest["config"]["type"]
+        if config_type == "catalog":
+            pipelines = {
+                pipeline_id: Pipeline.from_manifest(manifest["pipelines"][pipeline_id])
+                for pipeline_id in get_pipeline_ids(manifest)
+            }
+        else:
+            pipeline = Pipeline.from_manifest(manifest)
+            pipelines = {pipeline.id: pipeline}
+        return cls(
+            type=config_type,
+            title=manifest.get("site", {}).get("title", ""),
+            pipelines=pipelines,
+            manifest=manifest,
+        )
+
+    def pipeline(self, pipeline_id: str) -> Pipeline:
+        """Return a pipeline by ID.
+
+        :raises KeyError: If the catalog has no such pipeline.
+        """
+        return self.pipelines[pipeline_id]
+
+    def dataframe(self, pipeline_id: str, dataframe_id: str) -> Dataframe:
+        """Return a dataframe by pipeline and dataframe ID.
+
+        :raises KeyError: If the catalog has no such dataframe.
+        """
+        return self.pipelines[pipeline_id].dataframes[dataframe_id]
+
+    def chart(self, pipeline_id: str, chart_id: str) -> Chart:
+        """Return a chart by pipeline and chart ID.
+
+        :raises KeyError: If the catalog has no such chart.
+        """
+        return self.pipelines[pipeline_id].charts[chart_id]
+
+    def iter_dataframes(self) -> Iterator[Dataframe]:
+        """Iterate over the dataframes of every pipeline, in manifest order."""
+        for pipeline in self.pipelines.values():
+            yield from pipeline.dataframes.values()
+
+    def iter_charts(self) -> Iterator[Chart]:
+        """Iterate over the charts of every pipeline, in manifest order."""
+        for pipeline in self.pipelines.values():
+            yield from pipeline.charts.values()
+
+    def _index(self, objects: str, attribute: str) -> tuple[dict, dict]:
+        """Return the ``_group`` index of the "charts" or "dataframes" by ``attribute``.
+
+        Each index is built on first use and kept for the life of the catalog.
+        """
+        index = self._indexes.get((objects, attribute))
+        if index is None:
+            iterate = self.iter_charts if objects == "charts" else self.iter_dataframes
+            index = _group(iterate(), attribute)
+            self._indexes[objects, attribute] = index
+        return index
+
+    def tags(self) -> tuple[str, ...]:
+        """Return the topic tags used by any chart or dataframe, sorted."""
+        spellings = dict(self._index("charts", "topic_tags")[1])
+        spellings.update(self._index("dataframes", "topic_tags")[1])
+        return tuple(sorted(spellings.values()))
+
+    def charts_by_tag(self, tag: str) -> tuple[Chart, ...]:
+        """Return the charts with topic tag ``tag`` (case-insensitive), in manifest order."""
+        return self._index("charts", "topic_tags")[0].get(_index_key(tag), ())
+
+    def dataframes_by_tag(self, tag: str) -> tuple[Dataframe, ...]:
+        """Return the dataframes with topic tag ``tag`` (case-insensitive), in manifest order."""
+        return self._index("dataframes", "topic_tags")[0].get(_index_key(tag), ())
+
+    def dataframes_by_source(self, source: str) -> tuple[Dataframe, ...]:
+        """Return the dataframes listing ``source`` in ``data_sources`` (case-insensitive)."""
+        return self._index("dataframes", "data_sources")[0].get(_index_key(source), ())
+
+    def dataframes_by_provider(self, provider: str) -> tuple[Dataframe, ...]:
+        """Return the dataframes listing ``provider`` in ``data_providers`` (case-insensitive)."""
+        return self._index("dataframes", "data_providers")[0].get(
+            _index_key(provider), ()
+        )
+
+    def charts_by_dataframe(
+        self, pipeline_id: str, dataframe_id: str
+    ) -> tuple[Chart, ...]:
+        """Return the charts drawn from a dataframe.
+
+        :raises KeyError: If the catalog has no such dataframe.
+        """
+        return tuple(self.dataframe(pipeline_id, dataframe_id).charts)
+
+    def charts_by_pipeline(self, pipeline_id: str) -> tuple[Chart, ...]:
+        """Return the charts of a pipeline.
+
+        :raises KeyError: If the catalog has no such pipeline.
+        """
+        return tuple(self.pipelines[pipeline_id].charts.values())
+
+    def dataframes_by_pipeline(self, pipeline_id: str) -> tuple[Dataframe, ...]:
+        """Return the dataframes of a pipeline.
+
+        :raises KeyError: If the catalog has no such pipeline.
+        """
+        return tuple(self.pipelines[pipeline_id].dataframes.values())
+
+
+def load_catalog(base_dir: Union[str, Path] = BASE_DIR, cache: bool = True) -> Catalog:
+    """Load a pipeline or catalog project as a ``Catalog``.
+
+    :param base_dir: The base directory where the chartbook.toml file is located.
+    :type base_dir: Union[str, Path]
+    :param cache: Whether to use the memoized manifests, as in ``load_manifest``.
+        A cached catalog is built once per memoized manifest and shared by
+        every caller, so it must not be modified; its ``manifest`` is the
+        memoized manifest itself.
+    :type cache: bool
+    :returns: The object model of the project's manifest.
+    :rtype: Catalog
+    """
+    base_dir = Path(base_dir)
+    assert (base_dir / "chartbook.toml").is_file()
+    if not cache:
+        return _load_manifest_uncached(base_dir)[1]
+    return _cached_catalog(base_dir)
@@ -8,12 +8,16 @@ from pathlib import Path
 
 import tomli_w
 
+from chartbook.data._index import get_index_path, write_index
+from chartbook.data._resample import build_pyramids
 from chartbook.manifest import (
     find_latest_source_modification,
     get_pipeline_ids,
     get_pipeline_manifest,
     load_manifest,
+    write_manifest_snapshot,
 )
+from chartbook.model import load_catalog
 from chartbook.utils import copy_according_to_plan
 
 BASE_DIR = Path(".").resolve()
@@ -156,7 +160,10 @@ def copy_publishable_pipeline_files(manifest, base_dir, publish_dir, verbose=Fal
     )
     copy_according_to_plan(pipeline_publishing_plan, mkdir=True, verbose=verbose)
 
-    src_modification_date = find_latest_source_modification(base_dir=base_dir)
+    src_modification_date = find_latest_source_modification(
+        base_dir=base_dir,
+        ignore=manifest.get("pipeline", {}).get("source_ignore"),
+    )
     create_dodo_file_with_mod_date(
         src_modification_date,
         dodo_path=base_dir / "dodo.py",
@@ -193,7 +200,9 @@ def revise_published_chartbook_toml(publish_dir: Path, base_dir: Path = BASE_DIR
         tomli_w.dump(manifest_for_toml, f)
 
 
-def publish_pipeline(publish_dir: Path, base_dir: Path, verbose=False):
+def publish_pipeline(
+    publish_dir: Path, base_dir: Path, verbose=False, pyramids: bool = False
+):
     """Publish a pipeline to a publish directory.
 
     :param publish_dir: The directory where the pipeline will be published.
@@ -202,10 +211,22 @@ def publish_pipeline(publish_dir: Path, base_dir: Path, verbose=False):
     :type base_dir: Path
     :param verbose: Whether to print messages about the publishing process. Defaults to False.
     :type verbose: bool
+    :param pyramids: Whether to write resampled versions of time-series dataframes next to their
+        parquet files, for ``chartbook.data.load(..., resample=...)``. Defaults to False.
+    :type pyramids: bool
     """
     manifest = load_manifest(base_dir=base_dir)
+    catalog = load_catalog(base_dir=base_dir)
     copy_publishable_pipeline_files(manifest, base_dir, publish_dir, verbose=verbose)
     revise_published_chartbook_toml(publish_dir)
+    index_path = write_index(manifest, get_index_path(base_dir), catalog=catalog)
+    if verbose:
+        print(f"Wrote dataframe index to {index_path}")
+    snapshot_path = write_manifest_snapshot(base_dir)
+    if verbose:
+        print(f"Wrote manifest snapshot to {snapshot_path}")
+    if pyramids:
+        build_pyramids(manifest, verbose=verbose, catalog=catalog)
 
 
 if __name__ == "__main__":
@@ -39,17 +39,19 @@ and compare to
 /path/to/other
 ```
 
+Settings are resolved lazily. Importing this module does not read
+``sys.argv``, look for the project root or load the `.env` file; that work is
+done on the first call to `config()` and memoized for the rest of the
+process. Call `clear_settings_cache()` to resolve them again.
 """
 
 import os
 import sys
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from platform import system
 
-from decouple import Config, RepositoryEnv, undefined
-from decouple import config as _config_decouple
-
 
 def find_project_root():
     """Find the project root directory using environment variables or marker files.
@@ -186,8 +188,12 @@ def find_all_caps_cli_vars(argv=sys.argv):
 
 
 def load_config():
+    """Return the decouple config, reading the `.env` file if there is one."""
+    from decouple import Config, RepositoryEnv
+    from decouple import config as _config_decouple
+
     # candidate paths: ./env then ../.env, then ../../.env
-    estimated_project_root = find_project_root()
+    estimated_project_root = get_project_root()
     candidates = [
         Path.cwd() / ".env",
         estimated_project_root / ".env",
@@ -216,18 +222,10 @@ def if_relative_make_abs(path):
     if path.is_absolute():
         abs_path = path.resolve()
     else:
-        abs_path = (defaults["BASE_DIR"] / path).resolve()
+        abs_path = (get_project_root() / path).resolve()
     return abs_path
 
 
-########################################################
-## Define defaults
-########################################################
-cli_vars = find_all_caps_cli_vars()
-_config = load_config()
-defaults = {}
-
-
 # OS type
 def get_os():
     os_name = system()
@@ -239,44 +237,109 @@ def get_os():
         return "unknown"
 
 
-if "OS_TYPE" in cli_vars:
-    defaults["OS_TYPE"] = cli_vars["OS_TYPE"]
-else:
-    defaults["OS_TYPE"] = get_os()
+########################################################
+## Lazily resolved, memoized settings
+########################################################
+@lru_cache(maxsize=None)
+def _get_cli_vars():
+    return find_all_caps_cli_vars()
+
+
+@lru_cache(maxsize=None)
+def _get_config():
+    return load_config()
+
+
+@lru_cache(maxsize=None)
+def get_project_root():
+    """Return the absolute path to the root directory of the project (BASE_DIR).
+
+    A ``--BASE_DIR`` command line argument takes precedence over
+    `find_project_root()`. The result is cached for the rest of the process.
+    """
+    cli_vars = _get_cli_vars()
+    if "BASE_DIR" in cli_vars:
+        return Path(cli_vars["BASE_DIR"])
+    return find_project_root()
+
+
+def get_user_temp_dir(name: str) -> Path:
+    """Return ``{tempdir}/{name}_{user}``, a directory for state shared by a user's processes."""
+    import getpass
+    import tempfile
+
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "default"
+    return Path(tempfile.gettempdir()) / f"{name}_{user}"
+
+
+def _get_user(os_type):
+    if os_type == "windows":
+        USERPROFILE = os.environ.get("USERPROFILE", "")
+        return Path(USERPROFILE).name if USERPROFILE else ""
+    elif os_type == "nix":
+        return _get_config()("USER", default="")
+    else:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def _get_defaults():
+    cli_vars = _get_cli_vars()
+    defaults = {}
+
+    # OS type
+    if "OS_TYPE" in cli_vars:
+        defaults["OS_TYPE"] = cli_vars["OS_TYPE"]
+    else:
+        defaults["OS_TYPE"] = get_os()
+
+    # Absolute path to root directory of the project
+    defaults["BASE_DIR"] = get_project_root()
 
+    # User name
+    defaults["USER"] = _get_user(defaults["OS_TYPE"])
 
-# Absolute path to root directory of the project
-if "BASE_DIR" in cli_vars:
-    defaults["BASE_DIR"] = Path(cli_vars["BASE_DIR"])
-else:
-    defaults["BASE_DIR"] = find_project_root()
+    ## File paths
+    return {
+        "DATA_DIR": if_relative_make_abs(Path("_data")),
+        "MANUAL_DATA_DIR": if_relative_make_abs(Path("data_manual")),
+        "OUTPUT_DIR": if_relative_make_abs(Path("_output")),
+        **defaults,
+    }
 
-# User name
-if defaults["OS_TYPE"] == "windows":
-    USERPROFILE = os.environ.get("USERPROFILE", "")
-    USER = Path(USERPROFILE).name if USERPROFILE else ""
-elif defaults["OS_TYPE"] == "nix":
-    USER = _config("USER", default="")
-else:
-    USER = ""
 
-defaults["USER"] = USER
+def clear_settings_cache():
+    """Forget the memoized settings so that they are resolved again on next use."""
+    _get_cli_vars.cache_clear()
+    _get_config.cache_clear()
+    get_project_root.cache_clear()
+    _get_defaults.cache_clear()
 
-## File paths
-defaults = {
-    "DATA_DIR": if_relative_make_abs(Path("_data")),
-    "MANUAL_DATA_DIR": if_relative_make_abs(Path("data_manual")),
-    "OUTPUT_DIR": if_relative_make_abs(Path("_output")),
-    **defaults,
-}
+
+def __getattr__(name):
+    # Module-level settings that used to be computed at import time
+    if name == "defaults":
+        return _get_defaults()
+    if name == "cli_vars":
+        return _get_cli_vars()
+    if name == "USER":
+        return _get_defaults()["USER"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Sentinel for arguments that were not passed, mirroring decouple's `undefined`
+_undefined = object()
 
 
 def config(
     var_name,
-    default=undefined,
-    cast=undefined,
-    settings_py_defaults=defaults,
-    cli_vars=cli_vars,
+    default=_undefined,
+    cast=_undefined,
+    settings_py_defaults=None,
+    cli_vars=None,
     convert_dir_vars_to_abs_path=True,
 ):
     """Config defines a variable that can be used in the project. The definition of variables follows
@@ -286,13 +349,21 @@ def config(
     3. Settings.py file
     4. Defaults defined in-line in the local file
     5. Error
+
+    The command line arguments, `.env` file and settings.py defaults are
+    resolved on the first call and memoized.
     """
+    if cli_vars is None:
+        cli_vars = _get_cli_vars()
+    if settings_py_defaults is None:
+        settings_py_defaults = _get_defaults()
+    _config = _get_config()
 
     # 1. Command line arguments (highest priority)
     if var_name in cli_vars and cli_vars[var_name] is not None:
         value = cli_vars[var_name]
         # Apply cast if provided
-        if cast is not undefined:
+        if cast is not _undefined:
             value = cast(value)
         if "DIR" in var_name and convert_dir_vars_to_abs_path:
             value = if_relative_make_abs(Path(value))
@@ -304,22 +375,28 @@ def config(
     env_value = _config(var_name, default=env_sentinel)
     if env_value is not env_sentinel:
         # Found in environment
-        if cast is not undefined:
+        if cast is not _undefined:
             env_value = cast(env_value)
         if "DIR" in var_name and convert_dir_vars_to_abs_path:
             env_value = if_relative_make_abs(Path(env_value))
         return env_value
 
     # 3. Settings.py defaults dictionary
-    if var_name in defaults:
-        default_value = defaults[var_name]
+    if var_name in settings_py_defaults:
+        default_value = settings_py_defaults[var_name]
         # If default_value is directly usable (not a dict with metadata)
-        if cast is not undefined:
+        if cast is not _undefined:
             default_value = cast(default_value)
         return default_value
 
     # 4. Use the default value provided in the local file. Error if not found
-    return _config(var_name, default=default, cast=cast)
+    from decouple import undefined
+
+    return _config(
+        var_name,
+        default=undefined if default is _undefined else default,
+        cast=undefined if cast is _undefined else cast,
+    )
 
 
 def create_directories():
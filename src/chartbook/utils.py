@@ -7,6 +7,9 @@ from pathlib import Path
 
 import polars as pl
 
+from chartbook.data._dataset import data_size, is_partitioned, scan_polars
+from chartbook.data._info import read_info
+
 # Default file size threshold (in MB) above which to use memory-efficient loading
 DEFAULT_SIZE_THRESHOLD_MB = 50
 
@@ -47,6 +50,9 @@ shutil.copy2 = shutil.copy
 def copy_according_to_plan(publish_plan, mkdir=False, verbose: bool = False):
     """Copies files from source paths to destination paths as specified in the publish_plan.
 
+    Sources that are directories, such as partitioned parquet datasets, are copied
+    recursively.
+
     :param publish_plan: A dictionary where keys are source file paths and values are destination file paths.
     :type publish_plan: dict
     :param mkdir: If True, creates the parent directories for destination paths if they do not exist. Defaults to False.
@@ -97,6 +103,12 @@ def copy_according_to_plan(publish_plan, mkdir=False, verbose: bool = False):
         if mkdir:
             destination_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if source_path.is_dir():
+            shutil.copytree(source_path, destination_path, dirs_exist_ok=True)
+            if verbose:
+                print(f"Copied {source_path} to {destination_path}")
+            continue
+
         # Copy the file content only, without attempting to copy permissions
         shutil.copyfile(source_path, destination_path)
         if verbose:
@@ -116,7 +128,7 @@ def get_dataframe_glimpse(filepath, size_threshold_mb=DEFAULT_SIZE_THRESHOLD_MB)
     For files larger than size_threshold_mb, uses memory-efficient loading by only
     collecting sampled data and correcting the row count in glimpse output.
 
-    :param filepath: Path to the parquet or CSV file.
+    :param filepath: Path to the parquet or CSV file, or to a partitioned parquet directory.
     :type filepath: str or Path
     :param size_threshold_mb: File size threshold in MB above which to use memory-efficient loading.
     :type size_threshold_mb: float
@@ -127,20 +139,25 @@ def get_dataframe_glimpse(filepath, size_threshold_mb=DEFAULT_SIZE_THRESHOLD_MB)
         filepath = Path(filepath)
 
         # Check file size to determine loading strategy
-        file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
+        file_size_mb = data_size(filepath) / (1024 * 1024)
         is_large_file = file_size_mb > size_threshold_mb
 
         # Load data lazily
-        if filepath.suffix.lower() == ".csv":
+        if is_partitioned(filepath):
+            lf = scan_polars(filepath)
+        elif filepath.suffix.lower() == ".csv":
             lf = pl.scan_csv(filepath)
         elif filepath.suffix.lower() == ".parquet":
             lf = pl.scan_parquet(filepath)
         else:
             return f"Unsupported file type: {filepath.suffix}"
 
-        # Get actual row count efficiently (works for both small and large files)
-        row_count_df = lf.select(pl.len().alias("count")).collect()
-        actual_row_count = row_count_df["count"][0]
+        # Get actual row count from the parquet footer, or by counting CSV rows
+        if filepath.suffix.lower() == ".csv":
+            row_count_df = lf.select(pl.len().alias("count")).collect()
+            actual_row_count = row_count_df["count"][0]
+        else:
+            actual_row_count = read_info(filepath).num_rows
 
         # For large files, use head() to avoid full scan; for small files, tail() is fine
         if is_large_file:
@@ -160,3 +177,26 @@ def get_dataframe_glimpse(filepath, size_threshold_mb=DEFAULT_SIZE_THRESHOLD_MB)
 
     except Exception as e:
         return f"Error reading file: {e!s}"
+
+
+def write_consolidated_parquet(source_dir, destination_path):
+    """Combine a partitioned parquet directory into a single parquet file.
+
+    Record batches are streamed from the source into the destination, so the
+    dataset never has to fit in memory. Partition keys become ordinary columns.
+
+    :param source_dir: Path to the partitioned parquet directory.
+    :type source_dir: str or Path
+    :param destination_path: Path of the parquet file to write.
+    :type destination_path: str or Path
+    """
+    import pyarrow.parquet as pq
+
+    from chartbook.data._dataset import open_dataset
+
+    destination_path = Path(destination_path)
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    dataset = open_dataset(source_dir)
+    with pq.ParquetWriter(destination_path, dataset.schema) as writer:
+        for batch in dataset.to_batches():
+            writer.write_batch(batch)
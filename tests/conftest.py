@@ -11,6 +11,14 @@ from tests.fixtures import (
 )
 
 
+@pytest.fixture(autouse=True)
+def source_index_dir(tmp_path, monkeypatch):
+    """Points the source modification indexes at a temporary directory."""
+    index_dir = tmp_path / "source_index"
+    monkeypatch.setenv("CHARTBOOK_SOURCE_INDEX_DIR", str(index_dir))
+    return index_dir
+
+
 @pytest.fixture
 def pipeline_project(tmp_path):
     """Creates and returns path to a complete pipeline project.
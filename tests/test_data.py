@@ -0,0 +1,1640 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+import pyarrow.dataset as ds
+import pytest
+
+from chartbook import data
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Creates a DATA_DIR-style tree with one dataframe split into several row groups.
+
+    The dataframe lives at ``{tmp_path}/PIPE/_data/rates.parquet`` and has one row
+    per day for January 2020 across two series.
+    """
+    days = pl.date_range(date(2020, 1, 1), date(2020, 1, 31), eager=True)
+    df = pl.DataFrame(
+        {
+            "date": pl.concat([days, days]),
+            "series": ["A"] * len(days) + ["B"] * len(days),
+            "value": [float(i) for i in range(2 * len(days))],
+        }
+    ).sort("date")
+    file_path = tmp_path / "PIPE" / "_data" / "rates.parquet"
+    file_path.parent.mkdir(parents=True)
+    df.write_parquet(file_path, row_group_size=10, statistics=True)
+    df.head(5).write_parquet(file_path.with_name("rates_head.parquet"))
+    return tmp_path
+
+
+def _load(data_dir, **kwargs):
+    return data.load(
+        base_dir=data_dir, pipeline_id="PIPE", dataframe_id="rates", **kwargs
+    )
+
+
+class TestGetPath:
+    """Tests for get_path function."""
+
+    def test_get_path_layout(self, tmp_path):
+        """Path should follow base_dir/pipeline_id/_data/dataframe_id.parquet."""
+        path = data.get_path(tmp_path, "PIPE", "rates")
+        assert path == tmp_path / "PIPE" / "_data" / "rates.parquet"
+
+
+class TestDataframeIndex:
+    """Tests for the persistent dataframe index used by get_path."""
+
+    @pytest.fixture
+    def index_path(self, catalog_project, monkeypatch):
+        from chartbook.data._index import write_index
+        from chartbook.manifest import load_manifest
+
+        index_path = catalog_project / "_output" / "chartbook_index.json"
+        monkeypatch.setenv("CHARTBOOK_INDEX", str(index_path))
+        write_index(load_manifest(catalog_project), index_path)
+        return index_path
+
+    def test_index_covers_every_pipeline(self, catalog_project, index_path):
+        """Every dataframe of every sub-pipeline should be indexed."""
+        import json
+
+        entries = json.loads(index_path.read_text())["dataframes"]
+        assert set(entries) == {"pipeline_a:dataframe_0", "pipeline_b:dataframe_0"}
+        entry = entries["pipeline_b:dataframe_0"]
+        expected = (
+            catalog_project
+            / "pipelines"
+            / "pipeline_b"
+            / "_data"
+            / "pipeline_b"
+            / "dataframe_0.parquet"
+        )
+        assert entry["path"] == expected.resolve().as_posix()
+        assert entry["mtime_ns"] == expected.stat().st_mtime_ns
+        assert len(entry["schema_hash"]) == 16
+
+    def test_get_path_uses_index(self, catalog_project, index_path):
+        """Without base_dir, indexed dataframes should resolve through the index."""
+        path = data.get_path(pipeline_id="pipeline_a", dataframe_id="dataframe_0")
+        assert path.is_file()
+        assert path.is_relative_to(catalog_project.resolve() / "pipelines")
+        df = data.load(
+            pipeline_id="pipeline_a", dataframe_id="dataframe_0", format="polars"
+        )
+        assert df.height == 10
+
+    def test_unindexed_dataframe_falls_back(self, index_path, tmp_path, monkeypatch):
+        """Dataframes missing from the index should resolve under DATA_DIR."""
+        monkeypatch.setenv("DATA_DIR", str(tmp_path))
+        path = data.get_path(pipeline_id="PIPE", dataframe_id="rates")
+        assert path == tmp_path / "PIPE" / "_data" / "rates.parquet"
+
+    def test_rewritten_index_is_reread(self, catalog_project, index_path):
+        """A rewritten index should replace the in-memory copy."""
+        import json
+
+        index = json.loads(index_path.read_text())
+        moved_path = index["dataframes"]["pipeline_b:dataframe_0"]["path"]
+        index["dataframes"]["pipeline_a:dataframe_0"]["path"] = moved_path
+        index_path.write_text(json.dumps(index, indent=2))
+        path = data.get_path(pipeline_id="pipeline_a", dataframe_id="dataframe_0")
+        assert path == Path(moved_path)
+
+    def test_stale_entry_falls_back(self, index_path, tmp_path, monkeypatch):
+        """An indexed path that no longer exists should resolve under DATA_DIR."""
+        import json
+
+        index = json.loads(index_path.read_text())
+        index["dataframes"]["pipeline_a:dataframe_0"]["path"] = "/moved/df.parquet"
+        index_path.write_text(json.dumps(index, indent=2))
+        monkeypatch.setenv("DATA_DIR", str(tmp_path))
+        path = data.get_path(pipeline_id="pipeline_a", dataframe_id="dataframe_0")
+        assert path == tmp_path / "pipeline_a" / "_data" / "dataframe_0.parquet"
+
+    def test_custom_data_dir_name_ignores_index(
+        self, index_path, tmp_path, monkeypatch
+    ):
+        """A non-default data_dir_name should resolve under DATA_DIR, not the index."""
+        monkeypatch.setenv("DATA_DIR", str(tmp_path))
+        path = data.get_path(
+            pipeline_id="pipeline_a", dataframe_id="dataframe_0", data_dir_name="raw"
+        )
+        assert path == tmp_path / "pipeline_a" / "raw" / "dataframe_0.parquet"
+
+    def test_unchanged_schemas_are_not_reread(
+        self, catalog_project, index_path, monkeypatch
+    ):
+        """Rebuilding the index should only read footers of changed files."""
+        from chartbook.data import _index
+        from chartbook.manifest import load_manifest
+
+        hashed = []
+        original = _index.schema_hash
+        monkeypatch.setattr(
+            _index, "schema_hash", lambda path: hashed.append(path) or original(path)
+        )
+        _index.write_index(load_manifest(catalog_project), index_path)
+        assert hashed == []
+
+
+class TestLoadPushdown:
+    """Tests for column projection and row filters in load."""
+
+    def test_load_full_frame(self, data_dir):
+        """Without arguments, the whole frame should be returned."""
+        df = _load(data_dir)
+        assert isinstance(df, pd.DataFrame)
+        assert df.shape == (62, 3)
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_columns_projection(self, data_dir, format):
+        """Only the requested columns should be returned."""
+        df = _load(data_dir, format=format, columns=["date", "value"])
+        assert list(df.columns) == ["date", "value"]
+        assert len(df) == 62
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_filters_and(self, data_dir, format):
+        """A flat list of filters should be combined with AND."""
+        df = _load(
+            data_dir,
+            format=format,
+            filters=[("series", "==", "B"), ("value", ">=", 56.0)],
+        )
+        assert len(df) == 6
+        assert set(df["series"]) == {"B"}
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_filters_or(self, data_dir, format):
+        """A list of lists of filters should be combined with OR."""
+        df = _load(
+            data_dir,
+            format=format,
+            filters=[[("value", "in", [0.0, 1.0])], [("value", ">", 60.0)]],
+        )
+        assert sorted(df["value"]) == [0.0, 1.0, 61.0]
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_date_range_with_string_bounds(self, data_dir, format):
+        """ISO date strings should be cast to the date column type."""
+        df = _load(
+            data_dir,
+            format=format,
+            columns=["value"],
+            date_range=("2020-01-30", None),
+        )
+        assert list(df.columns) == ["value"]
+        assert len(df) == 4
+
+    def test_date_range_closed(self, data_dir):
+        """Both bounds of date_range should be inclusive."""
+        df = _load(data_dir, date_range=(date(2020, 1, 10), date(2020, 1, 12)))
+        assert len(df) == 6
+
+    def test_invalid_operator_raises(self, data_dir):
+        """Unknown filter operators should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid filter operator"):
+            _load(data_dir, filters=[("value", "~", 1)])
+
+    def test_unknown_filter_column_raises(self, data_dir):
+        """Filtering on a missing column should raise KeyError."""
+        with pytest.raises(KeyError, match="not_a_column"):
+            _load(data_dir, filters=[("not_a_column", "==", 1)])
+
+    def test_invalid_format_raises(self, data_dir):
+        """Unknown formats should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            _load(data_dir, format="excel")
+
+
+class TestLoadLazyFormats:
+    """Tests for the deferred formats of load."""
+
+    def test_polars_lazy_returns_lazyframe(self, data_dir):
+        """format='polars_lazy' should return an uncollected LazyFrame."""
+        lf = _load(data_dir, format="polars_lazy", columns=["date", "value"])
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect_schema().names() == ["date", "value"]
+        assert lf.collect().height == 62
+
+    def test_polars_lazy_applies_filters(self, data_dir):
+        """Filters should be part of the lazy query plan."""
+        lf = _load(data_dir, format="polars_lazy", filters=[("series", "==", "A")])
+        result = lf.select(pl.col("value").max()).collect()
+        assert result.item() == 30.0
+
+    def test_arrow_dataset_returns_dataset(self, data_dir):
+        """format='arrow_dataset' should return a pyarrow Dataset."""
+        dataset = _load(data_dir, format="arrow_dataset")
+        assert isinstance(dataset, ds.Dataset)
+        assert dataset.count_rows() == 62
+
+    def test_arrow_dataset_applies_filters(self, data_dir):
+        """Filters should be attached to the returned Dataset."""
+        dataset = _load(
+            data_dir, format="arrow_dataset", date_range=("2020-01-31", None)
+        )
+        assert dataset.to_table(columns=["value"]).num_rows == 2
+
+    def test_arrow_dataset_rejects_columns(self, data_dir):
+        """columns cannot be applied to a Dataset and should raise ValueError."""
+        with pytest.raises(ValueError, match="arrow_dataset"):
+            _load(data_dir, format="arrow_dataset", columns=["value"])
+
+
+@pytest.fixture
+def clean_cache():
+    """Clears the load cache and restores its default configuration afterwards."""
+    data.cache_clear()
+    yield
+    data.configure_cache(enabled=True, max_bytes=1024**3)
+    data.cache_clear()
+
+
+class TestLoadArrowFormats:
+    """Tests for the Arrow-backed eager formats of load."""
+
+    def test_arrow_table(self, data_dir):
+        """format='arrow' should return a pyarrow Table with pushdown applied."""
+        import pyarrow as pa
+
+        table = _load(
+            data_dir,
+            format="arrow",
+            columns=["series", "value"],
+            filters=[("series", "==", "A")],
+        )
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["series", "value"]
+        assert table.num_rows == 31
+
+    def test_pandas_arrow_dtypes(self, data_dir):
+        """format='pandas_arrow' should return ArrowDtype columns."""
+        df = _load(data_dir, format="pandas_arrow")
+        assert isinstance(df, pd.DataFrame)
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        assert df.shape == (62, 3)
+        assert df["series"].iloc[0] == "A"
+
+    @pytest.mark.parametrize("format", ["arrow", "pandas_arrow"])
+    def test_cached(self, data_dir, clean_cache, format):
+        """Arrow-backed formats should be served from the load cache."""
+        _load(data_dir, format=format)
+        _load(data_dir, format=format)
+        assert data.cache_info().hits == 1
+
+    @pytest.mark.parametrize("format", ["arrow", "pandas_arrow"])
+    def test_sidecar(self, data_dir, format):
+        """Arrow-backed formats should read through sidecars."""
+        result = _load(data_dir, format=format, cache=False, sidecar=True)
+        assert len(result) == 62
+
+    def test_pandas_arrow_batches(self, data_dir):
+        """iter_batches should yield ArrowDtype pandas frames."""
+        batches = list(
+            data.iter_batches("PIPE", "rates", base_dir=data_dir, format="pandas_arrow")
+        )
+        assert sum(len(batch) for batch in batches) == 62
+        assert isinstance(batches[0]["value"].dtype, pd.ArrowDtype)
+
+
+class TestLoadCache:
+    """Tests for the process-local load cache."""
+
+    def test_repeated_load_hits_cache(self, data_dir, clean_cache):
+        """The second identical load should be a cache hit."""
+        first = _load(data_dir)
+        second = _load(data_dir)
+        info = data.cache_info()
+        assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+        assert info.current_bytes > 0
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_cached_frame_is_isolated_from_mutation(self, data_dir, clean_cache):
+        """Mutating a returned frame should not change later cache hits."""
+        df = _load(data_dir)
+        df["value"] = -1.0
+        assert (_load(data_dir)["value"] >= 0).all()
+
+    def test_key_includes_format_and_columns(self, data_dir, clean_cache):
+        """Different formats and column selections should be cached separately."""
+        _load(data_dir)
+        _load(data_dir, format="polars")
+        _load(data_dir, columns=["value"])
+        assert data.cache_info().entries == 3
+        assert data.cache_info().hits == 0
+
+    def test_rewritten_file_is_reloaded(self, data_dir, clean_cache):
+        """A changed mtime or size should invalidate the cached frame."""
+        _load(data_dir)
+        file_path = data.get_path(data_dir, "PIPE", "rates")
+        pl.DataFrame({"date": [date(2021, 1, 1)], "value": [1.0]}).write_parquet(
+            file_path
+        )
+        df = _load(data_dir)
+        assert len(df) == 1
+        assert data.cache_info().hits == 0
+
+    def test_cache_false_bypasses_cache(self, data_dir, clean_cache):
+        """cache=False should neither read from nor write to the cache."""
+        _load(data_dir, cache=False)
+        _load(data_dir, cache=False)
+        assert data.cache_info().entries == 0
+
+    def test_configure_cache_disabled(self, data_dir, clean_cache):
+        """Disabling the cache globally should stop caching."""
+        data.configure_cache(enabled=False)
+        _load(data_dir)
+        _load(data_dir)
+        assert data.cache_info().entries == 0
+
+    def test_byte_budget_evicts_least_recently_used(self, data_dir, clean_cache):
+        """Entries beyond the byte budget should be evicted LRU first."""
+        _load(data_dir, format="polars", columns=["date", "value"])
+        data.configure_cache(max_bytes=data.cache_info().current_bytes)
+        _load(data_dir, format="polars", columns=["value"])
+        assert data.cache_info().entries == 1
+        _load(data_dir, format="polars", columns=["value"])
+        _load(data_dir, format="polars", columns=["date", "value"])
+        info = data.cache_info()
+        assert (info.hits, info.misses) == (1, 3)
+
+    def test_lazy_formats_are_not_cached(self, data_dir, clean_cache):
+        """Deferred formats should never be cached."""
+        _load(data_dir, format="polars_lazy")
+        _load(data_dir, format="arrow_dataset")
+        assert data.cache_info().entries == 0
+
+
+class TestLoadSidecar:
+    """Tests for the memory-mapped Arrow IPC sidecar."""
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_sidecar_matches_parquet(self, data_dir, format):
+        """Loading through the sidecar should return the same frame as parquet."""
+        direct = _load(data_dir, format=format, cache=False)
+        via_sidecar = _load(data_dir, format=format, cache=False, sidecar=True)
+        if format == "pandas":
+            pd.testing.assert_frame_equal(direct, via_sidecar)
+        else:
+            assert direct.equals(via_sidecar)
+
+    def test_sidecar_written_next_to_parquet(self, data_dir):
+        """The sidecar should be an uncompressed IPC file beside the parquet file."""
+        import pyarrow as pa
+
+        _load(data_dir, cache=False, sidecar=True)
+        sidecar_path = data_dir / "PIPE" / "_data" / "rates.arrow"
+        assert sidecar_path.is_file()
+        with pa.memory_map(str(sidecar_path)) as source:
+            assert pa.ipc.open_file(source).read_all().num_rows == 62
+
+    def test_sidecar_applies_columns_and_filters(self, data_dir):
+        """Columns and filters should apply when reading from the sidecar."""
+        df = _load(
+            data_dir,
+            cache=False,
+            sidecar=True,
+            columns=["value"],
+            filters=[("series", "==", "A")],
+            date_range=("2020-01-30", None),
+        )
+        assert list(df.columns) == ["value"]
+        assert sorted(df["value"]) == [29.0, 30.0]
+
+    def test_sidecar_lazy_formats(self, data_dir):
+        """Deferred formats should scan the sidecar."""
+        lf = _load(data_dir, format="polars_lazy", sidecar=True)
+        assert lf.collect().height == 62
+        dataset = _load(data_dir, format="arrow_dataset", sidecar=True)
+        assert dataset.count_rows() == 62
+
+    def test_sidecar_rebuilt_when_parquet_changes(self, data_dir):
+        """A rewritten parquet file should trigger a sidecar rebuild."""
+        _load(data_dir, cache=False, sidecar=True)
+        file_path = data.get_path(data_dir, "PIPE", "rates")
+        pl.DataFrame({"date": [date(2021, 1, 1)], "value": [1.0]}).write_parquet(
+            file_path
+        )
+        df = _load(data_dir, cache=False, sidecar=True)
+        assert len(df) == 1
+        assert list(df.columns) == ["date", "value"]
+
+
+@pytest.fixture
+def shm_dir(tmp_path, monkeypatch):
+    """Points the shared memory registry at a temporary directory, evicting segments afterwards."""
+    registry_dir = tmp_path / "shm_registry"
+    monkeypatch.setenv("CHARTBOOK_SHM_DIR", str(registry_dir))
+    yield registry_dir
+    data.shm_evict(force=True)
+
+
+class TestLoadShared:
+    """Tests for loading through shared memory segments."""
+
+    @pytest.mark.parametrize("format", ["pandas", "polars", "arrow"])
+    def test_shared_matches_parquet(self, data_dir, shm_dir, format):
+        """Loading through shared memory should return the same frame as parquet."""
+        direct = _load(data_dir, format=format, cache=False)
+        shared = _load(data_dir, format=format, cache=False, shared=True)
+        if format == "pandas":
+            pd.testing.assert_frame_equal(direct, shared)
+        else:
+            assert direct.equals(shared)
+
+    def test_segment_is_listed_and_reused(self, data_dir, shm_dir):
+        """The segment should be registered once and reused by later loads."""
+        first = _load(data_dir, format="arrow", cache=False, shared=True)
+        second = _load(data_dir, format="arrow", cache=False, shared=True)
+        assert first is second
+        (segment,) = data.shm_list()
+        assert segment.source == data.get_path(data_dir, "PIPE", "rates").resolve()
+        assert segment.refcount == 1
+        assert not segment.stale
+        assert segment.nbytes > 0
+
+    def test_shared_applies_columns_and_filters(self, data_dir, shm_dir):
+        """Columns and filters should apply to the shared table."""
+        df = _load(
+            data_dir,
+            cache=False,
+            shared=True,
+            columns=["value"],
+            filters=[("series", "==", "A")],
+            date_range=("2020-01-30", None),
+        )
+        assert list(df.columns) == ["value"]
+        assert sorted(df["value"]) == [29.0, 30.0]
+        lf = _load(data_dir, format="polars_lazy", shared=True, columns=["value"])
+        assert lf.collect().shape == (62, 1)
+        assert _load(data_dir, format="arrow_dataset", shared=True).count_rows() == 62
+
+    def test_other_process_attaches(self, data_dir, shm_dir, monkeypatch):
+        """A segment created by another process should be attached, not re-read."""
+        import subprocess
+        import sys
+
+        from chartbook.data import _shm
+
+        code = (
+            "from chartbook import data; "
+            f"data.load(base_dir={str(data_dir)!r}, pipeline_id='PIPE', "
+            "dataframe_id='rates', format='arrow', shared=True)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=data_dir)
+        (segment,) = data.shm_list()
+        assert segment.refcount == 0
+
+        def fail(*args, **kwargs):
+            raise AssertionError("parquet should not be read")
+
+        monkeypatch.setattr(_shm, "read_table", fail)
+        table = _load(data_dir, format="arrow", cache=False, shared=True)
+        assert table.num_rows == 62
+        assert data.shm_list()[0].refcount == 1
+
+    def test_rewritten_file_gets_new_segment(self, data_dir, shm_dir):
+        """A rewritten parquet file should get a new segment and mark the old one stale."""
+        _load(data_dir, format="arrow", cache=False, shared=True)
+        file_path = data.get_path(data_dir, "PIPE", "rates")
+        pl.DataFrame({"date": [date(2021, 1, 1)], "value": [1.0]}).write_parquet(
+            file_path
+        )
+        df = _load(data_dir, cache=False, shared=True)
+        assert len(df) == 1
+        segments = data.shm_list()
+        assert sorted(segment.stale for segment in segments) == [False, True]
+        assert len(data.shm_evict(stale=True, force=True)) == 1
+        (segment,) = data.shm_list()
+        assert not segment.stale
+
+    def test_evict_skips_segments_in_use(self, data_dir, shm_dir):
+        """Segments used by a live process should only be evicted with force."""
+        table = _load(data_dir, format="arrow", cache=False, shared=True)
+        assert data.shm_evict() == []
+        (name,) = data.shm_evict(force=True)
+        assert data.shm_list() == []
+        # Data already loaded stays readable after eviction
+        assert table.num_rows == 62
+        assert not list(shm_dir.glob(f"{name}*"))
+
+    def test_unready_segment_is_closed(self, data_dir, shm_dir, monkeypatch):
+        """A segment another process is still writing should be closed, not leaked."""
+        from chartbook.data import _shm
+
+        _load(data_dir, format="arrow", cache=False, shared=True)
+        monkeypatch.setattr(_shm, "_attached", {})
+        monkeypatch.setattr(_shm, "_read_segment", lambda segment: None)
+        opened = []
+        open_segment = _shm._open_segment
+
+        def record(name, create=False, size=0):
+            segment = open_segment(name, create=create, size=size)
+            opened.append(segment)
+            return segment
+
+        monkeypatch.setattr(_shm, "_open_segment", record)
+        assert _load(data_dir, format="arrow", cache=False, shared=True).num_rows == 62
+        (segment,) = opened
+        assert segment.buf is None
+
+    def test_entry_is_written_before_segment(self, data_dir, shm_dir, monkeypatch):
+        """A segment should only be created once its registry entry exists."""
+        from chartbook.data import _shm
+
+        open_segment = _shm._open_segment
+
+        def check_entry(name, create=False, size=0):
+            if create:
+                assert (shm_dir / f"{name}.json").is_file()
+            return open_segment(name, create=create, size=size)
+
+        monkeypatch.setattr(_shm, "_open_segment", check_entry)
+        _load(data_dir, format="arrow", cache=False, shared=True)
+        assert len(data.shm_list()) == 1
+
+    def test_entry_without_segment(self, data_dir, shm_dir):
+        """Entries whose creator died before creating the segment should be removed."""
+        import json
+        import os
+        import time
+
+        shm_dir.mkdir()
+        source = data.get_path(data_dir, "PIPE", "rates")
+        # 2**22 + 1 is above the largest process id Linux and macOS assign
+        for name, pid in (("cb_pending", os.getpid()), ("cb_orphan", 2**22 + 1)):
+            entry = {
+                "name": name,
+                "source": source.as_posix(),
+                "mtime_ns": 0,
+                "size": 0,
+                "nbytes": 64,
+                "created": time.time(),
+                "pid": pid,
+            }
+            (shm_dir / f"{name}.json").write_text(json.dumps(entry))
+        assert data.shm_list() == []
+        assert (shm_dir / "cb_pending.json").is_file()
+        assert not (shm_dir / "cb_orphan.json").exists()
+
+    def test_shm_cli(self, data_dir, shm_dir):
+        """chartbook shm list and evict should report and remove segments."""
+        from click.testing import CliRunner
+
+        from chartbook.cli import main
+
+        _load(data_dir, format="arrow", cache=False, shared=True)
+        (segment,) = data.shm_list()
+        runner = CliRunner()
+        result = runner.invoke(main, ["shm", "list"])
+        assert result.exit_code == 0, result.output
+        assert segment.name in result.output
+        result = runner.invoke(main, ["shm", "evict", segment.name, "--force"])
+        assert result.exit_code == 0, result.output
+        assert f"Evicted {segment.name}" in result.output
+        assert data.shm_list() == []
+
+    def test_shared_and_sidecar_are_exclusive(self, data_dir, shm_dir):
+        """shared and sidecar should not be combined."""
+        with pytest.raises(ValueError, match="cannot be combined"):
+            _load(data_dir, shared=True, sidecar=True)
+
+
+class TestLoadMany:
+    """Tests for concurrent loading with load_many."""
+
+    def test_load_many_returns_frames_in_order(self, data_dir):
+        """Results should be keyed by (pipeline_id, dataframe_id) in input order."""
+        frames = data.load_many(
+            [("PIPE", "rates_head"), ("PIPE", "rates")],
+            max_workers=2,
+            base_dir=data_dir,
+            cache=False,
+        )
+        assert list(frames) == [("PIPE", "rates_head"), ("PIPE", "rates")]
+        assert len(frames["PIPE", "rates_head"]) == 5
+        assert len(frames["PIPE", "rates"]) == 62
+
+    def test_load_many_passes_load_arguments(self, data_dir):
+        """Keyword arguments should be applied to every load."""
+        frames = data.load_many(
+            [("PIPE", "rates"), ("PIPE", "rates_head")],
+            base_dir=data_dir,
+            format="polars",
+            columns=["value"],
+            cache=False,
+        )
+        assert all(isinstance(df, pl.DataFrame) for df in frames.values())
+        assert all(df.columns == ["value"] for df in frames.values())
+
+    def test_load_many_deduplicates(self, data_dir):
+        """Repeated pairs should be loaded once."""
+        frames = data.load_many(
+            [("PIPE", "rates"), ("PIPE", "rates")], base_dir=data_dir, cache=False
+        )
+        assert len(frames) == 1
+
+    def test_load_many_empty(self):
+        """No pairs should return an empty dict."""
+        assert data.load_many([]) == {}
+
+    def test_load_many_propagates_errors(self, data_dir):
+        """A failing load should raise from load_many."""
+        with pytest.raises(FileNotFoundError):
+            data.load_many(
+                [("PIPE", "rates"), ("PIPE", "missing")], base_dir=data_dir, cache=False
+            )
+
+
+class TestAsyncLoad:
+    """Tests for the asyncio loaders aload and aload_many."""
+
+    def test_aload_matches_load(self, data_dir):
+        """aload should return what load returns for the same arguments."""
+        import asyncio
+
+        df = asyncio.run(
+            data.aload(
+                base_dir=data_dir,
+                pipeline_id="PIPE",
+                dataframe_id="rates",
+                format="polars",
+                columns=["value"],
+                cache=False,
+            )
+        )
+        assert df.equals(_load(data_dir, format="polars", columns=["value"]))
+
+    def test_aload_does_not_block_event_loop(self, data_dir, monkeypatch):
+        """Other coroutines should run while a load is in progress."""
+        import asyncio
+        import threading
+
+        from chartbook.data import _async
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load(*args, **kwargs):
+            started.set()
+            assert release.wait(timeout=5)
+            return "loaded"
+
+        monkeypatch.setattr(_async, "load", slow_load)
+
+        async def main():
+            task = asyncio.ensure_future(
+                data.aload(pipeline_id="PIPE", dataframe_id="rates")
+            )
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            # The loop is still free while the load blocks its thread
+            assert not task.done()
+            release.set()
+            return await task
+
+        assert asyncio.run(main()) == "loaded"
+
+    def test_aload_many_returns_frames_in_order(self, data_dir):
+        """Results should be keyed by (pipeline_id, dataframe_id) in input order."""
+        import asyncio
+
+        frames = asyncio.run(
+            data.aload_many(
+                [("PIPE", "rates_head"), ("PIPE", "rates"), ("PIPE", "rates_head")],
+                max_concurrency=1,
+                base_dir=data_dir,
+                cache=False,
+            )
+        )
+        assert list(frames) == [("PIPE", "rates_head"), ("PIPE", "rates")]
+        assert len(frames["PIPE", "rates_head"]) == 5
+        assert len(frames["PIPE", "rates"]) == 62
+
+    def test_aload_many_uses_executor(self, data_dir):
+        """Loads should run in the given executor."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(thread_name_prefix="custom-load") as executor:
+            frames = asyncio.run(
+                data.aload_many(
+                    [("PIPE", "rates")],
+                    base_dir=data_dir,
+                    executor=executor,
+                    format="arrow",
+                    cache=False,
+                )
+            )
+        assert frames["PIPE", "rates"].num_rows == 62
+
+    def test_aload_many_propagates_errors(self, data_dir):
+        """A failing load should raise from aload_many."""
+        import asyncio
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(
+                data.aload_many(
+                    [("PIPE", "rates"), ("PIPE", "missing")],
+                    base_dir=data_dir,
+                    cache=False,
+                )
+            )
+
+    def test_aload_many_rejects_bad_concurrency(self):
+        """max_concurrency below one should raise ValueError."""
+        import asyncio
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(data.aload_many([("PIPE", "rates")], max_concurrency=0))
+
+
+class TestIterBatches:
+    """Tests for streaming a dataframe with iter_batches."""
+
+    def test_batches_cover_all_rows(self, data_dir):
+        """Concatenated batches should contain every row."""
+        batches = list(
+            data.iter_batches("PIPE", "rates", batch_size=8, base_dir=data_dir)
+        )
+        assert all(batch.num_rows <= 8 for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 62
+
+    @pytest.mark.parametrize(
+        "format, frame_type", [("pandas", pd.DataFrame), ("polars", pl.DataFrame)]
+    )
+    def test_batch_formats(self, data_dir, format, frame_type):
+        """Batches should be converted to the requested format."""
+        batches = list(
+            data.iter_batches(
+                "PIPE", "rates", format=format, columns=["value"], base_dir=data_dir
+            )
+        )
+        assert all(isinstance(batch, frame_type) for batch in batches)
+        assert all(list(batch.columns) == ["value"] for batch in batches)
+
+    def test_batches_apply_filters(self, data_dir):
+        """Filters should be pushed into the scan and empty batches skipped."""
+        batches = list(
+            data.iter_batches(
+                "PIPE",
+                "rates",
+                batch_size=4,
+                filters=[("series", "==", "B")],
+                date_range=("2020-01-29", None),
+                base_dir=data_dir,
+            )
+        )
+        assert all(batch.num_rows > 0 for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 3
+
+    def test_invalid_arguments_raise_immediately(self, data_dir):
+        """Argument errors should surface before iteration starts."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            data.iter_batches("PIPE", "rates", format="polars_lazy", base_dir=data_dir)
+        with pytest.raises(ValueError, match="batch_size"):
+            data.iter_batches("PIPE", "rates", batch_size=0, base_dir=data_dir)
+
+
+@pytest.fixture
+def partitioned_data_dir(tmp_path):
+    """Creates a hive-partitioned dataframe at ``{tmp_path}/PIPE/_data/panel/``.
+
+    Partition keys are encoded only in the directory names, as written by
+    ``pyarrow.parquet.write_to_dataset``.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table(
+        {
+            "date": [date(2024, month, day) for month in (4, 5, 6) for day in (1, 2)],
+            "value": [float(i) for i in range(6)],
+            "month": [4, 4, 5, 5, 6, 6],
+        }
+    )
+    dataset_dir = tmp_path / "PIPE" / "_data" / "panel"
+    pq.write_to_dataset(table, dataset_dir, partition_cols=["month"])
+    (dataset_dir / "_SUCCESS").touch()
+    return tmp_path
+
+
+def _load_panel(data_dir, **kwargs):
+    return data.load(
+        base_dir=data_dir, pipeline_id="PIPE", dataframe_id="panel", **kwargs
+    )
+
+
+class TestPartitionedDataset:
+    """Tests for hive-partitioned dataframes stored as directories."""
+
+    def test_get_path_returns_directory(self, partitioned_data_dir):
+        """get_path should fall back to a directory named after the dataframe."""
+        path = data.get_path(partitioned_data_dir, "PIPE", "panel")
+        assert path == partitioned_data_dir / "PIPE" / "_data" / "panel"
+        assert path.is_dir()
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_load_discovers_partitions(self, partitioned_data_dir, format):
+        """Partition keys should be loaded as columns."""
+        df = _load_panel(partitioned_data_dir, format=format, cache=False)
+        assert len(df) == 6
+        assert set(df.columns) == {"date", "value", "month"}
+
+    @pytest.mark.parametrize("format", ["pandas", "polars"])
+    def test_filters_prune_partitions(self, partitioned_data_dir, format):
+        """Filters on partition keys and data columns should both apply."""
+        df = _load_panel(
+            partitioned_data_dir,
+            format=format,
+            columns=["value"],
+            filters=[("month", ">=", 5)],
+            date_range=(None, "2024-05-01"),
+            cache=False,
+        )
+        assert list(df["value"]) == [2.0]
+
+    def test_arrow_dataset_prunes_partitions(self, partitioned_data_dir):
+        """The returned Dataset should only contain matching partitions."""
+        dataset = _load_panel(
+            partitioned_data_dir, format="arrow_dataset", filters=[("month", "==", 6)]
+        )
+        assert dataset.count_rows() == 2
+
+    def test_partition_columns_stored_in_files(self, tmp_path):
+        """Directories whose files also contain the partition column should load."""
+        dataset_dir = tmp_path / "PIPE" / "_data" / "panel"
+        pl.DataFrame(
+            {"value": [1.0, 2.0, 3.0], "year": [2023, 2024, 2024]}
+        ).write_parquet(dataset_dir, partition_by=["year"])
+        df = _load_panel(
+            tmp_path, format="polars", filters=[("year", "==", 2024)], cache=False
+        )
+        assert df["value"].to_list() == [2.0, 3.0]
+
+    def test_iter_batches_over_partitions(self, partitioned_data_dir):
+        """iter_batches should stream every partition."""
+        batches = data.iter_batches("PIPE", "panel", base_dir=partitioned_data_dir)
+        assert sum(batch.num_rows for batch in batches) == 6
+
+    def test_new_partition_invalidates_cache(self, partitioned_data_dir, clean_cache):
+        """Appending a partition should change the cache key."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        assert len(_load_panel(partitioned_data_dir)) == 6
+        pq.write_to_dataset(
+            pa.table({"date": [date(2024, 7, 1)], "value": [6.0], "month": [7]}),
+            data.get_path(partitioned_data_dir, "PIPE", "panel"),
+            partition_cols=["month"],
+        )
+        assert len(_load_panel(partitioned_data_dir)) == 7
+
+    def test_sidecar_for_partitioned_dataset(self, partitioned_data_dir):
+        """A partitioned dataset should get a sidecar next to its directory."""
+        df = _load_panel(
+            partitioned_data_dir, format="polars", cache=False, sidecar=True
+        )
+        assert df.height == 6
+        assert (partitioned_data_dir / "PIPE" / "_data" / "panel.arrow").is_file()
+
+    def test_glimpse_and_consolidation(self, partitioned_data_dir, tmp_path):
+        """Docs helpers should glimpse and consolidate partitioned datasets."""
+        from chartbook.utils import get_dataframe_glimpse, write_consolidated_parquet
+
+        path = data.get_path(partitioned_data_dir, "PIPE", "panel")
+        assert get_dataframe_glimpse(path).startswith("Rows: 6")
+
+        destination = tmp_path / "download" / "panel.parquet"
+        write_consolidated_parquet(path, destination)
+        assert pl.read_parquet(destination).height == 6
+
+
+class TestInfo:
+    """Tests for metadata-only inspection with info."""
+
+    def test_layout_and_schema(self, data_dir):
+        """Row count, schema and row groups should come from the footer."""
+        meta = data.info("PIPE", "rates", base_dir=data_dir)
+        assert meta.num_rows == 62
+        assert meta.schema.names == ["date", "series", "value"]
+        assert meta.num_row_groups == 7
+        assert [row_group.num_rows for row_group in meta.row_groups][-2:] == [10, 2]
+        assert (
+            meta.file_size
+            == (data_dir / "PIPE" / "_data" / "rates.parquet").stat().st_size
+        )
+
+    def test_column_stats(self, data_dir):
+        """Column min, max and null counts should combine all row groups."""
+        meta = data.info("PIPE", "rates", base_dir=data_dir)
+        assert meta.columns["date"].min == date(2020, 1, 1)
+        assert meta.columns["date"].max == date(2020, 1, 31)
+        assert meta.columns["value"].null_count == 0
+        assert meta.row_groups[0].columns["date"].max == date(2020, 1, 5)
+
+    def test_all_null_row_groups_are_skipped(self, tmp_path):
+        """Row groups that are entirely null should not hide the column's bounds."""
+        file_path = tmp_path / "PIPE" / "_data" / "sparse.parquet"
+        file_path.parent.mkdir(parents=True)
+        pl.DataFrame(
+            {"value": [None, None, 3.0, 1.0]}, schema={"value": pl.Float64}
+        ).write_parquet(file_path, row_group_size=2, statistics=True)
+        stats = data.info("PIPE", "sparse", base_dir=tmp_path).columns["value"]
+        assert (stats.min, stats.max, stats.null_count) == (1.0, 3.0, 2)
+
+    def test_partitioned_dataset(self, partitioned_data_dir):
+        """Partitioned datasets should report totals across files."""
+        meta = data.info("PIPE", "panel", base_dir=partitioned_data_dir)
+        assert meta.num_rows == 6
+        assert meta.num_row_groups == 3
+        assert "month" in meta.schema.names
+        assert meta.columns["month"].min is None
+        assert meta.columns["date"].max == date(2024, 6, 2)
+
+    def test_missing_dataframe(self, tmp_path):
+        """A missing dataframe should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            data.info("PIPE", "missing", base_dir=tmp_path)
+
+    @pytest.mark.parametrize("trailing_nulls", [False, True])
+    def test_most_recent_datapoints_match_scan(self, tmp_path, trailing_nulls):
+        """Footer-based and scan-based most recent datapoints should agree."""
+        from chartbook.markdown_generator import (
+            _most_recent_dates_from_footer,
+            find_most_recent_valid_datapoints,
+        )
+
+        days = pl.date_range(date(2021, 1, 1), date(2021, 1, 20), eager=True)
+        late = [float(i) for i in range(20)]
+        early = [1.0] * 10 + [None] * 10
+        if trailing_nulls:
+            late[-1] = None
+        file_path = tmp_path / "sparse.parquet"
+        pl.DataFrame({"date": days, "late": late, "early": early}).write_parquet(
+            file_path, row_group_size=5, statistics=True
+        )
+
+        from_footer = _most_recent_dates_from_footer(file_path, "date")
+        assert (from_footer is None) == trailing_nulls
+        assert find_most_recent_valid_datapoints(file_path) == (
+            "2021-01-10 00:00:00",
+            "2021-01-19 00:00:00" if trailing_nulls else "2021-01-20 00:00:00",
+        )
+
+
+class TestDateWindow:
+    """Tests for since, until and last in load."""
+
+    def test_since_until(self, data_dir):
+        """since and until should be inclusive bounds."""
+        df = _load(data_dir, since="2020-01-10", until="2020-01-12")
+        assert len(df) == 6
+
+    @pytest.mark.parametrize("last", ["5d", 5, timedelta(days=5)])
+    def test_last_from_latest_date(self, data_dir, last):
+        """last should select a trailing window ending at the latest date."""
+        df = _load(data_dir, format="polars", last=last)
+        assert df["date"].min() == date(2020, 1, 27)
+        assert df.height == 10
+
+    def test_last_until(self, data_dir):
+        """last combined with until should end the window at until."""
+        df = _load(data_dir, format="polars", last="2d", until="2020-01-10")
+        assert sorted(set(df["date"].to_list())) == [
+            date(2020, 1, 9),
+            date(2020, 1, 10),
+        ]
+
+    def test_last_calendar_months(self, data_dir):
+        """Month windows should use calendar arithmetic."""
+        assert len(_load(data_dir, last="1mo")) == 62
+
+    @pytest.mark.parametrize("format", ["pandas", "polars", "arrow"])
+    def test_last_without_dates(self, tmp_path, format):
+        """last on a dataframe whose dates are all null should select no rows."""
+        file_path = tmp_path / "PIPE" / "_data" / "undated.parquet"
+        file_path.parent.mkdir(parents=True)
+        pl.DataFrame(
+            {"date": pl.Series([None, None], dtype=pl.Date), "value": [1.0, 2.0]}
+        ).write_parquet(file_path)
+        df = data.load(
+            base_dir=tmp_path,
+            pipeline_id="PIPE",
+            dataframe_id="undated",
+            format=format,
+            last="90d",
+        )
+        assert len(df) == 0
+
+    def test_window_skips_row_groups(self, data_dir):
+        """A trailing window should only touch the last row groups."""
+        from chartbook.data._filters import to_arrow_expression
+        from chartbook.data._window import date_window_filters
+
+        path = data.get_path(data_dir, "PIPE", "rates")
+        expression = to_arrow_expression([date_window_filters(path, "date", last="3d")])
+        fragment = next(ds.dataset(path).get_fragments())
+        assert len(fragment.split_by_row_group(expression)) == 2
+
+    def test_invalid_combinations(self, data_dir):
+        """Conflicting window arguments should raise ValueError."""
+        with pytest.raises(ValueError):
+            _load(data_dir, since="2020-01-10", last="5d")
+        with pytest.raises(ValueError):
+            _load(data_dir, date_range=("2020-01-10", None), until="2020-01-12")
+        with pytest.raises(ValueError):
+            _load(data_dir, last="5 fortnights")
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """A project whose chartbook.toml declares the dataframe's date_col."""
+        from chartbook import settings
+
+        (tmp_path / "chartbook.toml").write_text(
+            '[pipeline]\nid = "PIPE"\n\n'
+            '[dataframes.events]\ndate_col = "obs_date"\n\n'
+            '[dataframes.static]\ndate_col = "N/A"\n'
+        )
+        file_path = tmp_path / "PIPE" / "_data" / "events.parquet"
+        file_path.parent.mkdir(parents=True)
+        days = pl.date_range(date(2022, 3, 1), date(2022, 3, 10), eager=True)
+        pl.DataFrame({"obs_date": days, "value": range(10)}).write_parquet(file_path)
+        pl.DataFrame({"value": [1]}).write_parquet(
+            file_path.with_name("static.parquet")
+        )
+
+        monkeypatch.setenv("BASE_DIR", str(tmp_path))
+        settings.clear_settings_cache()
+        yield tmp_path
+        settings.clear_settings_cache()
+
+    def test_date_col_from_manifest(self, project):
+        """Without date_col, the manifest's declared date_col should be used."""
+        df = data.load(
+            base_dir=project, pipeline_id="PIPE", dataframe_id="events", last="3d"
+        )
+        assert list(df["value"]) == [7, 8, 9]
+
+    def test_iter_batches_date_col_from_manifest(self, project):
+        """iter_batches should resolve the declared date_col the way load does."""
+        batches = data.iter_batches(
+            "PIPE",
+            "events",
+            date_range=("2022-03-08", None),
+            base_dir=project,
+            format="polars",
+        )
+        assert pl.concat(list(batches))["value"].to_list() == [7, 8, 9]
+
+    def test_manifest_without_date_col(self, project):
+        """Dataframes declared without a date column should refuse date windows."""
+        with pytest.raises(ValueError, match="no date column"):
+            data.load(
+                base_dir=project, pipeline_id="PIPE", dataframe_id="static", last="3d"
+            )
+
+
+class TestSample:
+    """Tests for row-group-aware random sampling."""
+
+    def test_sample_size_and_order(self, data_dir):
+        """A sample should have n rows, in file order."""
+        df = data.sample(
+            "PIPE", "rates", n=15, seed=1, base_dir=data_dir, format="polars"
+        )
+        assert df.height == 15
+        assert df["date"].is_sorted()
+
+    def test_reads_only_needed_row_groups(self, data_dir, monkeypatch):
+        """Only enough row groups to cover n rows should be read."""
+        import pyarrow as pa
+
+        read = []
+        original = pa.concat_tables
+
+        def concat_tables(tables, **kwargs):
+            tables = list(tables)
+            read.extend(table.num_rows for table in tables)
+            return original(tables, **kwargs)
+
+        monkeypatch.setattr(pa, "concat_tables", concat_tables)
+        data.sample("PIPE", "rates", n=15, seed=1, base_dir=data_dir)
+        assert 2 <= len(read) <= 3
+        assert 15 <= sum(read) < 62
+
+    def test_seed_is_reproducible(self, data_dir):
+        """The same seed should give the same sample."""
+        first = data.sample("PIPE", "rates", n=5, seed=7, base_dir=data_dir)
+        second = data.sample("PIPE", "rates", n=5, seed=7, base_dir=data_dir)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_small_dataframe_returned_whole(self, data_dir):
+        """Asking for more rows than exist should return every row."""
+        df = data.sample("PIPE", "rates", n=1_000, base_dir=data_dir, columns=["value"])
+        assert df.shape == (62, 1)
+
+    def test_partitioned_sample_includes_keys(self, partitioned_data_dir):
+        """Samples of partitioned datasets should include partition keys."""
+        table = data.sample(
+            "PIPE", "panel", n=3, seed=0, base_dir=partitioned_data_dir, format="arrow"
+        )
+        assert table.num_rows == 3
+        assert "month" in table.column_names
+
+    def test_empty_sample(self, data_dir):
+        """n=0 should return an empty frame with the requested columns."""
+        df = data.sample("PIPE", "rates", n=0, base_dir=data_dir, columns=["date"])
+        assert list(df.columns) == ["date"]
+        assert len(df) == 0
+
+
+class TestSave:
+    """Tests for writing dataframes with save."""
+
+    def test_layout(self, tmp_path):
+        """Files should be sorted, zstd-compressed and split into row groups with statistics."""
+        import pyarrow.parquet as pq
+
+        df = pl.DataFrame(
+            {
+                "date": [date(2020, 1, day) for day in range(31, 0, -1)],
+                "value": range(31),
+            }
+        )
+        path = data.save(df, "PIPE", "saved", base_dir=tmp_path, row_group_size=10)
+        assert path == tmp_path / "PIPE" / "_data" / "saved.parquet"
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == 4
+        column = metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+        assert column.statistics.has_min_max
+        assert metadata.row_group(0).sorting_columns[0].column_index == 0
+
+        loaded = data.load(
+            base_dir=tmp_path, pipeline_id="PIPE", dataframe_id="saved", format="polars"
+        )
+        assert loaded["date"].is_sorted()
+        assert loaded["value"][0] == 30
+
+    @pytest.mark.parametrize("kind", ["pandas", "polars_lazy", "arrow"])
+    def test_input_types(self, tmp_path, kind):
+        """pandas DataFrames, polars LazyFrames and pyarrow Tables should be accepted."""
+        df = pl.DataFrame({"series": ["b", "a", "c"], "value": [2.0, 1.0, 3.0]})
+        if kind == "pandas":
+            df = df.to_pandas()
+        elif kind == "polars_lazy":
+            df = df.lazy()
+        else:
+            df = df.to_arrow()
+        data.save(df, "PIPE", "saved", base_dir=tmp_path, sort_by="series")
+        loaded = data.load(base_dir=tmp_path, pipeline_id="PIPE", dataframe_id="saved")
+        assert list(loaded["series"]) == ["a", "b", "c"]
+
+    def test_keep_row_order(self, tmp_path):
+        """An empty sort_by should keep the row order."""
+        df = pl.DataFrame({"date": [date(2020, 1, 2), date(2020, 1, 1)]})
+        data.save(df, "PIPE", "saved", base_dir=tmp_path, sort_by=[])
+        loaded = data.load(
+            base_dir=tmp_path, pipeline_id="PIPE", dataframe_id="saved", format="polars"
+        )
+        assert not loaded["date"].is_sorted()
+
+    def test_failed_write_keeps_old_file(self, data_dir, monkeypatch):
+        """A failing write should leave the existing file intact and no temp files behind."""
+        import pyarrow.parquet as pq
+
+        def failing_write_table(table, where, **kwargs):
+            open(where, "wb").write(b"partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pq, "write_table", failing_write_table)
+        with pytest.raises(OSError):
+            data.save(
+                pl.DataFrame({"date": [date(2020, 1, 1)]}),
+                "PIPE",
+                "rates",
+                base_dir=data_dir,
+            )
+        assert len(_load(data_dir, cache=False)) == 62
+        assert sorted(p.name for p in (data_dir / "PIPE" / "_data").iterdir()) == [
+            "rates.parquet",
+            "rates_head.parquet",
+        ]
+
+    def test_rejects_partitioned_directory(self, partitioned_data_dir):
+        """save should not overwrite a partitioned dataset directory."""
+        with pytest.raises(ValueError, match="partitioned"):
+            data.save(
+                pl.DataFrame({"value": [1.0]}),
+                "PIPE",
+                "panel",
+                base_dir=partitioned_data_dir,
+            )
+
+
+class TestQuery:
+    """Tests for SQL queries across the dataframes of a catalog."""
+
+    @pytest.fixture
+    def manifest(self, catalog_project):
+        from chartbook.manifest import load_manifest
+
+        return load_manifest(catalog_project)
+
+    def test_join_across_pipelines(self, manifest):
+        """Unquoted pipeline_id.dataframe_id names should resolve as tables."""
+        df = data.query(
+            "SELECT a.value, b.amount "
+            "FROM pipeline_a.dataframe_0 AS a "
+            "JOIN pipeline_b.dataframe_0 AS b ON a.value = b.value "
+            "WHERE a.value >= 5 ORDER BY a.value",
+            format="polars",
+            manifest=manifest,
+        )
+        assert df["value"].to_list() == [5, 6, 7, 8, 9]
+        assert df["amount"].to_list() == [7.5, 9.0, 10.5, 12.0, 13.5]
+
+    def test_aggregation_to_pandas(self, manifest):
+        """Results should be returned as pandas by default."""
+        df = data.query(
+            'SELECT category, COUNT(*) AS n FROM "pipeline_a.dataframe_0" '
+            "GROUP BY category ORDER BY category",
+            manifest=manifest,
+        )
+        assert isinstance(df, pd.DataFrame)
+        assert df["n"].tolist() == [5, 5]
+
+    def test_lazy_result(self, manifest):
+        """polars_lazy should return an unevaluated LazyFrame."""
+        lf = data.query(
+            "SELECT value FROM pipeline_b.dataframe_0 WHERE value < 3",
+            format="polars_lazy",
+            manifest=manifest,
+        )
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect()["value"].to_list() == [0, 1, 2]
+
+    def test_only_referenced_tables_are_scanned(self, manifest, monkeypatch):
+        """Dataframes that the query does not mention should not be opened."""
+        from chartbook.data import _query
+
+        scanned = []
+        original = _query.scan_polars
+        monkeypatch.setattr(
+            _query, "scan_polars", lambda path: scanned.append(path) or original(path)
+        )
+        data.query("SELECT * FROM pipeline_a.dataframe_0", manifest=manifest)
+        assert len(scanned) == 1
+        assert "pipeline_a" in Path(scanned[0]).parts
+
+    def test_unique_dataframe_ids_are_aliases(self, data_dir):
+        """Unambiguous dataframe ids should be usable without the pipeline id."""
+        from chartbook.data._query import catalog_tables
+
+        manifest = {
+            "config": {"type": "pipeline"},
+            "pipeline": {"id": "PIPE"},
+            "pipeline_base_dir": data_dir / "PIPE",
+            "dataframes": {
+                "rates": {"dataframe_path": data_dir / "PIPE/_data/rates.parquet"},
+            },
+        }
+        tables = catalog_tables(manifest)
+        assert tables["rates"] == tables["PIPE.rates"]
+
+    def test_ambiguous_dataframe_ids_are_not_aliases(self, manifest):
+        """A dataframe id shared by several pipelines should need its pipeline id."""
+        from chartbook.data._query import catalog_tables
+
+        assert "dataframe_0" not in catalog_tables(manifest)
+
+    def test_string_literals_are_not_rewritten(self):
+        """Table names inside string literals should be left alone."""
+        from chartbook.data._query import quote_table_names
+
+        sql = "SELECT 'p.d' AS name FROM p.d WHERE x = 'it''s p.d'"
+        assert quote_table_names(sql, ["p.d"]) == (
+            "SELECT 'p.d' AS name FROM \"p.d\" WHERE x = 'it''s p.d'"
+        )
+
+    def test_index_is_used_without_manifest(self, catalog_project, monkeypatch):
+        """Without a manifest, tables should come from the dataframe index."""
+        from chartbook.data._index import write_index
+        from chartbook.manifest import load_manifest
+
+        index_path = catalog_project / "_output" / "chartbook_index.json"
+        monkeypatch.setenv("CHARTBOOK_INDEX", str(index_path))
+        write_index(load_manifest(catalog_project), index_path)
+        df = data.query(
+            "SELECT COUNT(*) AS n FROM pipeline_b.dataframe_0", format="polars"
+        )
+        assert df["n"].item() == 10
+
+    def test_invalid_format(self, manifest):
+        """Unknown formats should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            data.query("SELECT 1", format="csv", manifest=manifest)
+
+
+class TestResample:
+    """Tests for resampled pyramids and load(..., resample=...)."""
+
+    def test_resample_in_memory(self, data_dir):
+        """Without a pyramid, the dataframe should be resampled on the fly."""
+        df = _load(data_dir, format="polars", resample="M", cache=False)
+        assert df.columns == ["date", "series", "value"]
+        assert df["date"].to_list() == [date(2020, 1, 31)] * 2
+        assert df["series"].to_list() == ["A", "B"]
+        assert df["value"].to_list() == [30.0, 61.0]
+
+    def test_weekly_periods(self, data_dir):
+        """Weekly rows should hold the last date of each week per series."""
+        df = _load(
+            data_dir,
+            format="polars",
+            resample="weekly",
+            filters=[("series", "==", "A")],
+            since="2020-01-10",
+        )
+        # Weeks start on Monday; January 2020 ends on a Friday
+        assert df["date"].to_list() == [
+            date(2020, 1, 12),
+            date(2020, 1, 19),
+            date(2020, 1, 26),
+            date(2020, 1, 31),
+        ]
+
+    def test_pyramid_is_served(self, data_dir, monkeypatch):
+        """A fresh pyramid should be read instead of resampling the base file."""
+        from chartbook.data import _load as load_module
+        from chartbook.data._resample import write_pyramid
+
+        file_path = data.get_path(data_dir, "PIPE", "rates")
+        pyramid_path = write_pyramid(file_path, "date", "Q")
+        assert pyramid_path == file_path.with_name("rates.Q.parquet")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the base file should not be resampled")
+
+        monkeypatch.setattr(load_module, "resample_table", fail)
+        df = _load(
+            data_dir,
+            format="polars",
+            resample="q",
+            columns=["series", "value"],
+            filters=[("series", "==", "B")],
+            cache=False,
+        )
+        assert df.to_dicts() == [{"series": "B", "value": 61.0}]
+
+    def test_stale_pyramid_is_ignored(self, data_dir):
+        """A pyramid of an older version of the file should not be served."""
+        from chartbook.data._resample import write_pyramid
+
+        file_path = data.get_path(data_dir, "PIPE", "rates")
+        write_pyramid(file_path, "date", "M")
+        pl.DataFrame(
+            {"date": [date(2021, 1, 1), date(2021, 1, 5)], "value": [1.0, 2.0]}
+        ).write_parquet(file_path)
+        df = _load(data_dir, format="polars", resample="M", cache=False)
+        assert df.to_dicts() == [{"date": date(2021, 1, 5), "value": 2.0}]
+
+    def test_last_non_null_value(self, tmp_path):
+        """Each column should take its last non-null value in the period."""
+        file_path = tmp_path / "PIPE" / "_data" / "wide.parquet"
+        file_path.parent.mkdir(parents=True)
+        pl.DataFrame(
+            {
+                "date": [date(2020, 1, 30), date(2020, 1, 31), date(2020, 2, 3)],
+                "x": [1.0, None, 3.0],
+                "y": [10.0, 20.0, None],
+            }
+        ).write_parquet(file_path)
+        df = data.load(
+            base_dir=tmp_path,
+            pipeline_id="PIPE",
+            dataframe_id="wide",
+            format="polars",
+            resample="M",
+        )
+        assert df.to_dicts() == [
+            {"date": date(2020, 1, 31), "x": 1.0, "y": 20.0},
+            {"date": date(2020, 2, 3), "x": 3.0, "y": None},
+        ]
+
+    def test_integer_keys(self, tmp_path):
+        """Panels keyed by a non-text column should need declared keys, not collapse."""
+        from chartbook.data._resample import resample_table
+
+        table = pl.DataFrame(
+            {
+                "permno": [10001, 10002, 10001, 10002],
+                "date": [date(2020, 1, 2)] * 2 + [date(2020, 1, 31)] * 2,
+                "ret": [0.1, 0.2, 0.3, 0.4],
+            }
+        ).to_arrow()
+        with pytest.raises(ValueError, match="resample_keys"):
+            resample_table(table, "date", "M")
+        df = pl.from_arrow(resample_table(table, "date", "M", keys=["permno"]))
+        assert df.to_dicts() == [
+            {"permno": 10001, "date": date(2020, 1, 31), "ret": 0.3},
+            {"permno": 10002, "date": date(2020, 1, 31), "ret": 0.4},
+        ]
+        with pytest.raises(KeyError, match="gvkey"):
+            resample_table(table, "date", "M", keys=["gvkey"])
+
+    def test_invalid_resample(self, data_dir):
+        """Unknown levels should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid resample"):
+            _load(data_dir, resample="D")
+
+    def test_pyramid_levels_from_data_frequency(self):
+        """Levels coarser than the finest chart frequency should be built."""
+        from chartbook.data._resample import pyramid_levels
+
+        assert pyramid_levels(["Daily"]) == ["W", "M", "Q", "Y"]
+        assert pyramid_levels(["Quarterly/Monthly"]) == ["Q", "Y"]
+        assert pyramid_levels(["Quarterly", "Weekly"]) == ["M", "Q", "Y"]
+        assert pyramid_levels(["Annual"]) == []
+        assert pyramid_levels(["", "Irregular"]) == []
+
+    def test_build_pyramids(self, pipeline_project):
+        """build_pyramids should write the levels implied by the chart metadata, once."""
+        from chartbook.data._resample import build_pyramids
+        from chartbook.manifest import load_manifest
+
+        manifest = load_manifest(pipeline_project)
+        manifest["charts"]["chart_0_0"]["data_frequency"] = "Monthly"
+        # Every fixture row has the same date, so "value" identifies the series
+        manifest["dataframes"]["dataframe_0"]["resample_keys"] = ["value"]
+        written = build_pyramids(manifest)
+        parquet_path = manifest["dataframes"]["dataframe_0"]["dataframe_path"]
+        assert written == [
+            parquet_path.with_name("dataframe_0.Q.parquet"),
+            parquet_path.with_name("dataframe_0.Y.parquet"),
+        ]
+        assert build_pyramids(manifest) == []
+
+    def test_build_pyramids_skips_duplicate_keys(self, pipeline_project):
+        """A dataframe with several rows per key and date should be skipped with a warning."""
+        from chartbook.data._resample import build_pyramids
+        from chartbook.manifest import load_manifest
+
+        manifest = load_manifest(pipeline_project)
+        manifest["charts"]["chart_0_0"]["data_frequency"] = "Monthly"
+        # Every fixture row has the same date, with "category" as the only text column
+        with pytest.warns(UserWarning, match="more than one row"):
+            assert build_pyramids(manifest) == []
+
+
+class TestRemote:
+    """Tests for serve-data and load(..., remote=...) against localhost."""
+
+    @pytest.fixture
+    def remote(self, data_dir):
+        import threading
+
+        from chartbook.data._server import DataServer
+
+        manifest = {
+            "config": {"type": "pipeline"},
+            "pipeline": {"id": "PIPE"},
+            "pipeline_base_dir": data_dir / "PIPE",
+            "dataframes": {
+                "rates": {
+                    "dataframe_path": data_dir / "PIPE/_data/rates.parquet",
+                    "date_col": "date",
+                },
+                "missing": {"dataframe_path": data_dir / "PIPE/_data/missing.parquet"},
+            },
+        }
+        server = DataServer(manifest, port=0)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield server.url
+        server.shutdown()
+        server.server_close()
+
+    @pytest.mark.parametrize("format", ["pandas", "polars", "arrow"])
+    def test_remote_matches_local(self, data_dir, remote, format):
+        """A remote load should return the same frame as a local one."""
+        local = _load(data_dir, format=format, cache=False)
+        fetched = data.load(
+            pipeline_id="PIPE", dataframe_id="rates", format=format, remote=remote
+        )
+        if format == "pandas":
+            pd.testing.assert_frame_equal(local, fetched)
+        else:
+            assert local.equals(fetched)
+
+    def test_remote_pushes_down_slices(self, data_dir, remote):
+        """Columns, filters and date windows should be applied by the server."""
+        kwargs = dict(
+            format="polars",
+            columns=["date", "value"],
+            filters=[("series", "in", {"B"})],
+            last="2d",
+        )
+        fetched = data.load(
+            pipeline_id="PIPE", dataframe_id="rates", remote=remote, **kwargs
+        )
+        assert fetched.equals(_load(data_dir, **kwargs))
+        assert fetched["date"].to_list() == [date(2020, 1, 30), date(2020, 1, 31)]
+
+        fetched = data.load(
+            pipeline_id="PIPE",
+            dataframe_id="rates",
+            remote=remote,
+            format="polars",
+            date_range=(date(2020, 1, 15), None),
+            resample="M",
+        )
+        assert fetched["date"].to_list() == [date(2020, 1, 31)] * 2
+
+    def test_remote_lazy_format(self, remote):
+        """Deferred formats should wrap the fetched table."""
+        lf = data.load(
+            pipeline_id="PIPE",
+            dataframe_id="rates",
+            remote=remote,
+            format="polars_lazy",
+            since=date(2020, 1, 31),
+        )
+        assert lf.collect().height == 2
+
+    def test_remote_errors(self, remote):
+        """Unknown dataframes and bad parameters should raise the local exceptions."""
+        with pytest.raises(FileNotFoundError):
+            data.load(pipeline_id="PIPE", dataframe_id="nope", remote=remote)
+        with pytest.raises(FileNotFoundError):
+            data.load(pipeline_id="PIPE", dataframe_id="missing", remote=remote)
+        with pytest.raises(ValueError, match="cannot be combined"):
+            data.load(
+                pipeline_id="PIPE",
+                dataframe_id="rates",
+                remote=remote,
+                date_range=("2020-01-01", None),
+                last="5d",
+            )
+        with pytest.raises(KeyError):
+            data.load(
+                pipeline_id="PIPE",
+                dataframe_id="rates",
+                remote=remote,
+                date_col="when",
+                last="5d",
+            )
+
+    def test_remote_filter_type_mismatch(self, remote):
+        """A filter the scan cannot evaluate should be rejected, not drop the connection."""
+        with pytest.raises(ValueError, match="greater"):
+            data.load(
+                pipeline_id="PIPE",
+                dataframe_id="rates",
+                remote=remote,
+                filters=[("value", ">", "abc")],
+            )
+        assert data.load(pipeline_id="PIPE", dataframe_id="rates", remote=remote).shape
+
+    def test_remote_timeout(self):
+        """A server that never responds should raise TimeoutError after the timeout."""
+        import socket
+
+        from chartbook.data._remote import fetch_table
+
+        with socket.socket() as listener:
+            # Connections are queued by the kernel but never answered
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            host, port = listener.getsockname()
+            with pytest.raises(TimeoutError):
+                fetch_table(f"http://{host}:{port}", "PIPE", "rates", timeout=0.2)
+
+    def test_list_dataframes(self, remote):
+        """GET /dataframes should list what the server serves."""
+        import json
+        import urllib.request
+
+        with urllib.request.urlopen(f"{remote}/dataframes") as response:
+            listing = json.load(response)
+        assert listing == [
+            {"pipeline_id": "PIPE", "dataframe_id": "missing", "date_col": None},
+            {"pipeline_id": "PIPE", "dataframe_id": "rates", "date_col": "date"},
+        ]
+
+    def test_remote_excludes_sidecar(self, remote):
+        """remote should not be combined with local sidecars."""
+        with pytest.raises(ValueError, match="remote cannot be combined"):
+            data.load(
+                pipeline_id="PIPE", dataframe_id="rates", remote=remote, sidecar=True
+            )
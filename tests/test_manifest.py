@@ -1,15 +1,25 @@
+import os
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import tomli
 
+from chartbook.errors import CatalogLoadError
 from chartbook.manifest import (
+    clear_manifest_cache,
+    discard_manifest_snapshot,
+    find_latest_source_modification,
     get_pipeline_ids,
     get_pipeline_manifest,
+    get_source_index_path,
     load_manifest,
     resolve_platform_path,
     validate_config_file,
+    write_manifest_snapshot,
 )
+from tests.fixtures import create_catalog_project
 
 
 class TestResolvePlatformPath:
@@ -143,6 +153,17 @@ class TestLoadManifestPipelineWorkflow:
         assert manifest["charts"]["chart_0_0"]["dataframe_id"] == "dataframe_0"
         assert manifest["charts"]["chart_1_0"]["dataframe_id"] == "dataframe_1"
 
+    def test_chart_with_unknown_dataframe(self, pipeline_project):
+        """A chart referring to an undeclared dataframe should raise ValueError."""
+        toml_path = pipeline_project / "chartbook.toml"
+        toml_path.write_text(
+            toml_path.read_text().replace(
+                'dataframe_id = "dataframe_0"', 'dataframe_id = "missing"', 1
+            )
+        )
+        with pytest.raises(ValueError, match="Dataframe missing not found"):
+            load_manifest(pipeline_project, cache=False)
+
     def test_load_manifest_with_notes(self, pipeline_project_with_notes):
         """Test reading pipeline manifest that include notes section."""
         manifest = load_manifest(pipeline_project_with_notes)
@@ -246,3 +267,315 @@ class TestLoadManifestValidationErrors:
         """Test that invalid version format raises ValueError."""
         with pytest.raises(ValueError, match="Invalid version format"):
             load_manifest(invalid_project_invalid_version)
+
+
+class TestManifestCache:
+    """Tests for memoized load_manifest."""
+
+    @staticmethod
+    def _touch(path: Path, seconds: int = 10) -> None:
+        """Move a file's mtime forward so the change is visible on coarse clocks."""
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 10**9))
+
+    def test_second_load_does_not_reparse(self, pipeline_project):
+        """Loading the same project twice parses and walks it once."""
+        with patch(
+            "chartbook.manifest.find_latest_source_modification",
+            wraps=find_latest_source_modification,
+        ) as walk:
+            first = load_manifest(pipeline_project)
+            second = load_manifest(pipeline_project)
+
+        assert walk.call_count == 1
+        assert first == second
+
+    def test_returns_independent_copies(self, pipeline_project):
+        """Modifying a returned manifest does not affect later loads."""
+        first = load_manifest(pipeline_project)
+        first["pipeline"]["id"] = "changed"
+        first["dataframes"].clear()
+
+        second = load_manifest(pipeline_project)
+        assert second["pipeline"]["id"] == "test_pipeline"
+        assert second["dataframes"]
+
+    def test_toml_change_invalidates(self, pipeline_project):
+        """Editing chartbook.toml reloads the manifest."""
+        load_manifest(pipeline_project)
+        toml_path = pipeline_project / "chartbook.toml"
+        toml_path.write_text(
+            toml_path.read_text().replace("Test Pipeline", "Renamed Pipeline")
+        )
+        self._touch(toml_path)
+
+        manifest = load_manifest(pipeline_project)
+        assert manifest["pipeline"]["pipeline_name"] == "Renamed Pipeline"
+
+    def test_new_source_file_invalidates(self, pipeline_project):
+        """Adding a file under src/ reloads the manifest."""
+        with patch(
+            "chartbook.manifest.find_latest_source_modification",
+            wraps=find_latest_source_modification,
+        ) as walk:
+            load_manifest(pipeline_project)
+            (pipeline_project / "src" / "new_module.py").write_text("x = 1\n")
+            self._touch(pipeline_project / "src")
+            load_manifest(pipeline_project)
+
+        assert walk.call_count == 2
+
+    def test_catalog_reloads_changed_pipeline(self, catalog_project):
+        """Editing a sub-pipeline's chartbook.toml reloads the catalog."""
+        manifest = load_manifest(catalog_project)
+        pipeline_dir = Path(manifest["pipelines"]["pipeline_a"]["pipeline_base_dir"])
+        toml_path = pipeline_dir / "chartbook.toml"
+        toml_path.write_text(
+            toml_path.read_text().replace("Pipeline PIPELINE_A", "Renamed A")
+        )
+        self._touch(toml_path)
+
+        manifest = load_manifest(catalog_project)
+        assert manifest["pipelines"]["pipeline_a"]["pipeline"]["pipeline_name"] == (
+            "Renamed A"
+        )
+
+    def test_cache_false_and_clear(self, pipeline_project):
+        """cache=False and clear_manifest_cache both force a reload."""
+        with patch(
+            "chartbook.manifest.find_latest_source_modification",
+            wraps=find_latest_source_modification,
+        ) as walk:
+            load_manifest(pipeline_project)
+            load_manifest(pipeline_project, cache=False)
+            clear_manifest_cache()
+            load_manifest(pipeline_project)
+
+        assert walk.call_count == 3
+
+
+class TestCatalogParallelLoad:
+    """Tests for concurrent loading of catalog sub-pipelines."""
+
+    PIPELINE_IDS = ["zeta", "alpha", "mid", "beta", "omega"]
+
+    def test_keeps_catalog_order(self, tmp_path):
+        """Sub-pipelines appear in the order of the catalog's chartbook.toml."""
+        catalog_dir = create_catalog_project(
+            tmp_path / "catalog", pipeline_ids=self.PIPELINE_IDS
+        )
+        manifest = load_manifest(catalog_dir, cache=False)
+
+        assert list(manifest["pipelines"]) == self.PIPELINE_IDS
+        assert get_pipeline_ids(manifest) == self.PIPELINE_IDS
+        for pipeline_id in self.PIPELINE_IDS:
+            assert manifest["pipelines"][pipeline_id]["pipeline"]["id"] == pipeline_id
+
+    def test_parses_each_toml_once(self, tmp_path):
+        """Each chartbook.toml in the catalog is parsed exactly once."""
+        catalog_dir = create_catalog_project(
+            tmp_path / "catalog", pipeline_ids=self.PIPELINE_IDS
+        )
+        with patch("chartbook.manifest.tomli.load", wraps=tomli.load) as parse:
+            load_manifest(catalog_dir)
+
+        assert parse.call_count == 1 + len(self.PIPELINE_IDS)
+
+    def test_aggregates_errors(self, tmp_path):
+        """Errors from every failing pipeline are raised together."""
+        catalog_dir = create_catalog_project(
+            tmp_path / "catalog", pipeline_ids=self.PIPELINE_IDS
+        )
+        (catalog_dir / "pipelines" / "zeta" / "chartbook.toml").unlink()
+        (catalog_dir / "pipelines" / "beta" / "chartbook.toml").write_text(
+            "not = [valid toml"
+        )
+
+        with pytest.raises(CatalogLoadError) as excinfo:
+            load_manifest(catalog_dir, cache=False)
+
+        assert list(excinfo.value.errors) == ["zeta", "beta"]
+        assert "No chartbook.toml found" in str(excinfo.value.errors["zeta"])
+        assert "zeta" in str(excinfo.value) and "beta" in str(excinfo.value)
+        # Existing callers that catch ValueError keep working
+        assert isinstance(excinfo.value, ValueError)
+
+
+class TestSourceModificationIndex:
+    """Tests for the incremental find_latest_source_modification."""
+
+    OLD = datetime(2024, 1, 1).timestamp()
+
+    def _make_tree(self, base_dir: Path) -> Path:
+        """Create a pipeline tree whose files and directories all have old mtimes."""
+        files = [
+            "chartbook.toml",
+            "src/a.py",
+            "src/pkg/b.py",
+            "src/pkg/deep/c.py",
+            "docs_src/index.md",
+        ]
+        for i, name in enumerate(files):
+            path = base_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+            os.utime(path, (self.OLD + i, self.OLD + i))
+        for path in sorted(base_dir.rglob("*"), reverse=True):
+            if path.is_dir():
+                os.utime(path, (self.OLD, self.OLD))
+        return base_dir
+
+    def test_returns_latest_file_mtime(self, tmp_path, source_index_dir):
+        """The latest mtime across src/, docs_src/ and chartbook.toml is returned."""
+        base_dir = self._make_tree(tmp_path / "pipeline")
+        os.utime(base_dir / "src/pkg/deep/c.py", (self.OLD + 100, self.OLD + 100))
+
+        latest = find_latest_source_modification(base_dir)
+        assert latest == datetime.fromtimestamp(self.OLD + 100)
+        # A second call served from the index agrees
+        assert find_latest_source_modification(base_dir) == latest
+
+    def test_index_defaults_to_output_dir(self, tmp_path, monkeypatch):
+        """Without CHARTBOOK_SOURCE_INDEX_DIR the index is kept in the pipeline's _output/."""
+        monkeypatch.delenv("CHARTBOOK_SOURCE_INDEX_DIR")
+        base_dir = self._make_tree(tmp_path / "pipeline")
+        find_latest_source_modification(base_dir)
+
+        index_path = base_dir / "_output" / "chartbook_source_index.json"
+        assert get_source_index_path(base_dir) == index_path
+        assert index_path.exists()
+
+    def test_unchanged_directories_are_not_listed(self, tmp_path, source_index_dir):
+        """Only directories whose mtime changed are listed again."""
+        base_dir = self._make_tree(tmp_path / "pipeline")
+        find_latest_source_modification(base_dir)
+
+        with patch("chartbook.manifest.os.scandir", wraps=os.scandir) as scandir:
+            find_latest_source_modification(base_dir)
+        assert scandir.call_count == 0
+
+        (base_dir / "src/pkg/new.py").write_text("y")
+        with patch("chartbook.manifest.os.scandir", wraps=os.scandir) as scandir:
+            latest = find_latest_source_modification(base_dir)
+        assert [Path(call.args[0]).name for call in scandir.call_args_list] == ["pkg"]
+        assert latest > datetime.fromtimestamp(self.OLD + 100)
+
+    def test_in_place_edit_is_detected(self, tmp_path, source_index_dir):
+        """Rewriting a file in place, which leaves its directory's mtime alone, is seen."""
+        base_dir = self._make_tree(tmp_path / "pipeline")
+        find_latest_source_modification(base_dir)
+
+        path = base_dir / "src/pkg/b.py"
+        with open(path, "a") as file:
+            file.write("more")
+        os.utime(path, (self.OLD + 3600, self.OLD + 3600))
+        assert (base_dir / "src/pkg").stat().st_mtime == self.OLD
+
+        with patch("chartbook.manifest.os.scandir", wraps=os.scandir) as scandir:
+            latest = find_latest_source_modification(base_dir)
+        assert scandir.call_count == 0
+        assert latest == datetime.fromtimestamp(self.OLD + 3600)
+
+    def test_ignores_patterns(self, tmp_path, source_index_dir):
+        """Default and custom ignore patterns are skipped."""
+        base_dir = self._make_tree(tmp_path / "pipeline")
+        for name in ["src/__pycache__/a.pyc", "src/raw_data/big.csv"]:
+            path = base_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+            os.utime(path, (self.OLD + 1000, self.OLD + 1000))
+
+        latest = find_latest_source_modification(base_dir, ignore=["raw_data"])
+        assert latest == datetime.fromtimestamp(self.OLD + 4)
+        latest = find_latest_source_modification(base_dir)
+        assert latest == datetime.fromtimestamp(self.OLD + 1000)
+
+    def test_source_ignore_in_chartbook_toml(self, pipeline_project, source_index_dir):
+        """load_manifest passes the pipeline's source_ignore patterns."""
+        toml_path = pipeline_project / "chartbook.toml"
+        toml_path.write_text(
+            toml_path.read_text().replace(
+                "[pipeline]\n", '[pipeline]\nsource_ignore = ["*.log"]\n'
+            )
+        )
+        with patch(
+            "chartbook.manifest.find_latest_source_modification",
+            wraps=find_latest_source_modification,
+        ) as walk:
+            load_manifest(pipeline_project, cache=False)
+
+        assert walk.call_args.kwargs["ignore"] == ["*.log"]
+
+
+class TestManifestSnapshot:
+    """Tests for the compiled manifest snapshot."""
+
+    def test_load_reads_snapshot(self, catalog_project, source_index_dir):
+        """With a fresh snapshot, no chartbook.toml is parsed."""
+        expected = load_manifest(catalog_project, cache=False)
+        snapshot_path = write_manifest_snapshot(catalog_project)
+        assert (
+            snapshot_path == catalog_project / "_output" / "chartbook_manifest.pickle"
+        )
+
+        clear_manifest_cache()
+        with patch("chartbook.manifest.tomli.load", wraps=tomli.load) as parse:
+            manifest = load_manifest(catalog_project)
+
+        assert parse.call_count == 0
+        assert manifest == expected
+        assert manifest["pipelines"]["pipeline_a"]["dataframes"]
+
+    def test_changed_input_ignores_snapshot(self, catalog_project, source_index_dir):
+        """Editing a sub-pipeline's source directory or toml rebuilds the manifest."""
+        write_manifest_snapshot(catalog_project)
+        pipeline_dir = catalog_project / "pipelines" / "pipeline_b"
+        (pipeline_dir / "src" / "new_module.py").write_text("x = 1\n")
+        TestManifestCache._touch(pipeline_dir / "src")
+
+        clear_manifest_cache()
+        with patch("chartbook.manifest.tomli.load", wraps=tomli.load) as parse:
+            load_manifest(catalog_project)
+        assert parse.call_count == 3
+
+    def test_in_place_edit_ignores_snapshot(self, pipeline_project, source_index_dir):
+        """Rewriting a source file in place invalidates the snapshot."""
+        write_manifest_snapshot(pipeline_project)
+        source_file = next((pipeline_project / "src").iterdir())
+        directory_mtime_ns = source_file.parent.stat().st_mtime_ns
+        with open(source_file, "a") as file:
+            file.write("\n# edited\n")
+        TestManifestCache._touch(source_file)
+        assert source_file.parent.stat().st_mtime_ns == directory_mtime_ns
+
+        clear_manifest_cache()
+        with patch("chartbook.manifest.tomli.load", wraps=tomli.load) as parse:
+            manifest = load_manifest(pipeline_project)
+        assert parse.call_count == 1
+        assert manifest["source_last_modified_date"] == datetime.fromtimestamp(
+            source_file.stat().st_mtime
+        ).strftime("%Y-%m-%d %H:%M:%S")
+
+    def test_discard_snapshot(self, pipeline_project, source_index_dir):
+        """discard_manifest_snapshot removes the snapshot and the memo."""
+        snapshot_path = write_manifest_snapshot(pipeline_project)
+        assert discard_manifest_snapshot(pipeline_project) is True
+        assert not snapshot_path.exists()
+        assert discard_manifest_snapshot(pipeline_project) is False
+
+        with patch("chartbook.manifest.tomli.load", wraps=tomli.load) as parse:
+            load_manifest(pipeline_project)
+        assert parse.call_count == 1
+
+    def test_invalid_snapshot_is_ignored(self, pipeline_project, source_index_dir):
+        """A corrupt snapshot, or one written for another base_dir form, is not used."""
+        snapshot_path = write_manifest_snapshot(pipeline_project)
+        clear_manifest_cache()
+        with patch("chartbook.manifest.tomli.load", wraps=tomli.load) as parse:
+            load_manifest(pipeline_project / "src" / "..")
+        assert parse.call_count == 1
+
+        snapshot_path.write_bytes(b"not a pickle")
+        clear_manifest_cache()
+        manifest = load_manifest(pipeline_project)
+        assert manifest["pipeline"]["id"] == "test_pipeline"
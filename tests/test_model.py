@@ -0,0 +1,175 @@
+"""Tests for the typed manifest model."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from chartbook import model
+from chartbook.manifest import clear_manifest_cache, load_manifest
+from chartbook.model import Catalog, Chart, Dataframe, Pipeline, load_catalog
+
+
+class TestCatalogFromManifest:
+    """Tests for building the object model from a manifest."""
+
+    def test_pipeline_project(self, pipeline_project_multi_dataframes):
+        """A pipeline project becomes a catalog with a single pipeline."""
+        catalog = load_catalog(pipeline_project_multi_dataframes)
+
+        assert catalog.type == "pipeline"
+        assert list(catalog.pipelines) == ["multi_df"]
+        pipeline = catalog.pipeline("multi_df")
+        assert isinstance(pipeline, Pipeline)
+        assert pipeline.name == "Multi Dataframe Pipeline"
+        assert pipeline.base_dir == pipeline_project_multi_dataframes.resolve()
+
+    def test_links_charts_and_dataframes(self, pipeline_project_multi_dataframes):
+        """Charts point to their dataframe and dataframes list their charts."""
+        manifest = load_manifest(pipeline_project_multi_dataframes)
+        catalog = Catalog.from_manifest(manifest)
+
+        for dataframe in catalog.iter_dataframes():
+            assert isinstance(dataframe, Dataframe)
+            assert [chart.id for chart in dataframe.charts] == (
+                manifest["dataframes"][dataframe.id]["linked_charts"]
+            )
+            for chart in dataframe.charts:
+                assert chart.dataframe is dataframe
+        assert len(list(catalog.iter_charts())) == 4
+
+    def test_catalog_project(self, catalog_project):
+        """Each pipeline of a catalog is modeled, in catalog order."""
+        catalog = load_catalog(catalog_project)
+
+        assert catalog.type == "catalog"
+        assert catalog.title == "Test Catalog"
+        assert list(catalog.pipelines) == ["pipeline_a", "pipeline_b"]
+        dataframe = next(iter(catalog.pipeline("pipeline_b").dataframes.values()))
+        assert catalog.dataframe("pipeline_b", dataframe.id) is dataframe
+        assert dataframe.pipeline_id == "pipeline_b"
+        assert isinstance(dataframe.path, Path)
+
+    def test_dict_view_is_shared(self, pipeline_project):
+        """Objects reference the manifest dicts instead of copying them."""
+        manifest = load_manifest(pipeline_project)
+        catalog = Catalog.from_manifest(manifest)
+
+        chart = next(catalog.iter_charts())
+        assert isinstance(chart, Chart)
+        assert chart.manifest is manifest["charts"][chart.id]
+        assert catalog.pipeline("test_pipeline").manifest is manifest
+
+    def test_objects_are_slotted(self, pipeline_project):
+        """Model objects do not carry a per-instance __dict__."""
+        chart = next(load_catalog(pipeline_project).iter_charts())
+        assert not hasattr(chart, "__dict__")
+        with pytest.raises(AttributeError):
+            chart.unknown_attribute = 1
+
+    def test_unknown_ids_raise_key_error(self, pipeline_project):
+        """Lookups of unknown IDs raise KeyError."""
+        catalog = load_catalog(pipeline_project)
+        with pytest.raises(KeyError):
+            catalog.chart("test_pipeline", "missing")
+        with pytest.raises(KeyError):
+            catalog.pipeline("missing")
+
+
+class TestLoadCatalog:
+    """Tests for the catalogs memoized by load_catalog."""
+
+    def test_catalog_is_built_once(self, pipeline_project):
+        """The catalog built while loading the manifest is shared by later calls."""
+        clear_manifest_cache()
+        with patch.object(
+            Catalog, "from_manifest", wraps=Catalog.from_manifest
+        ) as from_manifest:
+            catalog = load_catalog(pipeline_project)
+            assert load_catalog(pipeline_project) is catalog
+            load_manifest(pipeline_project)
+        assert from_manifest.call_count == 1
+        dataframe = catalog.dataframe("test_pipeline", "dataframe_0")
+        assert dataframe.manifest["linked_charts"] == ["chart_0_0"]
+
+    def test_catalog_follows_manifest_changes(self, pipeline_project):
+        """A changed chartbook.toml gives a new catalog; cache=False never shares one."""
+        catalog = load_catalog(pipeline_project)
+        assert load_catalog(pipeline_project, cache=False) is not catalog
+
+        toml_path = pipeline_project / "chartbook.toml"
+        toml_path.write_text(
+            toml_path.read_text().replace('pipeline_name = "', 'pipeline_name = "New ')
+        )
+        reloaded = load_catalog(pipeline_project)
+        assert reloaded is not catalog
+        assert reloaded.pipeline("test_pipeline").name.startswith("New ")
+
+
+class TestCatalogIndexes:
+    """Tests for the reverse indexes of a catalog."""
+
+    @pytest.fixture
+    def catalog(self, pipeline_project_multi_dataframes):
+        manifest = load_manifest(pipeline_project_multi_dataframes)
+        dataframes = manifest["dataframes"]
+        charts = manifest["charts"]
+        dataframe_ids = list(dataframes)
+        chart_ids = list(charts)
+        dataframes[dataframe_ids[0]].update(
+            topic_tags=["Rates", "Macro"],
+            data_sources=["FRED"],
+            data_providers=["Federal Reserve"],
+        )
+        dataframes[dataframe_ids[1]].update(
+            topic_tags=["Macro"],
+            data_sources=["FRED", "BLS"],
+            data_providers=["Bureau of Labor Statistics"],
+        )
+        charts[chart_ids[0]]["topic_tags"] = ["Rates", "rates "]
+        charts[chart_ids[3]]["topic_tags"] = ["Macro"]
+        return Catalog.from_manifest(manifest)
+
+    def test_by_tag(self, catalog):
+        """Tags are matched case-insensitively and each object is listed once."""
+        chart_ids = list(catalog.pipeline("multi_df").charts)
+        assert [chart.id for chart in catalog.charts_by_tag("rates")] == [chart_ids[0]]
+        assert [chart.id for chart in catalog.charts_by_tag("MACRO")] == [chart_ids[3]]
+        assert len(catalog.dataframes_by_tag("Macro")) == 2
+        assert catalog.charts_by_tag("Unknown") == ()
+        assert {"Macro", "Rates"} <= set(catalog.tags())
+        assert list(catalog.tags()) == sorted(catalog.tags())
+
+    def test_by_source_and_provider(self, catalog):
+        """Dataframes are indexed by each data source and provider."""
+        dataframe_ids = list(catalog.pipeline("multi_df").dataframes)
+        assert [df.id for df in catalog.dataframes_by_source("fred")] == dataframe_ids
+        assert [df.id for df in catalog.dataframes_by_source("BLS")] == [
+            dataframe_ids[1]
+        ]
+        assert [df.id for df in catalog.dataframes_by_provider("Federal Reserve")] == [
+            dataframe_ids[0]
+        ]
+
+    def test_indexes_are_built_on_first_query(self, pipeline_project):
+        """Building a catalog builds no index; each index is built once when queried."""
+        manifest = load_manifest(pipeline_project)
+        with patch("chartbook.model._group", wraps=model._group) as group:
+            catalog = Catalog.from_manifest(manifest)
+            assert group.call_count == 0
+            catalog.charts_by_tag("Chart Tag")
+            catalog.charts_by_tag("Other")
+            assert group.call_count == 1
+            assert catalog.dataframes_by_source("Test Source")
+            assert group.call_count == 2
+
+    def test_by_dataframe_and_pipeline(self, catalog):
+        """Charts and dataframes are listed per dataframe and per pipeline."""
+        dataframe_id = next(iter(catalog.pipeline("multi_df").dataframes))
+        charts = catalog.charts_by_dataframe("multi_df", dataframe_id)
+        assert len(charts) == 2
+        assert all(chart.dataframe_id == dataframe_id for chart in charts)
+        assert len(catalog.charts_by_pipeline("multi_df")) == 4
+        assert len(catalog.dataframes_by_pipeline("multi_df")) == 2
+        with pytest.raises(KeyError):
+            catalog.charts_by_dataframe("multi_df", "missing")
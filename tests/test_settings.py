@@ -0,0 +1,91 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from chartbook import settings
+
+
+@pytest.fixture
+def fresh_settings():
+    """Clears memoized settings before and after the test."""
+    settings.clear_settings_cache()
+    yield settings
+    settings.clear_settings_cache()
+
+
+class TestImportCost:
+    """Tests that importing chartbook does not resolve settings."""
+
+    def test_import_is_cheap(self, tmp_path):
+        """Importing chartbook should not probe the filesystem or load heavy modules.
+
+        The subprocess runs in a directory without project markers, where
+        resolving the project root would emit a warning, and turns warnings
+        into errors. Standard library modules that only some features need
+        (async loads, shared memory, concurrent loads) must be imported lazily
+        too, so they are checked only if the interpreter had not already
+        imported them at startup.
+        """
+        code = (
+            "import sys\n"
+            "lazy = {'asyncio', 'multiprocessing.shared_memory', 'concurrent.futures'}\n"
+            "lazy -= set(sys.modules)\n"
+            "import chartbook\n"
+            "heavy = {'decouple', 'pandas', 'polars', 'pyarrow'} & set(sys.modules)\n"
+            "assert not heavy, heavy\n"
+            "eager = lazy & set(sys.modules)\n"
+            "assert not eager, eager\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-W", "error", "-c", code],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            env={"PATH": "", "PYTHONPATH": ":".join(sys.path)},
+        )
+        assert result.returncode == 0, result.stderr
+
+
+class TestLazySettings:
+    """Tests for lazily resolved, memoized settings."""
+
+    def test_project_root_resolved_once(self, fresh_settings, monkeypatch, tmp_path):
+        """The project root should be searched for only on the first config() call."""
+        calls = []
+
+        def fake_find_project_root():
+            calls.append(1)
+            return tmp_path
+
+        monkeypatch.setattr(settings, "find_project_root", fake_find_project_root)
+        monkeypatch.delenv("DATA_DIR", raising=False)
+        monkeypatch.delenv("OUTPUT_DIR", raising=False)
+        assert calls == []
+        assert settings.config("DATA_DIR") == tmp_path.resolve() / "_data"
+        assert settings.config("OUTPUT_DIR") == tmp_path.resolve() / "_output"
+        assert len(calls) == 1
+
+    def test_cli_vars_take_precedence(self, fresh_settings, monkeypatch, tmp_path):
+        """Relative directory arguments should resolve against the project root."""
+        monkeypatch.setattr(settings, "find_project_root", lambda: tmp_path)
+        value = settings.config("DATA_DIR", cli_vars={"DATA_DIR": "elsewhere"})
+        assert value == tmp_path.resolve() / "elsewhere"
+
+    def test_module_attributes(self, fresh_settings):
+        """defaults, cli_vars and USER should still be available as module attributes."""
+        assert {"BASE_DIR", "DATA_DIR", "OUTPUT_DIR", "OS_TYPE"} <= set(
+            settings.defaults
+        )
+        assert isinstance(settings.cli_vars, dict)
+        assert isinstance(settings.USER, str)
+        assert isinstance(settings.defaults["BASE_DIR"], Path)
+
+    def test_missing_without_default_raises(self, fresh_settings):
+        """Unknown settings without a default should still raise."""
+        from decouple import UndefinedValueError
+
+        with pytest.raises(UndefinedValueError):
+            settings.config("CHARTBOOK_SETTING_THAT_DOES_NOT_EXIST")
+        assert settings.config("CHARTBOOK_SETTING_THAT_DOES_NOT_EXIST", default=3) == 3